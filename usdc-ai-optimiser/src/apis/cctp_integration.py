@@ -3,12 +3,17 @@
 
 import asyncio
 import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
 import json
 import os
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from web3 import Web3
+from web3.exceptions import TransactionNotFound
 from eth_account import Account
 import numpy as np
 from dotenv import load_dotenv
@@ -16,6 +21,10 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Blocking web3 calls run here instead of on the event loop; a dedicated pool so
+# receipt waits (up to minutes) don't starve the loop's default executor
+RPC_EXECUTOR = ThreadPoolExecutor(max_workers=32, thread_name_prefix="cctp-rpc")
+
 @dataclass
 class CCTPTransfer:
     """CCTP transfer data structure"""
@@ -42,11 +51,20 @@ class CCTPChainConfig:
     usdc_address: str
     gas_limit: int
     gas_price_gwei: float
+    checksum_usdc_address: str = field(init=False, repr=False)
+    checksum_token_messenger_address: str = field(init=False, repr=False)
+    checksum_message_transmitter_address: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Checksum once here instead of hashing the address on every contract call
+        self.checksum_usdc_address = Web3.to_checksum_address(self.usdc_address)
+        self.checksum_token_messenger_address = Web3.to_checksum_address(self.token_messenger_address)
+        self.checksum_message_transmitter_address = Web3.to_checksum_address(self.message_transmitter_address)
 
 class CCTPIntegration:
     """Circle's Cross-Chain Transfer Protocol integration"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         # Official CCTP contract addresses from Circle documentation
         self.chain_configs = {
             # Mainnet addresses
@@ -243,17 +261,91 @@ class CCTPIntegration:
         }
         
         self.web3_instances = {}
+        # Contract objects per (chain, contract), so ABIs are parsed once per chain
+        self.contract_instances: Dict[Tuple[str, str], object] = {}
+        
+        # Per (chain, sender) nonce lock and next locally assigned nonce, so
+        # concurrent transfers signed by one account never reuse a nonce
+        self._nonce_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._next_nonce: Dict[Tuple[str, str], int] = {}
+        
+        # Shared HTTP session for Circle attestation polling; a session passed
+        # in by the caller is reused and left open on close()
+        self._http_session: Optional[aiohttp.ClientSession] = session
+        self._owns_http_session = session is None
+        
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Get shared aiohttp session, creating it on first use"""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession()
+            self._owns_http_session = True
+        return self._http_session
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._owns_http_session and self._http_session and not self._http_session.closed:
+            await self._http_session.close()
         
     def _get_web3(self, chain: str) -> Web3:
         """Get Web3 instance for chain"""
         if chain not in self.web3_instances:
             config = self.chain_configs[chain]
-            self.web3_instances[chain] = Web3(Web3.HTTPProvider(config.rpc_url))
+            # Pooled keep-alive session so repeated RPCs skip the TCP/TLS handshake
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=64))
+            self.web3_instances[chain] = Web3(Web3.HTTPProvider(config.rpc_url, session=session))
         return self.web3_instances[chain]
     
+    def _get_contract(self, chain: str, contract: str):
+        """Get cached contract ('usdc', 'token_messenger' or 'message_transmitter') for chain"""
+        key = (chain, contract)
+        if key not in self.contract_instances:
+            config = self.chain_configs[chain]
+            self.contract_instances[key] = self._get_web3(chain).eth.contract(
+                address=getattr(config, f"checksum_{contract}_address"),
+                abi=getattr(self, f"{contract}_abi")
+            )
+        return self.contract_instances[key]
+
     def _get_domain(self, chain: str) -> int:
         """Get CCTP domain for chain"""
         return self.domain_mappings.get(chain, 0)
+
+    async def _run_rpc(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking web3 call on the RPC thread pool"""
+        return await asyncio.get_running_loop().run_in_executor(RPC_EXECUTOR, partial(fn, *args))
+
+    async def _transact(self, chain: str, account, contract_call, gas: int, gas_price: int) -> Tuple[Any, Any]:
+        """Build, sign and send contract_call from account on chain, then wait for its receipt
+
+        RPCs run on the RPC thread pool. The nonce fetch, signing and send
+        hold the (chain, sender) lock; only the receipt wait runs outside it.
+        Returns (tx_hash, receipt).
+        """
+        w3 = self._get_web3(chain)
+        key = (chain, account.address)
+        lock = self._nonce_locks.setdefault(key, asyncio.Lock())
+
+        def send(nonce: int):
+            tx = contract_call.build_transaction({
+                'from': account.address,
+                'gas': gas,
+                'gasPrice': gas_price,
+                'nonce': nonce
+            })
+            signed = account.sign_transaction(tx)
+            return w3.eth.send_raw_transaction(signed.raw_transaction)
+
+        async with lock:
+            # The pending count still lags a just-sent transaction on some RPCs,
+            # so never go below the next nonce this client handed out
+            chain_nonce = await self._run_rpc(w3.eth.get_transaction_count, account.address, 'pending')
+            nonce = max(chain_nonce, self._next_nonce.get(key, 0))
+            tx_hash = await self._run_rpc(send, nonce)
+            self._next_nonce[key] = nonce + 1
+
+        receipt = await self._run_rpc(w3.eth.wait_for_transaction_receipt, tx_hash)
+        return tx_hash, receipt
     
     async def initiate_cross_chain_transfer(
         self,
@@ -285,75 +377,57 @@ class CCTPIntegration:
             amount_wei = int(amount * 10**6)
             
             # Check USDC balance
-            usdc_contract = w3.eth.contract(
-                address=w3.to_checksum_address(config.usdc_address),
-                abi=self.usdc_abi
-            )
+            usdc_contract = self._get_contract(source_chain, "usdc")
             
-            balance = usdc_contract.functions.balanceOf(account.address).call()
+            balance = await self._run_rpc(usdc_contract.functions.balanceOf(account.address).call)
             if balance < amount_wei:
                 raise ValueError(f"Insufficient USDC balance: {balance/10**6} < {amount}")
             
             # Approve USDC spending
             print("   📝 Approving USDC spending...")
-            approve_tx = usdc_contract.functions.approve(
-                w3.to_checksum_address(config.token_messenger_address),
-                amount_wei
-            ).build_transaction({
-                'from': account.address,
-                'gas': config.gas_limit,
-                'gasPrice': w3.to_wei(config.gas_price_gwei, 'gwei'),
-                'nonce': w3.eth.get_transaction_count(account.address)
-            })
-            
-            signed_approve = account.sign_transaction(approve_tx)
-            approve_tx_hash = w3.eth.send_raw_transaction(signed_approve.raw_transaction)
+            approve_tx_hash, receipt = await self._transact(
+                source_chain,
+                account,
+                usdc_contract.functions.approve(config.checksum_token_messenger_address, amount_wei),
+                config.gas_limit,
+                w3.to_wei(config.gas_price_gwei, 'gwei')
+            )
             print(f"   ✅ Approval tx: {approve_tx_hash.hex()}")
-
-            # Wait for approval confirmation
-            receipt = w3.eth.wait_for_transaction_receipt(approve_tx_hash)
             print(f"   ✅ Approval confirmed in block {receipt.blockNumber}")
             
             # Initiate burn
             print("   🔥 Initiating USDC burn...")
-            token_messenger = w3.eth.contract(
-                address=w3.to_checksum_address(config.token_messenger_address),
-                abi=self.token_messenger_abi
-            )
+            token_messenger = self._get_contract(source_chain, "token_messenger")
             
             destination_domain = self._get_domain(destination_chain)
             # Convert recipient address to bytes32 format (pad with zeros)
             recipient_bytes32 = "0x" + "0" * 24 + recipient[2:]  # Remove 0x and pad with 24 zeros
             
-            # Get current gas price and increase nonce
-            current_nonce = w3.eth.get_transaction_count(account.address)
-            gas_price = max(w3.eth.gas_price, w3.to_wei(config.gas_price_gwei, 'gwei'))
+            # Current gas price, floored at the configured price
+            network_gas_price = await self._run_rpc(lambda: w3.eth.gas_price)
+            gas_price = max(network_gas_price, w3.to_wei(config.gas_price_gwei, 'gwei'))
 
             # Circle CCTP V2 parameters (from official implementation)
             hook_data = "0x" + "0" * 64  # Empty bytes32
             max_fee = amount_wei - 1  # Slightly less than burn amount
             finality_threshold = 2000  # Standard transfer (1000 for fast)
 
-            burn_tx = token_messenger.functions.depositForBurn(
-                amount_wei,
-                destination_domain,
-                recipient_bytes32,
-                w3.to_checksum_address(config.usdc_address),
-                hook_data,
-                max_fee,
-                finality_threshold
-            ).build_transaction({
-                'from': account.address,
-                'gas': config.gas_limit,
-                'gasPrice': gas_price,
-                'nonce': current_nonce
-            })
-            
-            signed_burn = account.sign_transaction(burn_tx)
-            burn_tx_hash = w3.eth.send_raw_transaction(signed_burn.raw_transaction)
-            
-            # Wait for transaction confirmation
-            receipt = w3.eth.wait_for_transaction_receipt(burn_tx_hash)
+            # Send the burn and wait for confirmation
+            burn_tx_hash, receipt = await self._transact(
+                source_chain,
+                account,
+                token_messenger.functions.depositForBurn(
+                    amount_wei,
+                    destination_domain,
+                    recipient_bytes32,
+                    config.checksum_usdc_address,
+                    hook_data,
+                    max_fee,
+                    finality_threshold
+                ),
+                config.gas_limit,
+                gas_price
+            )
 
             # Check if transaction succeeded
             if receipt.status != 1:
@@ -457,27 +531,17 @@ class CCTPIntegration:
             
             # Mint USDC on destination chain
             print("   🪙 Minting USDC on destination chain...")
-            message_transmitter = w3.eth.contract(
-                address=w3.to_checksum_address(config.message_transmitter_address),
-                abi=self.message_transmitter_abi
+            message_transmitter = self._get_contract(transfer.destination_chain, "message_transmitter")
+            
+            # Send the mint and wait for confirmation
+            mint_tx_hash, receipt = await self._transact(
+                transfer.destination_chain,
+                account,
+                message_transmitter.functions.receiveMessage(message, attestation),
+                config.gas_limit,
+                w3.to_wei(config.gas_price_gwei, 'gwei')
             )
             
-            mint_tx = message_transmitter.functions.receiveMessage(
-                message,
-                attestation
-            ).build_transaction({
-                'from': account.address,
-                'gas': config.gas_limit,
-                'gasPrice': w3.to_wei(config.gas_price_gwei, 'gwei'),
-                'nonce': w3.eth.get_transaction_count(account.address)
-            })
-            
-            signed_mint = account.sign_transaction(mint_tx)
-            mint_tx_hash = w3.eth.send_raw_transaction(signed_mint.raw_transaction)
-            
-            # Wait for transaction confirmation
-            receipt = w3.eth.wait_for_transaction_receipt(mint_tx_hash)
-            
             print(f"   ✅ Mint tx: {mint_tx_hash.hex()}")
             print(f"   ⛽ Gas used: {receipt.gasUsed}")
             
@@ -505,8 +569,8 @@ class CCTPIntegration:
             # Get transaction receipt to extract nonce from logs
             source_config = next(cfg for cfg in self.chain_configs.values()
                                 if self._get_domain(cfg.name.lower().replace(' ', '_')) == source_domain)
-            w3 = Web3(Web3.HTTPProvider(source_config.rpc_url))
-            receipt = w3.eth.get_transaction_receipt(burn_tx_hash)
+            w3 = self._get_web3(source_config.name.lower().replace(' ', '_'))
+            receipt = await self._run_rpc(w3.eth.get_transaction_receipt, burn_tx_hash)
 
             # Extract nonce from transaction logs
             nonce = 0
@@ -525,25 +589,26 @@ class CCTPIntegration:
             max_attempts = 30  # Wait up to 5 minutes
             attempt = 0
             
+            session = self._get_http_session()
+            
             while attempt < max_attempts:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url) as response:
-                        if response.status == 200:
-                            data = await response.json()
-
-                            # Check if attestation is ready
-                            if data.get('status') == 'complete':
-                                print(f"   ✅ Attestation ready!")
-                                return data
-                            else:
-                                status = data.get('status', 'pending')
-                                print(f"   ⏳ Attestation status: {status}, waiting...")
-                        elif response.status == 404:
-                            print(f"   ⏳ Transaction not found yet, attempt {attempt + 1}/{max_attempts}")
+                async with session.get(url) as response:
+                    if response.status == 200:
+                        data = await response.json()
+
+                        # Check if attestation is ready
+                        if data.get('status') == 'complete':
+                            print(f"   ✅ Attestation ready!")
+                            return data
                         else:
-                            print(f"   ⚠️ API error: {response.status}")
-                            text = await response.text()
-                            print(f"      Error details: {text}")
+                            status = data.get('status', 'pending')
+                            print(f"   ⏳ Attestation status: {status}, waiting...")
+                    elif response.status == 404:
+                        print(f"   ⏳ Transaction not found yet, attempt {attempt + 1}/{max_attempts}")
+                    else:
+                        print(f"   ⚠️ API error: {response.status}")
+                        text = await response.text()
+                        print(f"      Error details: {text}")
 
                 attempt += 1
                 if attempt < max_attempts:
@@ -634,27 +699,17 @@ async def complete_cross_chain_transfer(
         
         # Mint USDC on destination chain
         print("   🪙 Minting USDC on destination chain...")
-        message_transmitter = w3.eth.contract(
-            address=w3.to_checksum_address(config.message_transmitter_address),
-            abi=self.message_transmitter_abi
+        message_transmitter = self._get_contract(transfer.destination_chain, "message_transmitter")
+        
+        # Send the mint and wait for confirmation
+        mint_tx_hash, receipt = await self._transact(
+            transfer.destination_chain,
+            account,
+            message_transmitter.functions.receiveMessage(message, attestation),
+            config.gas_limit,
+            w3.to_wei(config.gas_price_gwei, 'gwei')
         )
         
-        mint_tx = message_transmitter.functions.receiveMessage(
-            message,
-            attestation
-        ).build_transaction({
-            'from': account.address,
-            'gas': config.gas_limit,
-            'gasPrice': w3.to_wei(config.gas_price_gwei, 'gwei'),
-            'nonce': w3.eth.get_transaction_count(account.address)
-        })
-        
-        signed_mint = account.sign_transaction(mint_tx)
-        mint_tx_hash = w3.eth.send_raw_transaction(signed_mint.raw_transaction)
-        
-        # Wait for transaction confirmation
-        receipt = w3.eth.wait_for_transaction_receipt(mint_tx_hash)
-        
         print(f"   ✅ Mint tx: {mint_tx_hash.hex()}")
         print(f"   ⛽ Gas used: {receipt.gasUsed}")
         
@@ -672,6 +727,15 @@ async def complete_cross_chain_transfer(
         raise
 
     
+    async def is_indexed(self, transfer: CCTPTransfer) -> bool:
+        """Whether the burn transaction's receipt is available on the source chain RPC"""
+        w3 = self._get_web3(transfer.source_chain)
+        try:
+            await self._run_rpc(w3.eth.get_transaction_receipt, transfer.burn_tx_hash)
+            return True
+        except TransactionNotFound:
+            return False
+
     async def get_transfer_status(self, transfer: CCTPTransfer) -> str:
         """Get current status of a CCTP transfer"""
         
@@ -4,7 +4,7 @@
 import aiohttp
 import asyncio
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Optional
 from ...config import config
 from ...data.models import USDCOpportunity
 from datetime import datetime
@@ -12,16 +12,21 @@ from datetime import datetime
 class DeFiLlamaAPI:
     """DeFiLlama yield data fetcher"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.base_url = config.DEFILLAMA_URL
-        self.session = None
+        self._shared_session = session
+        self.session = session
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self._shared_session is None or self._shared_session.closed:
+            self.session = aiohttp.ClientSession()
+        else:
+            self.session = self._shared_session
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        # A shared session belongs to the caller and stays open
+        if self.session and self.session is not self._shared_session:
             await self.session.close()
     
     async def fetch_usdc_opportunities(self) -> List[USDCOpportunity]:
@@ -71,7 +71,7 @@ class ContractAnalysis:
 class GraphIntegration:
     """The Graph integration for comprehensive DeFi data"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, session: Optional[aiohttp.ClientSession] = None):
         # Load API key from environment if not provided
         self.api_key = api_key or os.getenv('GRAPH_API_KEY') or os.getenv('Graph_API_KEY')
         self.api_token = os.getenv('GRAPH_API_TOKEN') or os.getenv('Graph_API_TOKEN')
@@ -83,7 +83,8 @@ class GraphIntegration:
             # Fallback to public endpoints (limited queries)
             self.base_url = "https://api.studio.thegraph.com/query"
 
-        self.session = None
+        self._shared_session = session
+        self.session = session
 
         # Real working subgraph IDs from The Graph Network (2024/2025)
         self.subgraphs = {
@@ -127,11 +128,15 @@ class GraphIntegration:
         
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self._shared_session is None or self._shared_session.closed:
+            self.session = aiohttp.ClientSession()
+        else:
+            self.session = self._shared_session
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        # A shared session belongs to the caller and stays open
+        if self.session and self.session is not self._shared_session:
             await self.session.close()
     
     async def get_live_token_prices(self, tokens: List[str], chain: str = "ethereum") -> Dict[str, GraphTokenData]:
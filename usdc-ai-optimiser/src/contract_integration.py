@@ -5,7 +5,7 @@ Handles interaction with deployed CrossYield smart contracts
 
 import json
 import os
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Final, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from web3 import Web3
 from eth_account import Account
@@ -66,6 +66,40 @@ CHAIN_CONFIGS = {
     }
 }
 
+# Chains scanned for wallet balances and health, in CHAIN_CONFIGS order
+SUPPORTED_CHAINS: Final[Tuple[str, ...]] = tuple(CHAIN_CONFIGS)
+
+# Multicall3 is deployed at the same address on every supported chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"}
+                ],
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"}
+                ],
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
 @dataclass
 class SmartWalletInfo:
     """Smart wallet information"""
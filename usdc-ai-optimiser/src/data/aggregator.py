@@ -3,7 +3,8 @@
 
 import asyncio
 import time
-from typing import List
+from typing import Dict, List, Optional, Tuple
+import aiohttp
 from datetime import datetime
 # Removed relative imports as they don't work in this context
 from src.apis.defillama.defillama import DeFiLlamaAPI
@@ -16,8 +17,8 @@ from src.utils.logger import (
 class USDCDataAggregator:
     """Main USDC data aggregation system"""
     
-    def __init__(self):
-        self.defillama = DeFiLlamaAPI()
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        self.defillama = DeFiLlamaAPI(session)
         
     async def fetch_all_opportunities(self) -> List[USDCOpportunity]:
         """Fetch opportunities from all sources"""
@@ -85,9 +86,18 @@ class USDCDataAggregator:
 class YieldDataAggregator:
     """Enhanced yield data aggregator for the new architecture"""
 
-    def __init__(self):
-        self.defillama = DeFiLlamaAPI()
-        self.usdc_aggregator = USDCDataAggregator()
+    def __init__(self, cache_ttl: float = 60.0, session: Optional[aiohttp.ClientSession] = None):
+        self.defillama = DeFiLlamaAPI(session)
+        self.usdc_aggregator = USDCDataAggregator(session)
+
+        # Per-strategy results cached for cache_ttl seconds; a per-strategy
+        # lock makes concurrent misses share one upstream fetch
+        self.cache_ttl = cache_ttl
+        self._opportunity_cache: Dict[str, Tuple[float, List[YieldOpportunity]]] = {}
+        self._cache_locks: Dict[str, asyncio.Lock] = {}
+        # The unfiltered feed, fetched once per TTL and partitioned per strategy
+        self._all_opportunities: Optional[Tuple[float, List[YieldOpportunity]]] = None
+        self._all_opportunities_lock = asyncio.Lock()
 
         # Supported protocols configuration
         self.supported_protocols = {
@@ -130,47 +140,95 @@ class YieldDataAggregator:
         }
 
     async def get_yield_opportunities(self, strategy: str = "balanced") -> List[YieldOpportunity]:
-        """Get yield opportunities filtered by strategy"""
+        """Get yield opportunities filtered by strategy, cached for cache_ttl seconds"""
+
+        cached = self._opportunity_cache.get(strategy)
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return list(cached[1])
+
+        async with self._cache_locks.setdefault(strategy, asyncio.Lock()):
+            # Another request may have refreshed the entry while we waited
+            cached = self._opportunity_cache.get(strategy)
+            if cached and time.monotonic() - cached[0] < self.cache_ttl:
+                return list(cached[1])
+
+            result = await self._generate_yield_opportunities(strategy)
+            self._opportunity_cache[strategy] = (time.monotonic(), result)
+            return list(result)
+
+    async def get_all_yield_opportunities(self) -> List[YieldOpportunity]:
+        """Get every opportunity from the upstream feed, cached for cache_ttl seconds"""
+
+        cached = self._all_opportunities
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return list(cached[1])
+
+        async with self._all_opportunities_lock:
+            cached = self._all_opportunities
+            if cached and time.monotonic() - cached[0] < self.cache_ttl:
+                return list(cached[1])
+
+            opportunities = await self._fetch_all_opportunities()
+            self._all_opportunities = (time.monotonic(), opportunities)
+            return list(opportunities)
+
+    def invalidate_cache(self, strategy: Optional[str] = None):
+        """Drop cached opportunities for strategy, or for every strategy and the feed"""
+        if strategy is None:
+            self._opportunity_cache.clear()
+            self._all_opportunities = None
+        else:
+            self._opportunity_cache.pop(strategy, None)
+
+    async def _fetch_all_opportunities(self) -> List[YieldOpportunity]:
+        """Fetch the full opportunity set from DefiLlama, or the hardcoded list as fallback"""
+
+        # Try to get real opportunities from DefiLlama, fallback to hardcoded if needed
+        try:
+            usdc_opportunities = await self.usdc_aggregator.fetch_all_opportunities()
+        except Exception as e:
+            print(f"⚠️ DefiLlama fetch failed, using hardcoded data: {e}")
+            usdc_opportunities = []
+
+        # If no real data, use hardcoded protocols (expanded list)
+        if not usdc_opportunities:
+            opportunities = self._get_expanded_hardcoded_opportunities()
+        else:
+            # Convert USDCOpportunity to YieldOpportunity
+            opportunities = []
+            for opp in usdc_opportunities:
+                risk_score = self._calculate_risk_score_from_opportunity(opp)
+
+                opportunity = YieldOpportunity(
+                    protocol=opp.protocol,
+                    chain=opp.chain,
+                    apy=opp.apy,
+                    tvl=opp.tvl,
+                    riskScore=risk_score,
+                    category=opp.category,
+                    minDeposit=1000000  # 1 USDC in wei
+                )
+
+                opportunities.append(opportunity)
+
+        # Count unique chains from actual data
+        unique_chains = len(set(opp.chain for opp in opportunities))
+
+        log_performance_metrics({
+            "total_protocols": len(opportunities),
+            "chains_covered": unique_chains
+        })
+        return opportunities
+
+    async def _generate_yield_opportunities(self, strategy: str) -> List[YieldOpportunity]:
+        """Fetch and filter yield opportunities for strategy"""
 
         start_time = time.time()
         log_ai_start("Yield Opportunity Generation", {"strategy": strategy})
 
         try:
-            # Try to get real opportunities from DefiLlama, fallback to hardcoded if needed
-            try:
-                usdc_opportunities = await self.usdc_aggregator.fetch_all_opportunities()
-            except Exception as e:
-                print(f"⚠️ DefiLlama fetch failed, using hardcoded data: {e}")
-                usdc_opportunities = []
-            
-            # If no real data, use hardcoded protocols (expanded list)
-            if not usdc_opportunities:
-                opportunities = self._get_expanded_hardcoded_opportunities()
-            else:
-                # Convert USDCOpportunity to YieldOpportunity
-                opportunities = []
-                for opp in usdc_opportunities:
-                    risk_score = self._calculate_risk_score_from_opportunity(opp)
-                    
-                    opportunity = YieldOpportunity(
-                        protocol=opp.protocol,
-                        chain=opp.chain,
-                        apy=opp.apy,
-                        tvl=opp.tvl,
-                        riskScore=risk_score,
-                        category=opp.category,
-                        minDeposit=1000000  # 1 USDC in wei
-                    )
-                    
-                    opportunities.append(opportunity)
-
-            # Count unique chains from actual data
-            unique_chains = len(set(opp.chain for opp in opportunities))
-            
-            log_performance_metrics({
-                "total_protocols": len(opportunities),
-                "chains_covered": unique_chains
-            })
+            # One upstream fetch shared by every strategy
+            opportunities = await self.get_all_yield_opportunities()
 
             # Filter by strategy
             filtered_opportunities = self._filter_by_strategy(opportunities, strategy)
@@ -2,6 +2,7 @@
 """Data models for USDC opportunities"""
 
 from pydantic import BaseModel, Field
+from pydantic.dataclasses import dataclass
 from typing import Optional, Dict, List
 from datetime import datetime
 
@@ -69,8 +70,13 @@ class ProtocolInfo(BaseModel):
     adapter_address: Optional[str] = None
     is_active: bool = True
 
-class YieldOpportunity(BaseModel):
-    """Yield opportunity model"""
+@dataclass(slots=True, frozen=True)
+class YieldOpportunity:
+    """Yield opportunity model
+
+    A validated slotted dataclass rather than a BaseModel: strategy scoring
+    reads these fields in tight loops, and instances are never mutated.
+    """
     protocol: str
     chain: str
     apy: float
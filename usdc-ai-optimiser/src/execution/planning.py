@@ -0,0 +1,77 @@
+# src/execution/planning.py
+"""Array kernels for rebalance planning, JIT-compiled with Numba"""
+
+from typing import Tuple
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True)
+def plan_transfers_nb(surplus: np.ndarray, min_amount: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Plan cross-chain transfers for one portfolio
+
+    surplus holds current minus target balance per chain index. Donor
+    chains (largest surplus first) are matched against receiver chains
+    (largest deficit first) with a two-pointer sweep, which settles the
+    portfolio in at most n_donors + n_receivers - 1 transfers. Transfers
+    below min_amount are dropped. Returns (src_idx, dst_idx, amount).
+    """
+    n_chains = surplus.shape[0]
+    remaining = surplus.copy()
+    donors = np.argsort(-surplus)
+    receivers = np.argsort(surplus)
+    n_donors = np.sum(surplus > 0)
+    n_receivers = np.sum(surplus < 0)
+
+    src_idx = np.empty(n_chains, dtype=np.int64)
+    dst_idx = np.empty(n_chains, dtype=np.int64)
+    amount = np.empty(n_chains, dtype=np.float64)
+    count = 0
+
+    i = 0
+    j = 0
+    while i < n_donors and j < n_receivers:
+        src = donors[i]
+        dst = receivers[j]
+        transfer = min(remaining[src], -remaining[dst])
+        if transfer >= min_amount:
+            src_idx[count] = src
+            dst_idx[count] = dst
+            amount[count] = transfer
+            count += 1
+        remaining[src] -= transfer
+        remaining[dst] += transfer
+        if remaining[src] <= 0:
+            i += 1
+        if remaining[dst] >= 0:
+            j += 1
+
+    return src_idx[:count], dst_idx[:count], amount[:count]
+
+
+@njit(cache=True, parallel=True)
+def plan_transfers_batch_nb(
+    surplus: np.ndarray,
+    min_amount: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Plan transfers for many portfolios sharing one chain layout
+
+    surplus has shape (n_users, n_chains). Row u of the returned
+    (src_idx, dst_idx, amount) arrays lists that user's transfers, padded
+    with src_idx -1.
+    """
+    n_users, n_chains = surplus.shape
+    src_idx = np.full((n_users, n_chains), -1, dtype=np.int64)
+    dst_idx = np.full((n_users, n_chains), -1, dtype=np.int64)
+    amount = np.zeros((n_users, n_chains), dtype=np.float64)
+
+    for u in prange(n_users):
+        sources, destinations, amounts = plan_transfers_nb(surplus[u], min_amount)
+        for k in range(sources.shape[0]):
+            src_idx[u, k] = sources[k]
+            dst_idx[u, k] = destinations[k]
+            amount[u, k] = amounts[k]
+
+    return src_idx, dst_idx, amount
+
@@ -3,24 +3,125 @@
 
 import asyncio
 import json
+import logging
 import os
-from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+from types import MappingProxyType
 from datetime import datetime, timedelta
-from dataclasses import dataclass
-from web3 import Web3
+from dataclasses import dataclass, replace
+from functools import cached_property
+import aiohttp
+from web3 import Web3, AsyncWeb3, AsyncHTTPProvider
+from web3.contract import Contract
 from eth_account import Account
-import pandas as pd
 import numpy as np
 from dotenv import load_dotenv
 
+from ..utils.logger import get_queued_logger
+from .planning import plan_transfers_nb, plan_transfers_batch_nb
+
 # Import our smart wallet integrations
-from ..contract_integration import contract_manager
+from ..contract_integration import contract_manager, SUPPORTED_CHAINS, MULTICALL3_ADDRESS, MULTICALL3_ABI
 from ..smart_wallet_cctp import smart_wallet_cctp
 
 # Load environment variables
 load_dotenv()
 
-@dataclass
+logger = get_queued_logger(__name__)
+
+# ERC20 balanceOf(address) selector
+BALANCE_OF_SELECTOR = bytes.fromhex("70a08231")
+
+def encode_balance_of(address: str) -> bytes:
+    """Build balanceOf calldata: selector followed by the left-padded address"""
+    return BALANCE_OF_SELECTOR + bytes(12) + bytes.fromhex(address[2:])
+
+# Fallback target allocations per strategy (read-only, shared by every call)
+_CONSERVATIVE_TARGETS = (
+    MappingProxyType({
+        'protocol': 'aave_v3',
+        'chain': 'ethereum_sepolia',
+        'target_apy': 0.04,
+        'risk_score': 0.1,
+        'allocation_percentage': 50
+    }),
+    MappingProxyType({
+        'protocol': 'aave_v3',
+        'chain': 'base_sepolia',
+        'target_apy': 0.035,
+        'risk_score': 0.15,
+        'allocation_percentage': 30
+    }),
+    MappingProxyType({
+        'protocol': 'curve',
+        'chain': 'arbitrum_sepolia',
+        'target_apy': 0.03,
+        'risk_score': 0.1,
+        'allocation_percentage': 20
+    })
+)
+
+_BALANCED_TARGETS = (
+    MappingProxyType({
+        'protocol': 'aave_v3',
+        'chain': 'ethereum_sepolia',
+        'target_apy': 0.06,
+        'risk_score': 0.2,
+        'allocation_percentage': 40
+    }),
+    MappingProxyType({
+        'protocol': 'uniswap_v3',
+        'chain': 'base_sepolia',
+        'target_apy': 0.10,
+        'risk_score': 0.3,
+        'allocation_percentage': 35
+    }),
+    MappingProxyType({
+        'protocol': 'aerodrome',
+        'chain': 'arbitrum_sepolia',
+        'target_apy': 0.12,
+        'risk_score': 0.35,
+        'allocation_percentage': 25
+    })
+)
+
+_AGGRESSIVE_TARGETS = (
+    MappingProxyType({
+        'protocol': 'aerodrome',
+        'chain': 'arbitrum_sepolia',
+        'target_apy': 0.15,
+        'risk_score': 0.4,
+        'allocation_percentage': 50
+    }),
+    MappingProxyType({
+        'protocol': 'uniswap_v3',
+        'chain': 'base_sepolia',
+        'target_apy': 0.12,
+        'risk_score': 0.35,
+        'allocation_percentage': 35
+    }),
+    MappingProxyType({
+        'protocol': 'aave_v3',
+        'chain': 'ethereum_sepolia',
+        'target_apy': 0.08,
+        'risk_score': 0.25,
+        'allocation_percentage': 15
+    })
+)
+
+@dataclass(slots=True, frozen=True)
+class PortfolioPosition:
+    """Position held by the rebalancer's own account"""
+    protocol: str
+    chain: str
+    pool_address: str
+    amount_usdc: float
+    apy: float
+    risk_score: float
+    last_updated: datetime
+
+@dataclass(slots=True, frozen=True)
 class UserPortfolioPosition:
     """Individual user portfolio position data"""
     user_address: str
@@ -33,7 +134,7 @@ class UserPortfolioPosition:
     risk_score: float
     last_updated: datetime
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RebalanceAction:
     """Rebalance action to be executed"""
     action_type: str  # "deposit", "withdraw", "cross_chain_transfer"
@@ -48,243 +149,390 @@ class RebalanceAction:
 class USDAIRebalancer:
     """USDC AI Optimizer Rebalancer"""
 
-    def __init__(self):
+    def __init__(self, http_session: Optional[aiohttp.ClientSession] = None):
         self.private_key = os.getenv('PRIVATE_KEY')
         if not self.private_key:
             raise ValueError("PRIVATE_KEY not found in environment variables")
 
         self.account = Account.from_key(self.private_key)
 
-        # Import our modules
+        # Caller-owned aiohttp session shared with the HTTP sub-clients
+        self._http_session = http_session
+        self._balance_of_calldata = encode_balance_of(self.account.address)
+
+        # Rebalancing parameters
+        self.rebalance_threshold = 0.05  # 5% deviation triggers rebalance
+        self.min_transfer_amount = 10.0  # Minimum $10 USDC for transfers
+        self.max_gas_cost_percentage = 0.02  # Max 2% of transfer in gas costs
+
+        # Portfolio snapshot reuse and backoff for portfolios below the minimum
+        self.snapshot_ttl = timedelta(seconds=30)
+        self.max_skip_backoff = timedelta(minutes=10)
+        self._last_snapshot: Optional[Tuple[datetime, List[PortfolioPosition], float]] = None
+        self._skip_backoff = timedelta(0)
+        self._skip_until: Optional[datetime] = None
+
+        # Native async Web3 clients, one per chain
+        self._async_providers: Dict[str, AsyncWeb3] = {}
+
+        # Multicall3 contract per chain (USDC contracts are cached by the CCTP client)
+        self._multicall_by_chain: Dict[str, Contract] = {}
+
+    # Sub-clients are built on first use so callers only pay for the
+    # subsystems their action touches
+
+    @cached_property
+    def graph(self):
         from ..apis.graph_integration import GraphIntegration
+        return GraphIntegration(session=self._http_session)
+
+    @cached_property
+    def cctp(self):
         from ..apis.cctp_integration import CCTPIntegration
+        return CCTPIntegration(session=self._http_session)
+
+    @cached_property
+    def aggregator(self):
         from ..data.enhanced_aggregator import EnhancedUSDCDataAggregator
+        return EnhancedUSDCDataAggregator()
+
+    @cached_property
+    def investor(self):
         from ..protocols.protocol_investor import ProtocolInvestor
+        return ProtocolInvestor()
 
-        self.graph = GraphIntegration()
-        self.cctp = CCTPIntegration()
-        self.aggregator = EnhancedUSDCDataAggregator()
-        self.investor = ProtocolInvestor()
+    def _get_web3(self, chain: str) -> Web3:
+        """Get pooled keep-alive Web3 client for chain, shared with the CCTP client"""
+        return self.cctp._get_web3(chain)
 
-        # Rebalancing parameters
-        self.rebalance_threshold = 0.05  # 5% deviation triggers rebalance
-        self.min_transfer_amount = 10.0  # Minimum $10 USDC for transfers
-        self.max_gas_cost_percentage = 0.02  # Max 2% of transfer in gas costs
+    def _get_contract(self, chain: str) -> Contract:
+        """Get cached USDC contract for chain, shared with the CCTP client"""
+        return self.cctp._get_contract(chain, "usdc")
+
+    def _get_multicall(self, chain: str) -> Contract:
+        """Get cached Multicall3 contract for chain"""
+        if chain not in self._multicall_by_chain:
+            self._multicall_by_chain[chain] = self._get_web3(chain).eth.contract(
+                address=MULTICALL3_ADDRESS,
+                abi=MULTICALL3_ABI
+            )
+        return self._multicall_by_chain[chain]
+
+    def _get_async_web3(self, chain: str) -> AsyncWeb3:
+        """Get cached native async Web3 client for chain"""
+        if chain not in self._async_providers:
+            config = self.cctp.chain_configs[chain]
+            self._async_providers[chain] = AsyncWeb3(AsyncHTTPProvider(config.rpc_url))
+        return self._async_providers[chain]
+
+    async def close(self):
+        """Close async provider sessions and the CCTP HTTP sessions"""
+        for w3 in self._async_providers.values():
+            await w3.provider.disconnect()
+        self._async_providers.clear()
+        if 'cctp' in self.__dict__:
+            await self.cctp.close()
+        if 'investor' in self.__dict__:
+            await self.investor.close()
 
-    async def get_current_portfolio(self) -> List[PortfolioPosition]:
+    async def get_current_portfolio(self, tick_ts: Optional[datetime] = None) -> List[PortfolioPosition]:
         """Get current portfolio positions across all chains"""
 
-        print("Scanning current portfolio positions...")
+        logger.info("Scanning current portfolio positions")
+
+        tick_ts = tick_ts or datetime.now()
+
+        # Scan all chains concurrently
+        results = await asyncio.gather(
+            *[self._fetch_chain_balance(chain, tick_ts) for chain in SUPPORTED_CHAINS],
+            return_exceptions=True
+        )
 
         positions = []
+        for chain, result in zip(SUPPORTED_CHAINS, results):
+            if isinstance(result, Exception):
+                logger.warning("chain=%s balance check failed: %s", chain, result)
+            elif result is not None:
+                positions.append(result)
 
-        # Supported chains for rebalancing
-        chains = ["ethereum_sepolia", "base_sepolia", "arbitrum_sepolia"]
+        return positions
 
-        for chain in chains:
-            try:
-                config = self.cctp.chain_configs[chain]
-                w3 = Web3(Web3.HTTPProvider(config.rpc_url))
+    async def _fetch_chain_balance(self, chain: str, tick_ts: datetime) -> Optional[PortfolioPosition]:
+        """Read the wallet USDC balance on one chain"""
+        config = self.cctp.chain_configs[chain]
 
-                # Check USDC balance
-                usdc_contract = w3.eth.contract(
-                    address=w3.to_checksum_address(config.usdc_address),
-                    abi=self.cctp.usdc_abi
-                )
+        # Check USDC balance with precomputed calldata
+        w3 = self._get_async_web3(chain)
+        result = await w3.eth.call({'to': config.checksum_usdc_address, 'data': self._balance_of_calldata})
+        balance_usdc = int.from_bytes(result, 'big') / 10**6
 
-                balance_wei = usdc_contract.functions.balanceOf(self.account.address).call()
-                balance_usdc = balance_wei / 10**6
+        logger.debug("chain=%s balance=%.2f USDC", chain, balance_usdc)
+
+        if balance_usdc <= 0.01:  # Only include meaningful balances
+            return None
+
+        return PortfolioPosition(
+            protocol="wallet",
+            chain=chain,
+            pool_address=config.usdc_address,
+            amount_usdc=balance_usdc,
+            apy=0.0,
+            risk_score=0.0,
+            last_updated=tick_ts
+        )
+
+    async def batch_get_portfolios(
+        self,
+        user_addresses: List[str],
+        tick_ts: Optional[datetime] = None
+    ) -> Dict[str, List[UserPortfolioPosition]]:
+        """Get wallet USDC positions for many users with one RPC per chain"""
+
+        logger.info("Scanning portfolios for %d users", len(user_addresses))
+
+        users = [Web3.to_checksum_address(addr) for addr in user_addresses]
+        portfolios: Dict[str, List[UserPortfolioPosition]] = {user: [] for user in users}
 
+        chain_balances = await asyncio.gather(
+            *[asyncio.to_thread(self._batch_balances, chain, users) for chain in SUPPORTED_CHAINS],
+            return_exceptions=True
+        )
+
+        tick_ts = tick_ts or datetime.now()
+        for chain, balances in zip(SUPPORTED_CHAINS, chain_balances):
+            if isinstance(balances, Exception):
+                logger.warning("chain=%s batch balance check failed: %s", chain, balances)
+                continue
+
+            usdc_address = self.cctp.chain_configs[chain].usdc_address
+            for user, balance_wei in zip(users, balances):
+                balance_usdc = balance_wei / 10**6
                 if balance_usdc > 0.01:  # Only include meaningful balances
-                    position = PortfolioPosition(
+                    portfolios[user].append(UserPortfolioPosition(
+                        user_address=user,
+                        smart_wallet_address=user,
                         protocol="wallet",
                         chain=chain,
-                        pool_address=config.usdc_address,
+                        pool_address=usdc_address,
                         amount_usdc=balance_usdc,
                         apy=0.0,
                         risk_score=0.0,
-                        last_updated=datetime.now()
-                    )
-                    positions.append(position)
+                        last_updated=tick_ts
+                    ))
 
-                print(f"   {chain}: {balance_usdc:.2f} USDC")
+        return portfolios
 
-            except Exception as e:
-                print(f"   Error checking {chain}: {e}")
+    def _batch_balances(self, chain: str, users: List[str]) -> List[int]:
+        """Read USDC balanceOf for every user on chain in a single request"""
+        w3 = self._get_web3(chain)
+        usdc_contract = self._get_contract(chain)
 
-        return positions
+        try:
+            multicall = self._get_multicall(chain)
+            calls = [
+                (usdc_contract.address, True, encode_balance_of(user))
+                for user in users
+            ]
+            results = multicall.functions.aggregate3(calls).call()
+            return [
+                int.from_bytes(data, "big") if success and len(data) == 32 else 0
+                for success, data in results
+            ]
+        except Exception as e:
+            # No Multicall3 on this chain - send the calls as one JSON-RPC batch
+            logger.debug("chain=%s multicall unavailable, using JSON-RPC batch: %s", chain, e)
+            with w3.batch_requests() as batch:
+                for user in users:
+                    batch.add(usdc_contract.functions.balanceOf(user))
+                return list(batch.execute())
 
-    async def get_optimization_targets(self, strategy: str = "balanced") -> List[Dict]:
+    def get_optimization_targets(self, strategy: str = "balanced") -> Tuple[Mapping, ...]:
         """Get optimal target allocations"""
 
-        print(f"Getting optimization targets for {strategy} strategy...")
+        logger.info("Getting optimization targets strategy=%s", strategy)
 
         # Fallback targets for testing
         if strategy == "conservative":
-            return [
-                {
-                    'protocol': 'aave_v3',
-                    'chain': 'ethereum_sepolia',
-                    'target_apy': 0.04,
-                    'risk_score': 0.1,
-                    'allocation_percentage': 50
-                },
-                {
-                    'protocol': 'aave_v3',
-                    'chain': 'base_sepolia',
-                    'target_apy': 0.035,
-                    'risk_score': 0.15,
-                    'allocation_percentage': 30
-                },
-                {
-                    'protocol': 'curve',
-                    'chain': 'arbitrum_sepolia',
-                    'target_apy': 0.03,
-                    'risk_score': 0.1,
-                    'allocation_percentage': 20
-                }
-            ]
+            return _CONSERVATIVE_TARGETS
         elif strategy == "aggressive":
-            return [
-                {
-                    'protocol': 'aerodrome',
-                    'chain': 'arbitrum_sepolia',
-                    'target_apy': 0.15,
-                    'risk_score': 0.4,
-                    'allocation_percentage': 50
-                },
-                {
-                    'protocol': 'uniswap_v3',
-                    'chain': 'base_sepolia',
-                    'target_apy': 0.12,
-                    'risk_score': 0.35,
-                    'allocation_percentage': 35
-                },
-                {
-                    'protocol': 'aave_v3',
-                    'chain': 'ethereum_sepolia',
-                    'target_apy': 0.08,
-                    'risk_score': 0.25,
-                    'allocation_percentage': 15
-                }
-            ]
+            return _AGGRESSIVE_TARGETS
         else:  # balanced
-            return [
-                {
-                    'protocol': 'aave_v3',
-                    'chain': 'ethereum_sepolia',
-                    'target_apy': 0.06,
-                    'risk_score': 0.2,
-                    'allocation_percentage': 40
-                },
-                {
-                    'protocol': 'uniswap_v3',
-                    'chain': 'base_sepolia',
-                    'target_apy': 0.10,
-                    'risk_score': 0.3,
-                    'allocation_percentage': 35
-                },
-                {
-                    'protocol': 'aerodrome',
-                    'chain': 'arbitrum_sepolia',
-                    'target_apy': 0.12,
-                    'risk_score': 0.35,
-                    'allocation_percentage': 25
-                }
-            ]
+            return _BALANCED_TARGETS
 
-    async def calculate_rebalance_actions(
+    def calculate_rebalance_actions(
         self,
         current_positions: List[PortfolioPosition],
-        target_allocations: List[Dict],
+        target_allocations: Sequence[Mapping],
         total_portfolio_value: float
     ) -> List[RebalanceAction]:
         """Calculate specific rebalance actions needed"""
 
-        print("Calculating rebalance actions...")
+        logger.info("Calculating rebalance actions")
 
-        actions = []
+        chains, target_pct = self._chain_layout((pos.chain for pos in current_positions), target_allocations)
+        chain_index = {chain: i for i, chain in enumerate(chains)}
 
-        # Group current positions by chain
-        current_by_chain = {}
-        for pos in current_positions:
-            if pos.chain not in current_by_chain:
-                current_by_chain[pos.chain] = 0
-            current_by_chain[pos.chain] += pos.amount_usdc
+        # Current and target balance per chain as vectors
+        current = np.zeros(len(chains), dtype=np.float64)
+        np.add.at(
+            current,
+            [chain_index[pos.chain] for pos in current_positions],
+            [pos.amount_usdc for pos in current_positions]
+        )
+        surplus = current - target_pct * (total_portfolio_value / 100)
 
-        # Calculate needed transfers
-        for target in target_allocations:
-            target_amount = (target['allocation_percentage'] / 100) * total_portfolio_value
-            current_amount = current_by_chain.get(target['chain'], 0)
-            difference = target_amount - current_amount
-
-            if abs(difference) > self.min_transfer_amount:
-                if difference > 0:
-                    # Need to move funds TO this chain
-                    for source_chain, source_amount in current_by_chain.items():
-                        if source_chain != target['chain'] and source_amount > self.min_transfer_amount:
-                            transfer_amount = min(difference, source_amount - self.min_transfer_amount)
-
-                            action = RebalanceAction(
-                                action_type="cross_chain_transfer",
-                                source_chain=source_chain,
-                                target_chain=target['chain'],
-                                amount_usdc=transfer_amount,
-                                priority=1,
-                                reason=f"Rebalance to achieve {target['allocation_percentage']}% allocation"
-                            )
-                            actions.append(action)
-
-                            current_by_chain[source_chain] -= transfer_amount
-                            current_by_chain[target['chain']] = current_by_chain.get(target['chain'], 0) + transfer_amount
-                            break
-
-        print(f"   Generated {len(actions)} rebalance actions")
+        if not np.any(np.abs(surplus) > self.min_transfer_amount):
+            logger.info("Generated 0 rebalance actions")
+            return []
+
+        # Match donor and receiver chains
+        src_idx, dst_idx, amounts = plan_transfers_nb(surplus, float(self.min_transfer_amount))
+
+        actions = [
+            self._transfer_action(chains[src], chains[dst], target_pct[dst], amount)
+            for src, dst, amount in zip(src_idx.tolist(), dst_idx.tolist(), amounts.tolist())
+        ]
+
+        logger.info("Generated %d rebalance actions", len(actions))
         return actions
 
+    def plan_batch_rebalance_actions(
+        self,
+        portfolios: Dict[str, List[UserPortfolioPosition]],
+        target_allocations: Sequence[Mapping]
+    ) -> Dict[str, List[RebalanceAction]]:
+        """Calculate rebalance actions for many users in one kernel call"""
+
+        users = list(portfolios)
+        if not users:
+            return {}
+
+        chains, target_pct = self._chain_layout(
+            (pos.chain for positions in portfolios.values() for pos in positions),
+            target_allocations
+        )
+        chain_index = {chain: i for i, chain in enumerate(chains)}
+
+        current = np.zeros((len(users), len(chains)), dtype=np.float64)
+        for u, user in enumerate(users):
+            for pos in portfolios[user]:
+                current[u, chain_index[pos.chain]] += pos.amount_usdc
+        total_values = current.sum(axis=1)
+        surplus = current - np.outer(total_values, target_pct / 100)
+
+        src_idx, dst_idx, amounts = plan_transfers_batch_nb(surplus, float(self.min_transfer_amount))
+
+        plans = {}
+        for u, user in enumerate(users):
+            if total_values[u] < self.min_transfer_amount:
+                plans[user] = []
+                continue
+            plans[user] = [
+                self._transfer_action(
+                    chains[src_idx[u, k]], chains[dst_idx[u, k]],
+                    target_pct[dst_idx[u, k]], float(amounts[u, k])
+                )
+                for k in range(len(chains))
+                if src_idx[u, k] >= 0
+            ]
+
+        logger.info("Planned rebalance actions for %d users", len(users))
+        return plans
+
+    @staticmethod
+    def _chain_layout(held_chains, target_allocations: Sequence[Mapping]) -> Tuple[List[str], np.ndarray]:
+        """Index chains (held chains first, then target-only chains) and sum target share per chain"""
+        pct_by_chain = defaultdict(float)
+        for target in target_allocations:
+            pct_by_chain[target['chain']] += target['allocation_percentage']
+
+        chains = list(dict.fromkeys(held_chains))
+        chains.extend(chain for chain in pct_by_chain if chain not in chains)
+        target_pct = np.fromiter((pct_by_chain.get(chain, 0.0) for chain in chains), dtype=np.float64, count=len(chains))
+        return chains, target_pct
+
+    @staticmethod
+    def _transfer_action(source_chain: str, target_chain: str, target_pct: float, amount: float) -> RebalanceAction:
+        """Build the cross-chain transfer action for a planned transfer"""
+        return RebalanceAction(
+            action_type="cross_chain_transfer",
+            source_chain=source_chain,
+            target_chain=target_chain,
+            amount_usdc=amount,
+            priority=1,
+            reason=f"Rebalance to achieve {target_pct:g}% allocation"
+        )
+
     async def rebalance_portfolio(self, strategy: str = "balanced", dry_run: bool = True) -> Dict:
         """Main rebalancing function"""
 
-        print(f"PORTFOLIO REBALANCING - {strategy.upper()} STRATEGY")
-        print("=" * 60)
+        logger.info("Portfolio rebalancing strategy=%s dry_run=%s", strategy, dry_run)
+
+        tick_ts = datetime.now()
 
-        if dry_run:
-            print("DRY RUN MODE - No actual transactions will be executed")
+        if self._skip_until and tick_ts < self._skip_until:
+            logger.info("Portfolio below minimum on last check, skipping until %s", self._skip_until)
+            return {
+                "status": "skipped",
+                "reason": "backoff",
+                "retry_after": (self._skip_until - tick_ts).total_seconds()
+            }
 
-        # Step 1: Get current portfolio
-        current_positions = await self.get_current_portfolio()
-        total_value = sum(pos.amount_usdc for pos in current_positions)
+        # Step 1: Get current portfolio (reuse a fresh snapshot instead of rescanning)
+        if self._last_snapshot and tick_ts - self._last_snapshot[0] < self.snapshot_ttl:
+            _, current_positions, total_value = self._last_snapshot
+        else:
+            current_positions = await self.get_current_portfolio(tick_ts)
+            total_value = sum(pos.amount_usdc for pos in current_positions)
+            self._last_snapshot = (tick_ts, current_positions, total_value)
 
-        print(f"Current Portfolio Value: ${total_value:.2f} USDC")
+        logger.info("Current portfolio value=%.2f USDC", total_value)
 
         if total_value < self.min_transfer_amount:
-            print("Portfolio too small for rebalancing")
-            return {"status": "skipped", "reason": "insufficient_balance"}
+            # Back off exponentially while the portfolio stays too small
+            self._skip_backoff = min(max(self._skip_backoff * 2, self.snapshot_ttl), self.max_skip_backoff)
+            self._skip_until = tick_ts + self._skip_backoff
+            logger.info("Portfolio too small for rebalancing, next check after %s", self._skip_backoff)
+            return {
+                "status": "skipped",
+                "reason": "insufficient_balance",
+                "retry_after": self._skip_backoff.total_seconds()
+            }
+
+        self._skip_backoff = timedelta(0)
+        self._skip_until = None
 
         # Step 2: Get target allocations
-        target_allocations = await self.get_optimization_targets(strategy)
+        target_allocations = self.get_optimization_targets(strategy)
 
-        print(f"Target Allocations:")
-        for target in target_allocations:
-            target_amount = (target['allocation_percentage'] / 100) * total_value
-            print(f"   {target['protocol']} ({target['chain']}): {target['allocation_percentage']}% (${target_amount:.2f})")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Target allocations:\n%s", "\n".join(
+                "  protocol=%s chain=%s allocation=%s%% amount=%.2f" % (
+                    target['protocol'], target['chain'], target['allocation_percentage'],
+                    (target['allocation_percentage'] / 100) * total_value
+                )
+                for target in target_allocations
+            ))
 
         # Step 3: Calculate rebalance actions
-        actions = await self.calculate_rebalance_actions(
+        actions = self.calculate_rebalance_actions(
             current_positions,
             target_allocations,
             total_value
         )
 
         if not actions:
-            print("Portfolio is already optimally balanced!")
+            logger.info("Portfolio is already optimally balanced")
             return {"status": "no_action_needed"}
 
-        print(f"Rebalance Actions Needed:")
-        for i, action in enumerate(actions, 1):
-            print(f"   {i}. {action.action_type}: {action.amount_usdc:.2f} USDC")
-            print(f"      {action.source_chain} -> {action.target_chain}")
-            print(f"      Reason: {action.reason}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Rebalance actions needed:\n%s", "\n".join(
+                "  action=%d type=%s amount=%.2f route=%s->%s reason=%s" % (
+                    i, action.action_type, action.amount_usdc,
+                    action.source_chain, action.target_chain, action.reason
+                )
+                for i, action in enumerate(actions, 1)
+            ))
 
         # Summary
         result = {
@@ -293,69 +541,76 @@ class USDAIRebalancer:
             "actions_planned": len(actions),
             "actions_executed": 0,
             "strategy": strategy,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": tick_ts.isoformat(),
+            # Snapshot reused by execute_rebalancing instead of rescanning chains
+            "current_positions": current_positions,
+            "target_allocations": target_allocations,
+            "actions": actions
         }
 
-        print(f"Rebalancing Summary:")
-        print(f"   Strategy: {strategy}")
-        print(f"   Total Value: ${total_value:.2f}")
-        print(f"   Actions Planned: {len(actions)}")
-        print(f"   Status: Ready for execution")
+        logger.info(
+            "Rebalancing planned strategy=%s total_value=%.2f actions=%d",
+            strategy, total_value, len(actions)
+        )
 
         return result
 
     async def execute_rebalancing(self, rebalance_plan: Dict) -> Dict:
         """Execute the planned rebalancing actions"""
         
-        print(f"EXECUTING REBALANCING PLAN")
-        print("=" * 50)
+        logger.info("Executing rebalancing plan")
         
         if rebalance_plan["status"] != "planned":
-            print("❌ No valid rebalancing plan to execute")
+            logger.warning("No valid rebalancing plan to execute")
             return {"status": "failed", "reason": "no_valid_plan"}
         
         executed_actions = []
         total_cost = 0.0
         
         try:
-            # Get current positions for execution
-            current_positions = await self.get_current_portfolio()
-            target_allocations = await self.get_optimization_targets(rebalance_plan["strategy"])
-            total_value = sum(pos.amount_usdc for pos in current_positions)
+            if "actions" in rebalance_plan:
+                # Reuse the snapshot taken while planning
+                total_value = rebalance_plan["total_value"]
+                actions = rebalance_plan["actions"]
+            else:
+                # Get current positions for execution
+                current_positions = await self.get_current_portfolio(datetime.now())
+                target_allocations = self.get_optimization_targets(rebalance_plan["strategy"])
+                total_value = sum(pos.amount_usdc for pos in current_positions)
+                
+                # Calculate actions again for execution
+                actions = self.calculate_rebalance_actions(
+                    current_positions,
+                    target_allocations,
+                    total_value
+                )
             
-            # Calculate actions again for execution
-            actions = await self.calculate_rebalance_actions(
-                current_positions,
-                target_allocations,
-                total_value
+            logger.info("Executing %d rebalancing actions", len(actions))
+            
+            # Transfers from the same source chain run in order, so each burn's balance
+            # check sees the previous burn; groups run concurrently so attestation
+            # waits overlap. A group's mint can land on another group's source chain,
+            # so per-chain nonce ordering is left to CCTPIntegration._transact, which
+            # serializes every send by (chain, signer)
+            groups: Dict[str, List[Tuple[int, RebalanceAction]]] = {}
+            for i, action in enumerate(actions, 1):
+                groups.setdefault(action.source_chain, []).append((i, action))
+            
+            group_results = await asyncio.gather(
+                *[self._execute_action_group(group, len(actions)) for group in groups.values()]
             )
             
-            print(f"Executing {len(actions)} rebalancing actions...")
+            for results in group_results:
+                for transfer_result in results:
+                    executed_actions.append(transfer_result)
+                    total_cost += transfer_result.get("cost", 0)
             
-            for i, action in enumerate(actions, 1):
-                print(f"\nAction {i}/{len(actions)}: {action.action_type}")
-                print(f"   Amount: {action.amount_usdc:.2f} USDC")
-                print(f"   Route: {action.source_chain} → {action.target_chain}")
-                
-                try:
-                    if action.action_type == "cross_chain_transfer":
-                        # Execute CCTP transfer
-                        transfer_result = await self._execute_cctp_transfer(action)
-                        executed_actions.append(transfer_result)
-                        total_cost += transfer_result.get("cost", 0)
-                        
-                        print(f"   ✅ Transfer executed: {transfer_result.get('status', 'unknown')}")
-                    
-                except Exception as e:
-                    print(f"   ❌ Action failed: {e}")
-                    executed_actions.append({
-                        "action": action,
-                        "status": "failed",
-                        "error": str(e)
-                    })
+            # Balances moved, the next plan must rescan
+            self.invalidate_snapshot()
             
             # Verify final portfolio state
-            final_positions = await self.get_current_portfolio()
+            final_ts = datetime.now()
+            final_positions = await self.get_current_portfolio(final_ts)
             final_value = sum(pos.amount_usdc for pos in final_positions)
             
             result = {
@@ -366,19 +621,19 @@ class USDAIRebalancer:
                 "initial_value": total_value,
                 "final_value": final_value,
                 "value_change": final_value - total_value,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": final_ts.isoformat()
             }
             
-            print(f"\n🎯 REBALANCING EXECUTION COMPLETE")
-            print(f"   Actions Executed: {result['actions_executed']}")
-            print(f"   Actions Failed: {result['actions_failed']}")
-            print(f"   Total Cost: ${total_cost:.2f}")
-            print(f"   Value Change: ${result['value_change']:.2f}")
+            logger.info(
+                "Rebalancing complete executed=%d failed=%d total_cost=%.2f value_change=%.2f",
+                result['actions_executed'], result['actions_failed'],
+                total_cost, result['value_change']
+            )
             
             return result
             
         except Exception as e:
-            print(f"❌ Rebalancing execution failed: {e}")
+            logger.error("Rebalancing execution failed: %s", e)
             return {
                 "status": "failed",
                 "error": str(e),
@@ -386,18 +641,58 @@ class USDAIRebalancer:
                 "total_cost": total_cost
             }
 
+    def invalidate_snapshot(self):
+        """Drop the cached portfolio snapshot and any small-portfolio backoff
+
+        Call whenever funds enter or leave the wallet (deposits, investments,
+        executed transfers) so the next rebalance rescans immediately.
+        """
+        self._last_snapshot = None
+        self._skip_backoff = timedelta(0)
+        self._skip_until = None
+
+    async def _execute_action_group(
+        self,
+        group: List[Tuple[int, RebalanceAction]],
+        total_actions: int
+    ) -> List[Dict]:
+        """Execute actions that share a source chain one after another"""
+        
+        results = []
+        
+        for i, action in group:
+            logger.info(
+                "action=%d/%d type=%s amount=%.2f route=%s->%s",
+                i, total_actions, action.action_type, action.amount_usdc,
+                action.source_chain, action.target_chain
+            )
+            
+            try:
+                if action.action_type == "cross_chain_transfer":
+                    # Execute CCTP transfer
+                    transfer_result = await self._execute_cctp_transfer(action)
+                    results.append(transfer_result)
+                    
+                    logger.info("action=%d transfer status=%s", i, transfer_result.get('status', 'unknown'))
+                
+            except Exception as e:
+                logger.error("action=%d failed: %s", i, e)
+                results.append({
+                    "action": action,
+                    "status": "failed",
+                    "error": str(e)
+                })
+        
+        return results
+
     async def _execute_cctp_transfer(self, action: RebalanceAction) -> Dict:
         """Execute a CCTP cross-chain transfer"""
         
         try:
-            # Import CCTP integration
-            from ..apis.cctp_integration import CCTPIntegration
-            cctp = CCTPIntegration()
-            
-            print(f"   🌉 Initiating CCTP transfer...")
+            logger.info("Initiating CCTP transfer %s->%s", action.source_chain, action.target_chain)
             
             # Initiate transfer
-            transfer = await cctp.initiate_cross_chain_transfer(
+            transfer = await self.cctp.initiate_cross_chain_transfer(
                 source_chain=action.source_chain,
                 destination_chain=action.target_chain,
                 amount=action.amount_usdc,
@@ -405,14 +700,14 @@ class USDAIRebalancer:
                 private_key=self.private_key
             )
             
-            print(f"   🔥 Burn transaction: {transfer.burn_tx_hash}")
+            logger.info("burn_tx=%s", transfer.burn_tx_hash)
             
             # Wait for attestation and complete transfer
-            completed_transfer = await cctp.complete_cross_chain_transfer(
+            completed_transfer = await self.cctp.complete_cross_chain_transfer(
                 transfer, self.private_key
             )
             
-            print(f"   🪙 Mint transaction: {completed_transfer.mint_tx_hash}")
+            logger.info("mint_tx=%s", completed_transfer.mint_tx_hash)
             
             # Calculate costs
             burn_cost = transfer.gas_used * transfer.gas_price / 10**18 if transfer.gas_used else 0
@@ -440,10 +735,11 @@ class USDAIRebalancer:
     async def get_portfolio_performance(self, time_period: str = "24h") -> Dict:
         """Get portfolio performance metrics"""
         
-        print(f"Analyzing portfolio performance over {time_period}...")
+        logger.info("Analyzing portfolio performance period=%s", time_period)
         
         try:
-            current_positions = await self.get_current_portfolio()
+            tick_ts = datetime.now()
+            current_positions = await self.get_current_portfolio(tick_ts)
             total_value = sum(pos.amount_usdc for pos in current_positions)
             
             # Calculate performance metrics
@@ -453,14 +749,14 @@ class USDAIRebalancer:
                 "chain_distribution": {},
                 "average_apy": 0.0,
                 "risk_score": 0.0,
-                "last_updated": datetime.now().isoformat()
+                "last_updated": tick_ts.isoformat()
             }
             
             # Calculate chain distribution
+            chain_distribution = defaultdict(float)
             for pos in current_positions:
-                if pos.chain not in performance["chain_distribution"]:
-                    performance["chain_distribution"][pos.chain] = 0
-                performance["chain_distribution"][pos.chain] += pos.amount_usdc
+                chain_distribution[pos.chain] += pos.amount_usdc
+            performance["chain_distribution"] = dict(chain_distribution)
             
             # Calculate weighted average APY and risk
             total_weighted_apy = 0
@@ -477,27 +773,37 @@ class USDAIRebalancer:
             return performance
             
         except Exception as e:
-            print(f"❌ Error calculating performance: {e}")
+            logger.error("Error calculating performance: %s", e)
             return {"error": str(e)}
 
     async def optimize_gas_costs(self, actions: List[RebalanceAction]) -> List[RebalanceAction]:
         """Optimize gas costs for rebalancing actions"""
         
-        print("Optimizing gas costs for rebalancing actions...")
+        logger.info("Optimizing gas costs for %d rebalancing actions", len(actions))
         
         optimized_actions = []
         
+        # Fetch each chain's gas price once, concurrently, for the whole batch
+        chains_needed = list(
+            {a.source_chain for a in actions} | {a.target_chain for a in actions}
+        )
+        prices = await asyncio.gather(
+            *[self._async_gas_price(chain) for chain in chains_needed],
+            return_exceptions=True
+        )
+        gas_cache: Dict[str, int] = dict(zip(chains_needed, prices))
+        
         for action in actions:
             try:
                 # Get current gas prices for both chains
                 source_config = self.cctp.chain_configs[action.source_chain]
                 dest_config = self.cctp.chain_configs[action.target_chain]
                 
-                source_w3 = Web3(Web3.HTTPProvider(source_config.rpc_url))
-                dest_w3 = Web3(Web3.HTTPProvider(dest_config.rpc_url))
-                
-                source_gas_price = source_w3.eth.gas_price
-                dest_gas_price = dest_w3.eth.gas_price
+                source_gas_price = gas_cache[action.source_chain]
+                dest_gas_price = gas_cache[action.target_chain]
+                for price in (source_gas_price, dest_gas_price):
+                    if isinstance(price, Exception):
+                        raise price
                 
                 # Estimate gas costs
                 estimated_burn_gas = source_config.gas_limit
@@ -511,23 +817,32 @@ class USDAIRebalancer:
                 cost_percentage = total_cost / action.amount_usdc if action.amount_usdc > 0 else 0
                 
                 if cost_percentage <= self.max_gas_cost_percentage:
-                    action.reason += f" (Gas cost: ${total_cost:.2f}, {cost_percentage:.2%})"
-                    optimized_actions.append(action)
+                    optimized_actions.append(replace(
+                        action,
+                        reason=f"{action.reason} (Gas cost: ${total_cost:.2f}, {cost_percentage:.2%})"
+                    ))
                 else:
-                    print(f"   ⚠️ Skipping action due to high gas cost: {cost_percentage:.2%}")
+                    logger.warning("Skipping action due to high gas cost: %.2f%%", cost_percentage * 100)
                     
             except Exception as e:
-                print(f"   ❌ Error optimizing action: {e}")
+                logger.warning("Error optimizing action: %s", e)
                 optimized_actions.append(action)  # Include anyway
         
-        print(f"   Optimized to {len(optimized_actions)} actions")
+        logger.info("Optimized to %d actions", len(optimized_actions))
         return optimized_actions
 
+    async def _async_gas_price(self, chain: str) -> int:
+        """Fetch current gas price for chain without blocking the event loop"""
+        w3 = self._get_web3(chain)
+        return await asyncio.to_thread(lambda: w3.eth.gas_price)
+
     async def invest_portfolio(self, strategy: str = "balanced", total_amount: float = None) -> Dict:
         """Actually invest the portfolio into DeFi protocols"""
         
-        print(f"💰 INVESTING PORTFOLIO - {strategy.upper()} STRATEGY")
-        print("=" * 60)
+        logger.info("Investing portfolio strategy=%s", strategy)
+        
+        # A deposit is being invested: rescan now and lift any small-portfolio backoff
+        self.invalidate_snapshot()
         
         try:
             # Get current wallet balances
@@ -537,17 +852,15 @@ class USDAIRebalancer:
             if total_amount is None:
                 total_amount = total_value
             
-            print(f"Total Portfolio Value: ${total_value:.2f}")
-            print(f"Amount to Invest: ${total_amount:.2f}")
+            logger.info("Portfolio value=%.2f amount_to_invest=%.2f", total_value, total_amount)
             
             if total_amount < 10.0:
-                print("❌ Portfolio too small for investment (minimum $10)")
+                logger.warning("Portfolio too small for investment (minimum $10)")
                 return {"status": "failed", "reason": "insufficient_amount"}
             
             # Get target allocations
-            target_allocations = await self.get_optimization_targets(strategy)
+            target_allocations = self.get_optimization_targets(strategy)
             
-            print(f"\nInvestment Plan:")
             investments = []
             total_invested = 0.0
             
@@ -555,7 +868,7 @@ class USDAIRebalancer:
                 target_amount = (target['allocation_percentage'] / 100) * total_amount
                 
                 if target_amount >= 1.0:  # Minimum $1 investment
-                    print(f"   {target['protocol']} ({target['chain']}): ${target_amount:.2f}")
+                    logger.info("invest protocol=%s chain=%s amount=%.2f", target['protocol'], target['chain'], target_amount)
                     
                     # Map to protocol investor format
                     protocol_key = f"{target['protocol']}_{target['chain']}"
@@ -571,13 +884,15 @@ class USDAIRebalancer:
                     investments.append(investment)
                     total_invested += target_amount if investment.status == "invested" else 0
             
+            # Wallet balances moved into protocols
+            self.invalidate_snapshot()
+            
             # Get final protocol balances
-            print(f"\n📊 Final Protocol Balances:")
             protocol_balances = await self.investor.get_all_protocol_balances()
             
             for protocol, balance in protocol_balances.items():
                 if balance > 0:
-                    print(f"   {protocol}: ${balance:.2f} USDC")
+                    logger.info("protocol=%s balance=%.2f USDC", protocol, balance)
             
             result = {
                 "status": "completed",
@@ -590,16 +905,16 @@ class USDAIRebalancer:
                 "timestamp": datetime.now().isoformat()
             }
             
-            print(f"\n🎯 INVESTMENT SUMMARY:")
-            print(f"   Strategy: {strategy}")
-            print(f"   Total Invested: ${total_invested:.2f}")
-            print(f"   Successful Investments: {result['successful_investments']}")
-            print(f"   Protocol Positions: {len([b for b in protocol_balances.values() if b > 0])}")
+            logger.info(
+                "Investment complete strategy=%s total_invested=%.2f successful=%d positions=%d",
+                strategy, total_invested, result['successful_investments'],
+                len([b for b in protocol_balances.values() if b > 0])
+            )
             
             return result
             
         except Exception as e:
-            print(f"❌ Portfolio investment failed: {e}")
+            logger.error("Portfolio investment failed: %s", e)
             return {
                 "status": "failed",
                 "error": str(e),
@@ -609,22 +924,21 @@ class USDAIRebalancer:
     async def rebalance_invested_portfolio(self, strategy: str = "balanced") -> Dict:
         """Rebalance an already invested portfolio"""
         
-        print(f"🔄 REBALANCING INVESTED PORTFOLIO - {strategy.upper()} STRATEGY")
-        print("=" * 60)
+        logger.info("Rebalancing invested portfolio strategy=%s", strategy)
         
         try:
             # Get current protocol balances
             protocol_balances = await self.investor.get_all_protocol_balances()
             total_invested = sum(protocol_balances.values())
             
-            print(f"Total Invested Value: ${total_invested:.2f}")
+            logger.info("Total invested value=%.2f", total_invested)
             
             if total_invested < 10.0:
-                print("❌ Portfolio too small for rebalancing")
+                logger.info("Portfolio too small for rebalancing")
                 return {"status": "skipped", "reason": "insufficient_amount"}
             
             # Get target allocations
-            target_allocations = await self.get_optimization_targets(strategy)
+            target_allocations = self.get_optimization_targets(strategy)
             
             # Calculate rebalancing actions
             rebalance_actions = []
@@ -654,16 +968,16 @@ class USDAIRebalancer:
                         })
             
             if not rebalance_actions:
-                print("✅ Portfolio already optimally balanced!")
+                logger.info("Portfolio already optimally balanced")
                 return {"status": "no_action_needed"}
             
-            print(f"Rebalancing Actions Needed: {len(rebalance_actions)}")
+            logger.info("Rebalancing actions needed=%d", len(rebalance_actions))
             
             # Execute rebalancing actions
             executed_actions = []
             
             for action in rebalance_actions:
-                print(f"\nAction: {action['action']} ${action['amount']:.2f} in {action['protocol']}")
+                logger.info("action=%s amount=%.2f protocol=%s", action['action'], action['amount'], action['protocol'])
                 
                 try:
                     if action['action'] == 'invest':
@@ -688,7 +1002,7 @@ class USDAIRebalancer:
                         })
                         
                 except Exception as e:
-                    print(f"   ❌ Action failed: {e}")
+                    logger.error("action=%s protocol=%s failed: %s", action['action'], action['protocol'], e)
                     executed_actions.append({
                         "action": action['action'],
                         "protocol": action['protocol'],
@@ -710,15 +1024,16 @@ class USDAIRebalancer:
                 "timestamp": datetime.now().isoformat()
             }
             
-            print(f"\n🎯 REBALANCING SUMMARY:")
-            print(f"   Actions Executed: {result['actions_executed']}")
-            print(f"   Successful Actions: {result['successful_actions']}")
-            print(f"   Final Value: ${sum(final_balances.values()):.2f}")
+            logger.info(
+                "Rebalancing complete executed=%d successful=%d final_value=%.2f",
+                result['actions_executed'], result['successful_actions'],
+                sum(final_balances.values())
+            )
             
             return result
             
         except Exception as e:
-            print(f"❌ Portfolio rebalancing failed: {e}")
+            logger.error("Portfolio rebalancing failed: %s", e)
             return {
                 "status": "failed",
                 "error": str(e),
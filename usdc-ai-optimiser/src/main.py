@@ -4,20 +4,40 @@ CrossYield AI Optimizer - Main Backend Service
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 from datetime import datetime
+from dataclasses import dataclass
 import asyncio
+import aiohttp
 import time
-import random
-from typing import List, Dict, Any
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, Optional, Sequence, Set, Tuple, AsyncIterator, Awaitable, Callable, Coroutine
+import numpy as np
+import orjson
+from types import MappingProxyType
+from collections import defaultdict
+from operator import attrgetter
+from functools import lru_cache
+from web3 import AsyncWeb3, AsyncHTTPProvider
+from web3.contract import AsyncContract
+from eth_utils import function_signature_to_4byte_selector
+
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
 
 # Local imports
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.contract_integration import contract_manager
-from src.execution.cctp_engine import cctp_engine
+from src.contract_integration import (
+    contract_manager, CHAIN_CONFIGS, SUPPORTED_CHAINS, MULTICALL3_ADDRESS, MULTICALL3_ABI
+)
 from src.data.aggregator import YieldDataAggregator
 from src.data.aptos_aggregator import EnhancedDataAggregator
 from src.services.aptos.vault_integration import VaultIntegrationService
@@ -27,11 +47,52 @@ from src.utils.logger import (
     log_performance_metrics, log_system_status
 )
 
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson; numpy scalars and arrays serialize natively"""
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Own the app-wide clients: HTTP session, response cache, timestamp ticker and async web3 providers"""
+    global yield_aggregator
+
+    # aiohttp session shared by the data clients
+    app.state.http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+    )
+    yield_aggregator = YieldDataAggregator(cache_ttl=OPPORTUNITY_CACHE_TTL, session=app.state.http)
+    # Response cache shared by workers when REDIS_URL is set, in-process otherwise
+    redis_url = os.getenv("REDIS_URL")
+    app.state.redis = aioredis.from_url(redis_url) if REDIS_AVAILABLE and redis_url else None
+    # Shared timestamp ticker
+    _set_timestamp(time.time())
+    app.state.timestamp_task = asyncio.create_task(refresh_timestamp())
+    _ts_cache["live"] = True
+
+    try:
+        yield
+    finally:
+        # Stop the ticker and fall back to lazy refresh
+        _ts_cache["live"] = False
+        app.state.timestamp_task.cancel()
+        # Probe clients are created lazily per chain; close whichever were opened
+        for w3 in async_web3_clients.values():
+            await w3.provider.disconnect()
+        async_web3_clients.clear()
+        async_multicall_contracts.clear()
+        if app.state.redis is not None:
+            await app.state.redis.aclose()
+        await app.state.http.close()
+
 # Initialize FastAPI app
 app = FastAPI(
     title="CrossYield AI Optimizer",
     description="AI-powered cross-chain USDC yield optimization",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -43,8 +104,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Opportunity lists are reused across previews/executions for this many seconds
+OPPORTUNITY_CACHE_TTL = 30.0
+
 # Initialize components
-yield_aggregator = YieldDataAggregator()
+yield_aggregator = YieldDataAggregator(cache_ttl=OPPORTUNITY_CACHE_TTL)
 # Enhanced aggregator with Aptos support
 enhanced_aggregator = EnhancedDataAggregator(nodit_api_key=os.getenv('NODIT_API_KEY'))
 
@@ -52,6 +116,151 @@ enhanced_aggregator = EnhancedDataAggregator(nodit_api_key=os.getenv('NODIT_API_
 vault_service = VaultIntegrationService()
 cctp_bridge_service = CCTPBridgeService()
 
+# Native async web3 clients for probes, created lazily per chain
+async_web3_clients: Dict[str, AsyncWeb3] = {}
+
+def get_async_web3(chain: str) -> AsyncWeb3:
+    """Get cached AsyncWeb3 client for chain"""
+    if chain not in async_web3_clients:
+        async_web3_clients[chain] = AsyncWeb3(AsyncHTTPProvider(CHAIN_CONFIGS[chain]["rpcUrl"]))
+    return async_web3_clients[chain]
+
+# Multicall3 contract per chain on the async clients
+async_multicall_contracts: Dict[str, AsyncContract] = {}
+
+def get_async_multicall(chain: str) -> AsyncContract:
+    """Get cached Multicall3 contract bound to the chain's AsyncWeb3 client"""
+    if chain not in async_multicall_contracts:
+        async_multicall_contracts[chain] = get_async_web3(chain).eth.contract(
+            address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI
+        )
+    return async_multicall_contracts[chain]
+
+# UserSmartWallet.getWalletSummary() calldata and return types
+WALLET_SUMMARY_CALLDATA = function_signature_to_4byte_selector("getWalletSummary()")
+WALLET_SUMMARY_TYPES = ["uint256", "uint256", "uint256", "bool"]
+
+# Opportunity attribute getters, applied in C by map/sorted/np.fromiter
+_get_apy = attrgetter("apy")
+_get_risk = attrgetter("riskScore")
+_get_tvl = attrgetter("tvl")
+_get_protocol = attrgetter("protocol")
+_get_chain = attrgetter("chain")
+
+# Allocation weights over the top opportunities for each strategy
+STRATEGY_WEIGHTS: Dict[str, np.ndarray] = {
+    "conservative": np.array([1.0]),
+    "balanced": np.array([0.6, 0.4]),
+    "aggressive": np.array([0.5, 0.3, 0.2])
+}
+
+# Weights quoted in the strategy listing, widest split first; the first one
+# that fits the available opportunities is used
+LISTING_WEIGHTS: Dict[str, Tuple[np.ndarray, ...]] = {
+    "conservative": (np.array([1.0]),),
+    "balanced": (np.array([0.65, 0.35]), np.array([1.0])),
+    "aggressive": (np.array([0.7, 0.2, 0.1]), np.array([0.8, 0.2]), np.array([1.0]))
+}
+
+def weighted_apy(weights: np.ndarray, opportunities: List[Any]) -> float:
+    """Expected APY of splitting funds over the top opportunities by weights"""
+    apys = np.fromiter(map(_get_apy, opportunities[:len(weights)]), dtype=np.float64, count=len(weights))
+    return float(np.dot(weights, apys))
+
+# ISO timestamp shared by all responses; kept fresh by a background task
+# while the app runs, refreshed lazily (at most once per second) otherwise
+_ts_cache: Dict[str, Any] = {"t": 0.0, "s": "", "live": False}
+
+def _set_timestamp(t: float) -> None:
+    """Store t and its ISO string as the shared timestamp"""
+    _ts_cache["t"] = t
+    _ts_cache["s"] = datetime.fromtimestamp(t).isoformat()
+
+def now_iso() -> str:
+    """Current time as ISO string, at most one second stale"""
+    if not _ts_cache["live"]:
+        t = time.time()
+        if t - _ts_cache["t"] >= 1.0:
+            _set_timestamp(t)
+    return _ts_cache["s"]
+
+async def refresh_timestamp(interval: float = 0.5) -> None:
+    """Reformat the shared timestamp every interval seconds"""
+    while True:
+        _set_timestamp(time.time())
+        await asyncio.sleep(interval)
+
+def dump_json(obj: Any) -> bytes:
+    """Serialize a response payload to JSON bytes with orjson"""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+# In-process fallback for cached_response: key -> (expires_at, JSON body)
+_response_cache: Dict[str, Tuple[float, bytes]] = {}
+
+async def cached_response(key: str, ttl: int, producer: Callable[[], Awaitable[Any]]) -> bytes:
+    """Cache-aside for slow-changing responses, in Redis when configured
+
+    Entries hold the serialized JSON body, so a hit is served as stored
+    without re-encoding. key names the endpoint; freshness comes from ttl.
+    Only the Redis calls fall back on connection errors, so a failing
+    producer is never run twice.
+    """
+    redis = getattr(app.state, "redis", None)
+    if redis is not None:
+        try:
+            hit = await redis.get(key)
+        except (OSError, RedisError):
+            pass  # Redis unreachable: fall back to the in-process cache
+        else:
+            if hit is not None:
+                return hit
+            body = dump_json(await producer())
+            try:
+                await redis.setex(key, ttl, body)
+            except (OSError, RedisError):
+                pass  # Served uncached; the next request retries Redis
+            return body
+
+    now = time.monotonic()
+    entry = _response_cache.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    body = dump_json(await producer())
+    # Drop expired bodies so keys that stop being requested don't stay in memory
+    for stale_key in [k for k, (expires_at, _) in _response_cache.items() if expires_at <= now]:
+        del _response_cache[stale_key]
+    _response_cache[key] = (now + ttl, body)
+    return body
+
+def json_body_response(body: bytes) -> Response:
+    """Response for an already-serialized JSON body"""
+    return Response(content=body, media_type="application/json")
+
+# Generator for all simulated analytics (no global random lock); one vectorized draw per metrics block
+rng = np.random.default_rng()
+
+def pick(options: Sequence[str]) -> str:
+    """Uniformly pick one of options"""
+    return options[rng.integers(len(options))]
+
+# Per-field draw bounds and rounding scale, one record per metric
+METRIC_FIELD_DTYPE = np.dtype([("lo", "f8"), ("hi", "f8"), ("scale", "f8")])
+
+def metric_schema(*fields: Tuple[str, float, float, int]) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """Pack (key, low, high, decimals) rows into a structured array for draw_metrics"""
+    keys = tuple(key for key, _, _, _ in fields)
+    table = np.array([(lo, hi, 10.0 ** nd) for _, lo, hi, nd in fields], dtype=METRIC_FIELD_DTYPE)
+    return keys, table
+
+def draw_metrics(schema: Tuple[Tuple[str, ...], np.ndarray], base: Optional[np.ndarray] = None) -> Dict[str, float]:
+    """Draw every metric of a schema uniformly in one call, plus optional base values, rounded per field"""
+    keys, table = schema
+    values = rng.uniform(table["lo"], table["hi"])
+    if base is not None:
+        values += base
+    scale = table["scale"]
+    return dict(zip(keys, (np.round(values * scale) / scale).tolist()))
+
 # Request models
 class OptimizationRequest(BaseModel):
     userAddress: str
@@ -59,15 +268,41 @@ class OptimizationRequest(BaseModel):
     strategy: str
     smartWalletAddress: str
 
+@dataclass(frozen=True)
+class OpportunitySummary:
+    """Aggregates over a filter's opportunities, shared by the strategy card builders"""
+    count: int
+    protocols: Tuple[str, ...]  # Unique, in first-seen order
+    chains: Tuple[str, ...]     # Unique, in first-seen order
+    avg_apy: float
+    avg_risk: float
+    total_tvl: float
+
+def summarize_opportunities(opportunities: List[Any]) -> OpportunitySummary:
+    """Collect protocols, chains and the APY/risk/TVL columns once per filter"""
+    count = len(opportunities)
+    apys = np.fromiter(map(_get_apy, opportunities), dtype=np.float64, count=count)
+    risks = np.fromiter(map(_get_risk, opportunities), dtype=np.float64, count=count)
+    tvls = np.fromiter(map(_get_tvl, opportunities), dtype=np.float64, count=count)
+
+    return OpportunitySummary(
+        count=count,
+        protocols=tuple(dict.fromkeys(map(_get_protocol, opportunities))),
+        chains=tuple(dict.fromkeys(map(_get_chain, opportunities))),
+        avg_apy=float(apys.mean()) if count else 0,
+        avg_risk=float(risks.mean()) if count else 50,
+        total_tvl=float(tvls.sum())
+    )
+
 # Advanced AI Reasoning and Strategy Generation Functions (80% HONEST, 20% WOW)
-async def generate_ai_reasoning(risk_profile: str, opportunities: List[Any]) -> Dict[str, Any]:
+async def generate_ai_reasoning(risk_profile: str, summary: OpportunitySummary) -> Dict[str, Any]:
     """Generate AI reasoning based on REAL strategy analysis"""
 
-    protocols = list(set([opp.protocol for opp in opportunities]))
-    chains = list(set([opp.chain for opp in opportunities]))
-    avg_apy = sum(opp.apy for opp in opportunities) / len(opportunities) if opportunities else 0
-    avg_risk = sum(opp.riskScore for opp in opportunities) / len(opportunities) if opportunities else 50
-    total_tvl = sum(opp.tvl for opp in opportunities) if opportunities else 0
+    protocols = summary.protocols
+    chains = summary.chains
+    avg_apy = summary.avg_apy
+    avg_risk = summary.avg_risk
+    total_tvl = summary.total_tvl
 
     # Calculate HONEST metrics
     tvl_billions = total_tvl / 1_000_000_000
@@ -89,7 +324,7 @@ async def generate_ai_reasoning(risk_profile: str, opportunities: List[Any]) ->
     sharpe_ratio = (avg_apy - risk_free_rate) / max(volatility_estimate, 1) if volatility_estimate > 0 else 0
 
     reasoning = {
-        "marketAnalysis": f"AI aggregation analyzed {len(opportunities)} yield opportunities across {len(chains)} chain{'s' if len(chains) > 1 else ''}. Total protocol TVL: ${tvl_billions:.2f}B. {'Multi-chain strategy leverages Circle CCTP for seamless USDC transfers' if len(chains) > 1 else 'Single-chain optimization focused on maximizing efficiency'}. Current market conditions {'favor stable yields' if risk_profile == 'conservative' else 'support diversified allocations' if risk_profile == 'balanced' else 'enable aggressive yield hunting'}.",
+        "marketAnalysis": f"AI aggregation analyzed {summary.count} yield opportunities across {len(chains)} chain{'s' if len(chains) > 1 else ''}. Total protocol TVL: ${tvl_billions:.2f}B. {'Multi-chain strategy leverages Circle CCTP for seamless USDC transfers' if len(chains) > 1 else 'Single-chain optimization focused on maximizing efficiency'}. Current market conditions {'favor stable yields' if risk_profile == 'conservative' else 'support diversified allocations' if risk_profile == 'balanced' else 'enable aggressive yield hunting'}.",
 
         "riskAssessment": f"This {risk_profile} strategy targets {risk_level} risk exposure through {risk_description}. {'Aptos integration provides access to emerging ecosystem yields with higher growth potential' if any('aptos' in c.lower() for c in chains) else 'EVM-focused approach prioritizes battle-tested protocols'}. Portfolio risk score: {avg_risk:.1f}/100. {'Conservative positioning protects capital' if risk_profile == 'conservative' else 'Balanced allocation optimizes risk-reward' if risk_profile == 'balanced' else 'Aggressive positioning targets maximum yields'}.",
 
@@ -104,13 +339,19 @@ async def generate_ai_reasoning(risk_profile: str, opportunities: List[Any]) ->
 
     return reasoning
 
+MARKET_METRICS = metric_schema(
+    ("volatility_score", 3.5, 7.2, 1),
+    ("total_tvl", 45.2, 78.9, 1),  # Billions
+    ("liquidity_score", 75.3, 94.7, 1),
+    ("market_sentiment", 0.6, 0.9, 2),
+    ("institutional_flow", 12.5, 28.3, 1),  # Billions
+    ("defi_growth_rate", 8.2, 15.7, 1)  # Percentage
+)
+
 async def analyze_real_market_conditions() -> Dict[str, Any]:
     """Analyze real market conditions with sophisticated metrics"""
     
     # Simulate real market analysis (in production, this would fetch from multiple sources)
-    import random
-    from datetime import datetime, timedelta
-    
     # Market state analysis
     market_states = ["bullish", "neutral", "bearish"]
     volatility_levels = ["low", "moderate", "high"]
@@ -121,61 +362,59 @@ async def analyze_real_market_conditions() -> Dict[str, Any]:
     
     return {
         "market_state": market_state,
-        "volatility_level": random.choice(volatility_levels),
-        "volatility_score": round(random.uniform(3.5, 7.2), 1),
-        "total_tvl": round(random.uniform(45.2, 78.9), 1),  # Billions
-        "liquidity_score": round(random.uniform(75.3, 94.7), 1),
-        "market_sentiment": round(random.uniform(0.6, 0.9), 2),
-        "institutional_flow": round(random.uniform(12.5, 28.3), 1),  # Billions
-        "defi_growth_rate": round(random.uniform(8.2, 15.7), 1)  # Percentage
+        "volatility_level": pick(volatility_levels),
+        **draw_metrics(MARKET_METRICS)
     }
 
+PROTOCOL_METRICS = metric_schema(
+    ("yield_percentile", 75.2, 94.8, 1),
+    ("liquidity_score", 8.1, 9.7, 1),
+    ("security_score", 8.5, 9.9, 1),
+    ("governance_score", 7.8, 9.4, 1),
+    ("performance_score", 8.2, 9.6, 1),
+    ("innovation_index", 7.5, 9.3, 1),
+    ("adoption_rate", 0.15, 0.35, 2)
+)
+
 async def analyze_protocol_intelligence(protocols: List[str]) -> Dict[str, Any]:
     """Advanced protocol analysis with multiple intelligence factors"""
     
     # Simulate sophisticated protocol analysis
-    import random
-    
     return {
-        "optimization_strategy": random.choice([
+        "optimization_strategy": pick([
             "dynamic yield farming with automated compound optimization",
             "cross-chain liquidity provision with impermanent loss mitigation",
             "multi-protocol arbitrage with MEV protection",
             "risk-adjusted lending with automated liquidation protection"
         ]),
-        "yield_percentile": round(random.uniform(75.2, 94.8), 1),
-        "liquidity_score": round(random.uniform(8.1, 9.7), 1),
-        "security_score": round(random.uniform(8.5, 9.9), 1),
-        "governance_score": round(random.uniform(7.8, 9.4), 1),
-        "performance_score": round(random.uniform(8.2, 9.6), 1),
-        "innovation_index": round(random.uniform(7.5, 9.3), 1),
-        "adoption_rate": round(random.uniform(0.15, 0.35), 2)
+        **draw_metrics(PROTOCOL_METRICS)
     }
 
+RISK_METRICS = metric_schema(
+    ("confidence_interval", 85.2, 96.8, 1),
+    ("diversification_benefit", 12.3, 28.7, 1),
+    ("contract_risk", 2.1, 4.8, 1),
+    ("liquidity_protection", 78.5, 94.2, 1),
+    ("sharpe_ratio", 1.4, 2.8, 2),
+    ("systemic_risk_reduction", 18.7, 34.2, 1),
+    ("rebalance_threshold", 2.5, 5.8, 1),
+    ("kelly_fraction", 0.12, 0.28, 2),
+    ("gas_efficiency", 15.3, 28.7, 1),
+    ("var_95", 3.2, 8.7, 1),  # Value at Risk 95%
+    ("max_drawdown", 4.8, 12.3, 1),
+    ("correlation_matrix_score", 0.23, 0.45, 2)
+)
+
 async def calculate_advanced_risk_metrics(opportunities: List[Any], strategy_name: str) -> Dict[str, Any]:
     """Calculate sophisticated risk metrics using advanced financial models"""
     
-    import random
-    import math
-    
     # Simulate advanced risk calculations
     base_risk = {"conservative": 0.15, "balanced": 0.25, "aggressive": 0.35, "cross_chain": 0.28}[strategy_name]
     
     return {
         "risk_level": strategy_name.title(),
-        "confidence_interval": round(random.uniform(85.2, 96.8), 1),
-        "diversification_benefit": round(random.uniform(12.3, 28.7), 1),
-        "contract_risk": round(random.uniform(2.1, 4.8), 1),
-        "audit_status": random.choice(["comprehensive", "extensive", "thorough"]),
-        "liquidity_protection": round(random.uniform(78.5, 94.2), 1),
-        "sharpe_ratio": round(random.uniform(1.4, 2.8), 2),
-        "systemic_risk_reduction": round(random.uniform(18.7, 34.2), 1),
-        "rebalance_threshold": round(random.uniform(2.5, 5.8), 1),
-        "kelly_fraction": round(random.uniform(0.12, 0.28), 2),
-        "gas_efficiency": round(random.uniform(15.3, 28.7), 1),
-        "var_95": round(random.uniform(3.2, 8.7), 1),  # Value at Risk 95%
-        "max_drawdown": round(random.uniform(4.8, 12.3), 1),
-        "correlation_matrix_score": round(random.uniform(0.23, 0.45), 2)
+        "audit_status": pick(["comprehensive", "extensive", "thorough"]),
+        **draw_metrics(RISK_METRICS)
     }
 
 def calculate_ai_confidence_score(risk_profile: str, protocols: List[str], chains: List[str], avg_apy: float) -> int:
@@ -222,23 +461,25 @@ def calculate_ai_confidence_score(risk_profile: str, protocols: List[str], chain
 
     return min(94, max(72, int(base_score)))
 
+# Protocol analysis blurbs, matched by substring of the protocol name in this order
+PROTOCOL_TEMPLATES = MappingProxyType({
+    "Aave": "Aave V3 demonstrates exceptional security with {security_score:.1f}/10 audit score and {liquidity_score:.1f}/10 liquidity depth. Advanced risk management includes isolated markets and dynamic interest rate algorithms.",
+    "Compound": "Compound's governance maturity ({governance_score:.1f}/10) and battle-tested interest rate model provide robust yield generation with {performance_score:.1f}/10 historical performance.",
+    "Uniswap": "Uniswap V3's concentrated liquidity and MEV protection mechanisms achieve {innovation_index:.1f}/10 innovation index with automated market making optimization.",
+    "Moonwell": "Moonwell's cross-chain lending architecture shows {adoption_rate:.1%} adoption rate with advanced liquidation protection and yield optimization algorithms.",
+    "Radiant": "Radiant Capital's omnichain infrastructure achieves {liquidity_score:.1f}/10 liquidity efficiency with cross-chain arbitrage opportunities and enhanced yield mechanisms.",
+    "Curve": "Curve's stablecoin optimization algorithms minimize impermanent loss with {performance_score:.1f}/10 performance score and advanced AMM mechanisms.",
+})
+
+@lru_cache(maxsize=128)
+def protocol_template(protocol: str) -> Optional[str]:
+    """Template for a protocol name, resolved once per distinct name"""
+    return next((template for key, template in PROTOCOL_TEMPLATES.items() if key in protocol), None)
+
 def generate_advanced_protocol_details(protocols: List[str], protocol_analysis: Dict) -> str:
     """Generate sophisticated protocol-specific analysis"""
-    details = []
-    for protocol in protocols:
-        if "Aave" in protocol:
-            details.append(f"Aave V3 demonstrates exceptional security with {protocol_analysis['security_score']:.1f}/10 audit score and {protocol_analysis['liquidity_score']:.1f}/10 liquidity depth. Advanced risk management includes isolated markets and dynamic interest rate algorithms.")
-        elif "Compound" in protocol:
-            details.append(f"Compound's governance maturity ({protocol_analysis['governance_score']:.1f}/10) and battle-tested interest rate model provide robust yield generation with {protocol_analysis['performance_score']:.1f}/10 historical performance.")
-        elif "Uniswap" in protocol:
-            details.append(f"Uniswap V3's concentrated liquidity and MEV protection mechanisms achieve {protocol_analysis['innovation_index']:.1f}/10 innovation index with automated market making optimization.")
-        elif "Moonwell" in protocol:
-            details.append(f"Moonwell's cross-chain lending architecture shows {protocol_analysis['adoption_rate']:.1%} adoption rate with advanced liquidation protection and yield optimization algorithms.")
-        elif "Radiant" in protocol:
-            details.append(f"Radiant Capital's omnichain infrastructure achieves {protocol_analysis['liquidity_score']:.1f}/10 liquidity efficiency with cross-chain arbitrage opportunities and enhanced yield mechanisms.")
-        elif "Curve" in protocol:
-            details.append(f"Curve's stablecoin optimization algorithms minimize impermanent loss with {protocol_analysis['performance_score']:.1f}/10 performance score and advanced AMM mechanisms.")
-    return " ".join(details)
+    templates = [protocol_template(protocol) for protocol in protocols]
+    return " ".join(template.format_map(protocol_analysis) for template in templates if template)
 
 def generate_protocol_details(protocols: List[str]) -> str:
     """Legacy function for backward compatibility"""
@@ -247,17 +488,40 @@ def generate_protocol_details(protocols: List[str]) -> str:
         'performance_score': 8.5, 'innovation_index': 8.0, 'adoption_rate': 0.25
     })
 
-async def generate_execution_steps(strategy_name: str, opportunities: List[Any]) -> List[Dict[str, Any]]:
+@dataclass(frozen=True)
+class AnalysisContext:
+    """Market, protocol and risk analyses computed once per strategy card"""
+    market: Dict[str, Any]
+    protocol_analysis: Dict[str, Any]
+    risk_metrics: Dict[str, Any]
+
+async def build_analysis_context(
+    strategy_name: str,
+    opportunities: List[Any],
+    summary: OpportunitySummary,
+    market_data: Dict[str, Any]
+) -> AnalysisContext:
+    """Run the protocol and risk analyses for a strategy alongside the shared market snapshot"""
+    protocol_analysis, risk_metrics = await asyncio.gather(
+        analyze_protocol_intelligence(list(summary.protocols)),
+        calculate_advanced_risk_metrics(opportunities, strategy_name)
+    )
+    return AnalysisContext(market=market_data, protocol_analysis=protocol_analysis, risk_metrics=risk_metrics)
+
+def generate_execution_steps(
+    strategy_name: str,
+    summary: OpportunitySummary,
+    context: AnalysisContext
+) -> List[Dict[str, Any]]:
     """Generate sophisticated execution steps with advanced AI analysis"""
     
-    protocols = [opp.protocol for opp in opportunities]
-    chains = list(set([opp.chain for opp in opportunities]))
-    avg_apy = sum(opp.apy for opp in opportunities) / len(opportunities) if opportunities else 0
+    chains = summary.chains
+    avg_apy = summary.avg_apy
     
-    # Get advanced metrics for detailed step descriptions
-    market_conditions = await analyze_real_market_conditions()
-    risk_metrics = await calculate_advanced_risk_metrics(opportunities, strategy_name)
-    protocol_analysis = await analyze_protocol_intelligence(protocols)
+    # Advanced metrics for detailed step descriptions
+    market_conditions = context.market
+    risk_metrics = context.risk_metrics
+    protocol_analysis = context.protocol_analysis
     
     steps = [
         {
@@ -265,7 +529,7 @@ async def generate_execution_steps(strategy_name: str, opportunities: List[Any])
             "title": "Advanced Market Intelligence & Opportunity Discovery",
             "description": "AI-powered market analysis using machine learning models and real-time data aggregation",
             "status": "completed",
-            "details": f"Sophisticated AI analysis processed {len(protocols)} protocols across {len(chains)} chains using ensemble models. Identified {avg_apy:.2f}% APY opportunity ({protocol_analysis['yield_percentile']:.1f}th percentile) with {risk_metrics['confidence_interval']:.1f}% confidence interval. Market volatility: {market_conditions['volatility_score']:.1f}/10, TVL: ${market_conditions['total_tvl']:.1f}B.",
+            "details": f"Sophisticated AI analysis processed {summary.count} protocols across {len(chains)} chains using ensemble models. Identified {avg_apy:.2f}% APY opportunity ({protocol_analysis['yield_percentile']:.1f}th percentile) with {risk_metrics['confidence_interval']:.1f}% confidence interval. Market volatility: {market_conditions['volatility_score']:.1f}/10, TVL: ${market_conditions['total_tvl']:.1f}B.",
             "impact": "high",
             "timeEstimate": "2-5 min"
         },
@@ -318,11 +582,11 @@ async def generate_execution_steps(strategy_name: str, opportunities: List[Any])
     
     return steps
 
-async def analyze_market_conditions() -> Dict[str, Any]:
+async def analyze_market_conditions(market_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Analyze sophisticated market conditions with advanced metrics"""
     
-    # Get real market conditions for enhanced analysis
-    market_data = await analyze_real_market_conditions()
+    # Get real market conditions for enhanced analysis unless the caller already has them
+    market_data = market_data or await analyze_real_market_conditions()
     
     return {
         "volatility": market_data['volatility_score'],
@@ -334,192 +598,260 @@ async def analyze_market_conditions() -> Dict[str, Any]:
         "defi_growth_rate": market_data['defi_growth_rate']
     }
 
-async def generate_backtest_data(risk_profile: str) -> Dict[str, Any]:
-    """Generate PLAUSIBLE backtest data based on strategy risk profile (WOW FACTOR: defensible estimates)"""
-    import random
+# Plausible returns based on risk profile (HONEST: realistic for 6 months)
+BACKTEST_BASE_METRICS = {
+    "conservative": {"return": 4.5, "sharpe": 1.8, "drawdown": -3.2, "winRate": 88},
+    "balanced": {"return": 9.2, "sharpe": 2.1, "drawdown": -5.8, "winRate": 82},
+    "aggressive": {"return": 15.6, "sharpe": 1.6, "drawdown": -9.4, "winRate": 76}
+}
+
+# Variation drawn around each base value
+BACKTEST_METRICS = metric_schema(
+    ("totalReturn", -1.5, 2.0, 1),
+    ("sharpeRatio", -0.2, 0.3, 2),
+    ("maxDrawdown", -1.0, 1.5, 1),
+    ("sortinoRatio", -0.2, 0.3, 2),  # Downside-focused Sharpe
+    ("calmarRatio", -0.3, 0.5, 2),  # Return/Drawdown
+    ("var95", -0.5, 1.0, 1),  # 95% confidence loss
+    ("alpha", -1.0, 2.0, 1)  # Excess returns vs benchmark
+)
 
-    # Plausible returns based on risk profile (HONEST: realistic for 6 months)
-    base_metrics = {
-        "conservative": {"return": 4.5, "sharpe": 1.8, "drawdown": -3.2, "winRate": 88},
-        "balanced": {"return": 9.2, "sharpe": 2.1, "drawdown": -5.8, "winRate": 82},
-        "aggressive": {"return": 15.6, "sharpe": 1.6, "drawdown": -9.4, "winRate": 76}
-    }
+# Base values per risk profile, in BACKTEST_METRICS order
+BACKTEST_BASES = {
+    profile: np.array([
+        m["return"],
+        m["sharpe"],
+        m["drawdown"],
+        m["sharpe"] * 1.3,
+        abs(m["return"] / m["drawdown"]),
+        abs(m["drawdown"]) * 0.8,
+        m["return"] * 0.4
+    ])
+    for profile, m in BACKTEST_BASE_METRICS.items()
+}
 
-    metrics = base_metrics.get(risk_profile, base_metrics["balanced"])
+async def generate_backtest_data(risk_profile: str) -> Dict[str, Any]:
+    """Generate PLAUSIBLE backtest data based on strategy risk profile (WOW FACTOR: defensible estimates)"""
+    if risk_profile not in BACKTEST_BASE_METRICS:
+        risk_profile = "balanced"
 
     # Add small variations to make each strategy unique
     return {
         "timeframe": "6 months (historical simulation)",
-        "totalReturn": round(metrics["return"] + random.uniform(-1.5, 2.0), 1),
-        "sharpeRatio": round(metrics["sharpe"] + random.uniform(-0.2, 0.3), 2),
-        "maxDrawdown": round(metrics["drawdown"] + random.uniform(-1.0, 1.5), 1),
-        "winRate": metrics["winRate"] + random.randint(-3, 5),
+        "winRate": BACKTEST_BASE_METRICS[risk_profile]["winRate"] + int(rng.integers(-3, 5, endpoint=True)),
         # Advanced metrics (WOW FACTOR: simplified but defensible)
-        "sortinoRatio": round(metrics["sharpe"] * 1.3 + random.uniform(-0.2, 0.3), 2),  # Downside-focused Sharpe
-        "calmarRatio": round(abs(metrics["return"] / metrics["drawdown"]) + random.uniform(-0.3, 0.5), 2),  # Return/Drawdown
-        "var95": round(abs(metrics["drawdown"]) * 0.8 + random.uniform(-0.5, 1.0), 1),  # 95% confidence loss
-        "alpha": round(metrics["return"] * 0.4 + random.uniform(-1.0, 2.0), 1)  # Excess returns vs benchmark
+        **draw_metrics(BACKTEST_METRICS, BACKTEST_BASES[risk_profile])
     }
 
-def get_strategy_features(strategy_name: str) -> List[str]:
+# Static per-strategy card content, shared read-only by every request
+DEFAULT_STRATEGY_LABELS = ("AI Optimized", "Advanced Analytics")
+
+STRATEGY_FEATURES = MappingProxyType({
+    "conservative": (
+        "Monte Carlo Risk Modeling",
+        "VaR Analysis",
+        "Institutional Grade Security",
+        "Automated Liquidation Protection",
+        "Dynamic Interest Rate Optimization",
+        "Multi-Factor Authentication"
+    ),
+    "balanced": (
+        "Cross-Chain Arbitrage",
+        "MEV Protection",
+        "Automated Rebalancing",
+        "Gas Optimization",
+        "Yield Compounding",
+        "Real-Time Risk Monitoring"
+    ),
+    "aggressive": (
+        "Advanced AI Algorithms",
+        "Cross-Chain MEV Capture",
+        "Dynamic Position Sizing",
+        "Machine Learning Optimization",
+        "High-Frequency Rebalancing",
+        "Sophisticated Risk Management"
+    )
+})
+
+def get_strategy_features(strategy_name: str) -> Tuple[str, ...]:
     """Get sophisticated strategy-specific features"""
-    features_map = {
-        "conservative": [
-            "Monte Carlo Risk Modeling", 
-            "VaR Analysis", 
-            "Institutional Grade Security",
-            "Automated Liquidation Protection",
-            "Dynamic Interest Rate Optimization",
-            "Multi-Factor Authentication"
-        ],
-        "balanced": [
-            "Cross-Chain Arbitrage", 
-            "MEV Protection", 
-            "Automated Rebalancing",
-            "Gas Optimization",
-            "Yield Compounding",
-            "Real-Time Risk Monitoring"
-        ],
-        "aggressive": [
-            "Advanced AI Algorithms", 
-            "Cross-Chain MEV Capture", 
-            "Dynamic Position Sizing",
-            "Machine Learning Optimization",
-            "High-Frequency Rebalancing",
-            "Sophisticated Risk Management"
-        ]
-    }
-    return features_map.get(strategy_name, ["AI Optimized", "Advanced Analytics"])
-
-def get_strategy_tags(strategy_name: str) -> List[str]:
+    return STRATEGY_FEATURES.get(strategy_name, DEFAULT_STRATEGY_LABELS)
+
+STRATEGY_TAGS = MappingProxyType({
+    "conservative": (
+        "Institutional Grade",
+        "Battle Tested",
+        "Low Risk",
+        "High Security",
+        "Stable Returns",
+        "Audited Protocols"
+    ),
+    "balanced": (
+        "Multi-Chain",
+        "Optimized Returns",
+        "Risk-Adjusted",
+        "Automated",
+        "Cross-Chain",
+        "Yield Farming"
+    ),
+    "aggressive": (
+        "AI Powered",
+        "High Performance",
+        "Advanced Analytics",
+        "Cross-Chain",
+        "MEV Protection",
+        "Dynamic Optimization"
+    )
+})
+
+def get_strategy_tags(strategy_name: str) -> Tuple[str, ...]:
     """Get sophisticated strategy-specific tags"""
-    tags_map = {
-        "conservative": [
-            "Institutional Grade", 
-            "Battle Tested", 
-            "Low Risk",
-            "High Security",
-            "Stable Returns",
-            "Audited Protocols"
-        ],
-        "balanced": [
-            "Multi-Chain", 
-            "Optimized Returns", 
-            "Risk-Adjusted",
-            "Automated",
-            "Cross-Chain",
-            "Yield Farming"
-        ],
-        "aggressive": [
-            "AI Powered", 
-            "High Performance", 
-            "Advanced Analytics",
-            "Cross-Chain",
-            "MEV Protection",
-            "Dynamic Optimization"
-        ]
-    }
-    return tags_map.get(strategy_name, ["AI Optimized", "Advanced Analytics"])
+    return STRATEGY_TAGS.get(strategy_name, DEFAULT_STRATEGY_LABELS)
+
+STRATEGY_ICONS = MappingProxyType({
+    "conservative": "🛡️",
+    "balanced": "⚖️",
+    "aggressive": "⚡"
+})
 
 def get_strategy_icon(strategy_name: str) -> str:
     """Get sophisticated strategy-specific icons"""
-    icons_map = {
-        "conservative": "🛡️",
-        "balanced": "⚖️",
-        "aggressive": "⚡"
-    }
-    return icons_map.get(strategy_name, "🤖")
-
-def calculate_performance_score(opportunities: List[Any], protocols: List[str]) -> int:
+    return STRATEGY_ICONS.get(strategy_name, "🤖")
+
+STRATEGY_RISK_LEVELS = MappingProxyType({
+    "conservative": "Low",
+    "balanced": "Medium",
+    "aggressive": "High"
+})
+
+STRATEGY_DESCRIPTIONS = MappingProxyType({
+    "conservative": "Lowest risk, stable returns in proven protocols",
+    "balanced": "Moderate risk with optimized allocation",
+    "aggressive": "Higher risk for maximum yield opportunities"
+})
+
+STRATEGY_DETAIL_TEMPLATE = (
+    "This AI-optimized {name} strategy leverages advanced algorithms to maximize yield while "
+    "maintaining {name} risk exposure across {chains} chains. {aptos_note}The strategy uses "
+    "dynamic rebalancing and intelligent protocol selection for optimal returns."
+)
+APTOS_DETAIL_NOTE = "🟣 Includes Aptos ecosystem for enhanced yields. "
+
+# Protocol reputation bonus for the performance score (0-15 points)
+PROTOCOL_PERFORMANCE_BONUSES = MappingProxyType({
+    "Aave": 15,
+    "Compound": 15,
+    "Curve": 12,
+    "Uniswap": 12,
+    "Moonwell": 8,
+    "Radiant": 8,
+    "Thala Finance": 6,
+    "Liquidswap": 6,
+    "Aries Markets": 4,
+})
+
+def calculate_performance_score(summary: OpportunitySummary, protocols: Sequence[str]) -> int:
     """Calculate performance score from REAL protocol data"""
 
-    if not opportunities:
+    if not summary.count:
         return 78
 
-    # HONEST: Calculate from actual data
-    avg_apy = sum(opp.apy for opp in opportunities) / len(opportunities)
-    avg_risk = sum(opp.riskScore for opp in opportunities) / len(opportunities)
-    total_tvl = sum(opp.tvl for opp in opportunities)
-
     # Base score from APY (0-35 points)
-    apy_score = min(35, avg_apy * 1.8)
+    apy_score = min(35, summary.avg_apy * 1.8)
 
     # Risk score: lower risk = higher score (0-25 points)
-    risk_score = max(0, 25 - (avg_risk / 4))
+    risk_score = max(0, 25 - (summary.avg_risk / 4))
 
     # TVL score: higher TVL = more confidence (0-20 points)
-    tvl_millions = total_tvl / 1_000_000
+    tvl_millions = summary.total_tvl / 1_000_000
     tvl_score = min(20, tvl_millions / 50)  # $1M TVL = 0.4 points
 
     # Protocol reputation bonus (0-15 points)
-    protocol_bonuses = {
-        "Aave": 15,
-        "Compound": 15,
-        "Curve": 12,
-        "Uniswap": 12,
-        "Moonwell": 8,
-        "Radiant": 8,
-        "Thala Finance": 6,
-        "Liquidswap": 6,
-        "Aries Markets": 4,
-    }
-    protocol_score = max([protocol_bonuses.get(p, 5) for p in protocols] if protocols else [5])
+    protocol_score = max((PROTOCOL_PERFORMANCE_BONUSES.get(p, 5) for p in protocols), default=5)
 
     # Diversification bonus (0-5 points)
-    diversification_score = min(5, len(opportunities) * 1.5)
+    diversification_score = min(5, summary.count * 1.5)
 
     total_score = apy_score + risk_score + tvl_score + protocol_score + diversification_score
 
     return min(98, max(65, int(total_score)))
 
+STRATEGY_FEES = MappingProxyType({
+    "conservative": 0.15,  # Lower fees for conservative strategies
+    "balanced": 0.35,      # Moderate fees for balanced strategies
+    "aggressive": 0.75     # Higher fees for aggressive strategies
+})
+
 def calculate_total_fees(strategy_name: str) -> float:
     """Calculate sophisticated fee structure for strategy"""
-    fees_map = {
-        "conservative": 0.15,  # Lower fees for conservative strategies
-        "balanced": 0.35,      # Moderate fees for balanced strategies
-        "aggressive": 0.75     # Higher fees for aggressive strategies
-    }
-    return fees_map.get(strategy_name, 0.35)
+    return STRATEGY_FEES.get(strategy_name, 0.35)
+
+AI_VALIDATION_METRICS = metric_schema(
+    ("accuracy", 94.2, 98.7, 1),
+    ("precision", 92.8, 97.3, 1),
+    ("recall", 91.5, 96.8, 1),
+    ("f1_score", 93.1, 97.0, 1),
+    ("var_calculation_accuracy", 96.5, 99.2, 1),
+    ("correlation_analysis", 94.8, 98.1, 1),
+    ("prediction_accuracy", 89.3, 95.7, 1),
+    ("security_score", 8.7, 9.8, 1),
+    ("audit_coverage", 92.3, 98.6, 1),
+    ("governance_maturity", 8.1, 9.5, 1),
+    ("innovation_index", 8.4, 9.7, 1),
+    ("gas_efficiency", 18.7, 32.4, 1),
+    ("slippage_protection", 94.2, 98.9, 1),
+    ("mev_protection", 91.8, 97.3, 1),
+    ("execution_success_rate", 96.8, 99.1, 1),
+    ("overall_ai_confidence", 94.5, 98.2, 1)
+)
 
 @app.get("/api/ai-validation")
 async def ai_validation():
     """Advanced AI validation endpoint for hackathon demonstration"""
+    return json_body_response(await cached_response("ai-validation", 60, build_ai_validation))
+
+async def build_ai_validation() -> Dict[str, Any]:
+    """Build the AI validation report served by /api/ai-validation"""
     try:
         # Simulate sophisticated AI validation
+        metrics = draw_metrics(AI_VALIDATION_METRICS)
+        simulations, data_sources, real_time_feeds, latency_ms = rng.integers(
+            (10000, 15, 8, 45), (50000, 25, 12, 120), endpoint=True
+        ).tolist()
         validation_results = {
             "ai_model_version": "CrossYield-AI-v2.1.0",
-            "validation_timestamp": datetime.now().isoformat(),
+            "validation_timestamp": now_iso(),
             "model_performance": {
-                "accuracy": round(random.uniform(94.2, 98.7), 1),
-                "precision": round(random.uniform(92.8, 97.3), 1),
-                "recall": round(random.uniform(91.5, 96.8), 1),
-                "f1_score": round(random.uniform(93.1, 97.0), 1)
+                "accuracy": metrics["accuracy"],
+                "precision": metrics["precision"],
+                "recall": metrics["recall"],
+                "f1_score": metrics["f1_score"]
             },
             "risk_modeling": {
-                "monte_carlo_simulations": random.randint(10000, 50000),
-                "var_calculation_accuracy": round(random.uniform(96.5, 99.2), 1),
-                "correlation_analysis": round(random.uniform(94.8, 98.1), 1),
+                "monte_carlo_simulations": simulations,
+                "var_calculation_accuracy": metrics["var_calculation_accuracy"],
+                "correlation_analysis": metrics["correlation_analysis"],
                 "stress_test_results": "PASSED"
             },
             "market_intelligence": {
-                "data_sources": random.randint(15, 25),
-                "real_time_feeds": random.randint(8, 12),
-                "prediction_accuracy": round(random.uniform(89.3, 95.7), 1),
-                "latency_ms": random.randint(45, 120)
+                "data_sources": data_sources,
+                "real_time_feeds": real_time_feeds,
+                "prediction_accuracy": metrics["prediction_accuracy"],
+                "latency_ms": latency_ms
             },
             "protocol_analysis": {
-                "security_score": round(random.uniform(8.7, 9.8), 1),
-                "audit_coverage": round(random.uniform(92.3, 98.6), 1),
-                "governance_maturity": round(random.uniform(8.1, 9.5), 1),
-                "innovation_index": round(random.uniform(8.4, 9.7), 1)
+                "security_score": metrics["security_score"],
+                "audit_coverage": metrics["audit_coverage"],
+                "governance_maturity": metrics["governance_maturity"],
+                "innovation_index": metrics["innovation_index"]
             },
             "execution_optimization": {
-                "gas_efficiency": round(random.uniform(18.7, 32.4), 1),
-                "slippage_protection": round(random.uniform(94.2, 98.9), 1),
-                "mev_protection": round(random.uniform(91.8, 97.3), 1),
-                "execution_success_rate": round(random.uniform(96.8, 99.1), 1)
+                "gas_efficiency": metrics["gas_efficiency"],
+                "slippage_protection": metrics["slippage_protection"],
+                "mev_protection": metrics["mev_protection"],
+                "execution_success_rate": metrics["execution_success_rate"]
             },
-            "overall_ai_confidence": round(random.uniform(94.5, 98.2), 1)
+            "overall_ai_confidence": metrics["overall_ai_confidence"]
         }
         
         return {
@@ -539,26 +871,37 @@ async def root():
         "status": "running",
         "service": "CrossYield AI Optimizer",
         "version": "1.0.0",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
-@app.get("/health")
-async def health_check():
-    """Detailed health check"""
-    chain_status = {}
-    for chain in ["ethereum_sepolia", "base_sepolia", "arbitrum_sepolia"]:
-        try:
-            w3 = contract_manager.web3_clients.get(chain)
-            chain_status[chain] = "connected" if w3 and w3.is_connected() else "disconnected"
-        except:
-            chain_status[chain] = "error"
-
+async def probe_chain(chain: str, timeout: float = 1.5) -> str:
+    """Check RPC connectivity for chain, bounded by timeout"""
+    try:
+        w3 = get_async_web3(chain)
+        connected = await asyncio.wait_for(w3.is_connected(), timeout)
+        return "connected" if connected else "disconnected"
+    except asyncio.TimeoutError:
+        return "timeout"
+    except Exception:
+        return "error"
+
+# Health bodies are shared for a few seconds so liveness checks don't each hit every RPC
+HEALTH_CACHE_TTL = 5
+
+async def build_health() -> Dict[str, Any]:
+    """Probe every supported chain concurrently and build the /health body"""
+    statuses = await asyncio.gather(*[probe_chain(chain) for chain in SUPPORTED_CHAINS])
     return {
         "status": "healthy",
-        "chains": chain_status,
-        "timestamp": datetime.now().isoformat()
+        "chains": dict(zip(SUPPORTED_CHAINS, statuses)),
+        "timestamp": now_iso()
     }
 
+@app.get("/health")
+async def health_check():
+    """Detailed health check; timestamp is when the chains were last probed"""
+    return json_body_response(await cached_response("health", HEALTH_CACHE_TTL, build_health))
+
 @app.post("/api/optimization-request")
 async def request_optimization(request: OptimizationRequest):
     """Handle optimization request from frontend"""
@@ -575,6 +918,26 @@ async def request_optimization(request: OptimizationRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+async def scan_chain_wallet_value(address: str, chain: str) -> float:
+    """Get smart wallet value (idle USDC + allocated) for address on chain
+
+    Two round trips: hasWallet and getWallet together in one Multicall3
+    eth_call, then getWalletSummary on the wallet itself.
+    """
+    w3 = get_async_web3(chain)
+    factory = contract_manager.get_contract(chain, "smartWalletFactory")
+    (has_ok, has_data), (wallet_ok, wallet_data) = await get_async_multicall(chain).functions.aggregate3([
+        (factory.address, True, factory.encode_abi("hasWallet", args=[address])),
+        (factory.address, True, factory.encode_abi("getWallet", args=[address]))
+    ]).call()
+    if not (has_ok and wallet_ok) or not w3.codec.decode(["bool"], has_data)[0]:
+        return 0
+
+    wallet_address = w3.to_checksum_address(w3.codec.decode(["address"], wallet_data)[0])
+    summary = await w3.eth.call({"to": wallet_address, "data": WALLET_SUMMARY_CALLDATA})
+    usdc_balance, total_allocated, _, _ = w3.codec.decode(WALLET_SUMMARY_TYPES, summary)
+    return usdc_balance + total_allocated
+
 @app.get("/api/portfolio/{address}")
 async def get_portfolio(address: str):
     """Get user portfolio information"""
@@ -586,223 +949,255 @@ async def get_portfolio(address: str):
             "recentActivity": []
         }
 
-        total_value = 0
-
-        # Check each chain for user's smart wallets
-        for chain in ["ethereum_sepolia", "base_sepolia", "arbitrum_sepolia"]:
-            try:
-                factory = contract_manager.get_contract(chain, "smartWalletFactory")
-                has_wallet = factory.functions.hasWallet(address).call()
-
-                if has_wallet:
-                    wallet_summary = contract_manager.get_wallet_summary(address, chain)
-                    if wallet_summary:
-                        total_value += wallet_summary.usdcBalance + wallet_summary.totalAllocated
-            except Exception as e:
-                continue
+        # Check each chain for user's smart wallets concurrently
+        values = await asyncio.gather(
+            *[scan_chain_wallet_value(address, chain) for chain in SUPPORTED_CHAINS],
+            return_exceptions=True
+        )
 
-        portfolio_data["totalValue"] = total_value
+        portfolio_data["totalValue"] = sum(v for v in values if not isinstance(v, BaseException))
         return portfolio_data
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+async def build_strategy(
+    filter_name: str,
+    risk_profile: str,
+    opportunities: List[Any],
+    summary: OpportunitySummary,
+    best_evm_apy: float,
+    aptos_opportunity_count: int,
+    market_data: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build one strategy card for a filter's APY-sorted opportunities
+
+    summary aggregates those opportunities and is shared by the filter's
+    three cards; best_evm_apy (over every chain) is the baseline for the
+    Aptos boost; market_data is the request's market snapshot, shared by
+    every card so their market figures agree.
+    """
+    log_ai_start(f"Strategy: {filter_name} - {risk_profile}", {"filter": filter_name, "risk": risk_profile})
+    strategy_start = time.time()
+
+    # Calculate expected APY based on risk profile: conservative takes
+    # the single best low-risk opportunity, the others split across the top APYs
+    if risk_profile == "conservative":
+        pool = [o for o in opportunities if o.riskScore <= 30] or opportunities
+    else:
+        pool = opportunities
+    weights = next(w for w in LISTING_WEIGHTS[risk_profile] if len(w) <= len(pool))
+    selected = pool[:len(weights)]
+
+    expected_apy = weighted_apy(weights, selected)
+    protocols = list(map(_get_protocol, selected))
+    chains = list(dict.fromkeys(map(_get_chain, selected)))
+
+    # Calculate Aptos boost (if Aptos is included)
+    has_aptos = any(chain == 'aptos' for chain in chains)
+    if has_aptos:
+        aptos_boost = expected_apy - best_evm_apy if expected_apy > best_evm_apy else 0
+    else:
+        aptos_boost = 0
+
+    # Calculate yields for $10k example
+    daily_yield = (10000 * expected_apy / 100) / 365
+    monthly_yield = daily_yield * 30
+
+    # Analyses, AI reasoning, market conditions and backtest are independent
+    context, ai_reasoning, market_conditions, backtest_data = await asyncio.gather(
+        build_analysis_context(risk_profile, opportunities, summary, market_data),
+        generate_ai_reasoning(risk_profile, summary),
+        analyze_market_conditions(market_data),
+        generate_backtest_data(risk_profile)
+    )
+    execution_steps = generate_execution_steps(risk_profile, summary, context)
+
+    # Enhanced strategy object with AI reasoning and Aptos support
+    strategy = {
+        "id": f"{filter_name}_{risk_profile}",
+        "name": risk_profile,
+        "title": risk_profile.title(),
+        "filter": filter_name,
+        "expectedAPY": round(expected_apy, 2),
+        "dailyYield": round(daily_yield, 2),
+        "monthlyYield": round(monthly_yield, 0),
+        "protocols": protocols,
+        "chains": chains,
+        "riskLevel": STRATEGY_RISK_LEVELS[risk_profile],
+        "description": STRATEGY_DESCRIPTIONS[risk_profile],
+        "detailedDescription": STRATEGY_DETAIL_TEMPLATE.format(
+            name=risk_profile,
+            chains=", ".join(chains),
+            aptos_note=APTOS_DETAIL_NOTE if has_aptos else ""
+        ),
+        "aiReasoning": ai_reasoning,
+        "strategySteps": execution_steps,
+        "marketConditions": market_conditions,
+        "backtest": backtest_data,
+        "features": STRATEGY_FEATURES[risk_profile],
+        "tags": STRATEGY_TAGS[risk_profile],
+        "performanceScore": calculate_performance_score(summary, protocols),
+        "tvl": summary.total_tvl if summary.count else 1000000,
+        "fees": calculate_total_fees(risk_profile),
+        "minDeposit": 1,
+        "maxDeposit": 100000,
+        "lastUpdated": now_iso(),
+        "aiOptimized": True,
+        "status": "Active",
+        "icon": STRATEGY_ICONS[risk_profile],
+        # Aptos-specific metadata
+        "includesAptos": has_aptos,
+        "aptosBoost": round(aptos_boost, 2) if has_aptos else 0,
+        "requiresBridge": has_aptos,
+        "aptosProtocols": [p for i, p in enumerate(protocols) if i < len(chains) and chains[i] == 'aptos'] if has_aptos else [],
+        "evmProtocols": [p for i, p in enumerate(protocols) if i < len(chains) and chains[i] != 'aptos'],
+        "crossChain": len(set(chains)) > 1,
+        "aptosOpportunityCount": aptos_opportunity_count
+    }
+
+    log_data_fetch(f"Strategy {filter_name} - {risk_profile}", len(opportunities), time.time() - strategy_start)
+    return strategy
+
 @app.get("/api/strategies")
 async def get_strategies():
     """Get available strategies with AI reasoning and execution steps (including Aptos)"""
-    start_time = time.time()
-    log_ai_start("Enhanced Strategy Analysis with Aptos", {"endpoint": "/api/strategies"})
+    return json_body_response(await cached_response("strategies", 30, build_strategies))
 
+@app.get("/api/strategies/stream")
+async def stream_strategies():
+    """Stream strategies as NDJSON, one line per strategy as soon as it is built
+
+    Each strategy is serialized and released as it completes, so only
+    running totals are held for the closing summary line.
+    """
+    start_time = time.time()
+    log_ai_start("Enhanced Strategy Analysis with Aptos", {"endpoint": "/api/strategies/stream"})
     try:
-        strategies = []
-
-        # Get all opportunities including Aptos once
-        all_opportunities_dict = await enhanced_aggregator.fetch_all_opportunities(include_aptos=True)
-        aptos_opportunities = all_opportunities_dict['aptos']
-        all_opportunities = all_opportunities_dict['all']
-
-        # Define filters and their corresponding chains
-        filters = {
-            "overall": all_opportunities,  # All chains
-            "ethereum": [o for o in all_opportunities if o.chain == "ethereum_sepolia"],
-            "base": [o for o in all_opportunities if o.chain == "base_sepolia"],
-            "arbitrum": [o for o in all_opportunities if o.chain == "arbitrum_sepolia"],
-            "aptos": aptos_opportunities  # Aptos only
-        }
+        builds = await plan_strategy_builds()
+    except Exception as e:
+        log_ai_error("Strategy Stream", e, {"endpoint": "/api/strategies/stream"})
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Generate strategies for each filter
-        for filter_name, filter_opportunities in filters.items():
-            log_ai_start(f"Generating strategies for filter: {filter_name}", {"filter": filter_name})
-
-            # Sort by APY for each filter
-            opportunities = sorted(filter_opportunities, key=lambda x: x.apy, reverse=True)
-
-            # Generate 3 risk profiles for this filter
-            for risk_profile in ["conservative", "balanced", "aggressive"]:
-                log_ai_start(f"Strategy: {filter_name} - {risk_profile}", {"filter": filter_name, "risk": risk_profile})
-                strategy_start = time.time()
-
-                # Skip if no opportunities for this filter
-                if not opportunities:
-                    continue
-
-                strategy_duration = time.time() - strategy_start
-                log_data_fetch(f"Strategy {filter_name} - {risk_profile}", len(opportunities), strategy_duration)
-
-                # Separate opportunities by risk level
-                low_risk_opps = [o for o in opportunities if o.riskScore <= 30]
-                medium_risk_opps = [o for o in opportunities if 30 < o.riskScore <= 60]
-                high_risk_opps = [o for o in opportunities if o.riskScore > 60]
-
-                # Calculate expected APY based on risk profile
-                if risk_profile == "conservative":
-                    # Conservative: Lowest risk, single best opportunity
-                    if low_risk_opps:
-                        expected_apy = low_risk_opps[0].apy
-                        protocols = [low_risk_opps[0].protocol]
-                        chains = [low_risk_opps[0].chain]
-                    else:
-                        expected_apy = opportunities[0].apy
-                        protocols = [opportunities[0].protocol]
-                        chains = [opportunities[0].chain]
-                elif risk_profile == "balanced":
-                    # Balanced: Mix of opportunities with 65/35 split
-                    if len(opportunities) >= 2:
-                        expected_apy = (opportunities[0].apy * 0.65) + (opportunities[1].apy * 0.35)
-                        protocols = [opportunities[0].protocol, opportunities[1].protocol]
-                        chains = list(set([opportunities[0].chain, opportunities[1].chain]))
-                    else:
-                        expected_apy = opportunities[0].apy
-                        protocols = [opportunities[0].protocol]
-                        chains = [opportunities[0].chain]
-                elif risk_profile == "aggressive":
-                    # Aggressive: Focus on highest APY opportunities
-                    if len(opportunities) >= 3:
-                        percentages = [0.7, 0.2, 0.1]
-                        expected_apy = sum(
-                            opp.apy * percentages[i]
-                            for i, opp in enumerate(opportunities[:3])
-                        )
-                        protocols = [opp.protocol for opp in opportunities[:3]]
-                        chains = list(set([opp.chain for opp in opportunities[:3]]))
-                    elif len(opportunities) >= 2:
-                        percentages = [0.8, 0.2]
-                        expected_apy = sum(
-                            opp.apy * percentages[i]
-                            for i, opp in enumerate(opportunities[:2])
-                        )
-                        protocols = [opp.protocol for opp in opportunities[:2]]
-                        chains = list(set([opp.chain for opp in opportunities[:2]]))
-                    else:
-                        expected_apy = opportunities[0].apy
-                        protocols = [opportunities[0].protocol]
-                        chains = [opportunities[0].chain]
-                else:
-                    # Fallback
-                    expected_apy = opportunities[0].apy
-                    protocols = [opportunities[0].protocol]
-                    chains = [opportunities[0].chain]
-
-                # Calculate Aptos boost (if Aptos is included)
-                has_aptos = any(chain == 'aptos' for chain in chains)
-                if has_aptos:
-                    evm_opps = [o for o in all_opportunities if o.chain != 'aptos']
-                    best_evm_apy = max([o.apy for o in evm_opps]) if evm_opps else 0
-                    aptos_boost = expected_apy - best_evm_apy if expected_apy > best_evm_apy else 0
-                else:
-                    aptos_boost = 0
-
-                # Calculate yields for $10k example
-                daily_yield = (10000 * expected_apy / 100) / 365
-                monthly_yield = daily_yield * 30
-
-                # Generate AI reasoning
-                ai_reasoning = await generate_ai_reasoning(risk_profile, opportunities)
-
-                # Generate execution steps
-                execution_steps = await generate_execution_steps(risk_profile, opportunities)
-
-                # Generate market conditions
-                market_conditions = await analyze_market_conditions()
-
-                # Generate backtest data
-                backtest_data = await generate_backtest_data(risk_profile)
-
-                # Enhanced strategy object with AI reasoning and Aptos support
-                strategy = {
-                    "id": f"{filter_name}_{risk_profile}",
-                    "name": risk_profile,
-                    "title": risk_profile.title(),
-                    "filter": filter_name,
-                    "expectedAPY": round(expected_apy, 2),
-                    "dailyYield": round(daily_yield, 2),
-                    "monthlyYield": round(monthly_yield, 0),
-                    "protocols": protocols,
-                    "chains": chains,
-                    "riskLevel": {
-                        "conservative": "Low",
-                        "balanced": "Medium",
-                        "aggressive": "High"
-                    }[risk_profile],
-                    "description": {
-                        "conservative": "Lowest risk, stable returns in proven protocols",
-                        "balanced": "Moderate risk with optimized allocation",
-                        "aggressive": "Higher risk for maximum yield opportunities"
-                    }[risk_profile],
-                    "detailedDescription": f"This AI-optimized {risk_profile} strategy leverages advanced algorithms to maximize yield while maintaining {risk_profile} risk exposure across {', '.join(chains)} chains. {'🟣 Includes Aptos ecosystem for enhanced yields. ' if has_aptos else ''}The strategy uses dynamic rebalancing and intelligent protocol selection for optimal returns.",
-                    "aiReasoning": ai_reasoning,
-                    "strategySteps": execution_steps,
-                    "marketConditions": market_conditions,
-                    "backtest": backtest_data,
-                    "features": get_strategy_features(risk_profile),
-                    "tags": get_strategy_tags(risk_profile),
-                    "performanceScore": calculate_performance_score(opportunities, protocols),
-                    "tvl": sum(opp.tvl for opp in opportunities) if opportunities else 1000000,
-                    "fees": calculate_total_fees(risk_profile),
-                    "minDeposit": 1,
-                    "maxDeposit": 100000,
-                    "lastUpdated": datetime.now().isoformat(),
-                    "aiOptimized": True,
-                    "status": "Active",
-                    "icon": get_strategy_icon(risk_profile),
-                    # Aptos-specific metadata
-                    "includesAptos": has_aptos,
-                    "aptosBoost": round(aptos_boost, 2) if has_aptos else 0,
-                    "requiresBridge": has_aptos,
-                    "aptosProtocols": [p for i, p in enumerate(protocols) if i < len(chains) and chains[i] == 'aptos'] if has_aptos else [],
-                    "evmProtocols": [p for i, p in enumerate(protocols) if i < len(chains) and chains[i] != 'aptos'],
-                    "crossChain": len(set(chains)) > 1,
-                    "aptosOpportunityCount": len(aptos_opportunities)
-                }
+    async def ndjson() -> AsyncIterator[bytes]:
+        tasks = [asyncio.ensure_future(build) for build in builds]
+        count = strategies_with_aptos = 0
+        aptos_boost_total = 0.0
+        try:
+            for next_strategy in asyncio.as_completed(tasks):
+                strategy = await next_strategy
+                count += 1
+                strategies_with_aptos += strategy["includesAptos"]
+                aptos_boost_total += strategy["aptosBoost"]
+                yield dump_json({"strategy": strategy}) + b"\n"
+        except Exception as e:
+            # The 200 header is already out, so report the failure as the last line
+            log_ai_error("Strategy Stream", e, {"endpoint": "/api/strategies/stream", "streamed": count})
+            yield dump_json({"error": str(e)}) + b"\n"
+            return
+        finally:
+            # On failure or client disconnect, stop the builds nobody will read
+            for task in tasks:
+                task.cancel()
+
+        yield dump_json({
+            "exampleAmount": 10000,
+            "lastUpdated": now_iso(),
+            "totalStrategies": count,
+            "strategiesWithAptos": strategies_with_aptos
+        }) + b"\n"
+        log_strategy_run(count, strategies_with_aptos, aptos_boost_total, time.time() - start_time)
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+async def plan_strategy_builds() -> List[Coroutine[Any, Any, Dict[str, Any]]]:
+    """Fetch opportunities once and return one build_strategy coroutine per filter and risk profile"""
+    # Get all opportunities including Aptos once
+    all_opportunities_dict = await enhanced_aggregator.fetch_all_opportunities(include_aptos=True)
+    aptos_opportunities = all_opportunities_dict['aptos']
+    all_opportunities = all_opportunities_dict['all']
+
+    # One pass: partition by chain and find the best EVM APY for the Aptos boost
+    by_chain: Dict[str, List[Any]] = defaultdict(list)
+    best_evm_apy = None
+    for opp in all_opportunities:
+        by_chain[opp.chain].append(opp)
+        if opp.chain != 'aptos' and (best_evm_apy is None or opp.apy > best_evm_apy):
+            best_evm_apy = opp.apy
+
+    # Define filters and their corresponding chains
+    filters = {
+        "overall": all_opportunities,  # All chains
+        "ethereum": by_chain["ethereum_sepolia"],
+        "base": by_chain["base_sepolia"],
+        "arbitrum": by_chain["arbitrum_sepolia"],
+        "aptos": aptos_opportunities  # Aptos only
+    }
+
+    # One market snapshot for the whole response
+    market_data = await analyze_real_market_conditions()
+
+    # Generate 3 risk profiles for each filter
+    builds = []
+    for filter_name, filter_opportunities in filters.items():
+        log_ai_start(f"Generating strategies for filter: {filter_name}", {"filter": filter_name})
+
+        # Sort by APY for each filter
+        opportunities = sorted(filter_opportunities, key=_get_apy, reverse=True)
+
+        # Skip if no opportunities for this filter
+        if not opportunities:
+            continue
+        summary = summarize_opportunities(opportunities)
+
+        for risk_profile in ["conservative", "balanced", "aggressive"]:
+            builds.append(build_strategy(
+                filter_name, risk_profile, opportunities, summary, best_evm_apy or 0,
+                len(aptos_opportunities), market_data
+            ))
+
+    return builds
+
+def log_strategy_run(count: int, strategies_with_aptos: int, aptos_boost_total: float, total_duration: float):
+    """Log performance and completion metrics for one strategies build"""
+    avg_aptos_boost = aptos_boost_total / count if count else 0
+
+    log_performance_metrics({
+        "total_strategies": count,
+        "strategies_with_aptos": strategies_with_aptos,
+        "avg_aptos_boost": avg_aptos_boost,
+        "total_duration": total_duration,
+        "avg_strategy_duration": total_duration / count if count else 0,
+        "enhanced_features": ["ai_reasoning", "execution_steps", "market_conditions", "backtest_data", "aptos_integration"]
+    })
 
-                strategies.append(strategy)
+    log_ai_end("Enhanced Strategy Analysis with Aptos", {
+        "strategies_count": count,
+        "strategies_with_aptos": strategies_with_aptos,
+        "avg_aptos_boost": avg_aptos_boost,
+        "features_included": ["ai_reasoning", "execution_steps", "market_conditions", "backtest_data", "aptos_integration"]
+    }, total_duration)
+
+async def build_strategies() -> Dict[str, Any]:
+    """Build the /api/strategies response"""
+    start_time = time.time()
+    log_ai_start("Enhanced Strategy Analysis with Aptos", {"endpoint": "/api/strategies"})
+
+    try:
+        # All strategies concurrently
+        strategies = await asyncio.gather(*await plan_strategy_builds())
 
         total_duration = time.time() - start_time
         result = {
             "strategies": strategies,
             "exampleAmount": 10000,
-            "lastUpdated": datetime.now().isoformat()
+            "lastUpdated": now_iso()
         }
         
         # Calculate Aptos integration statistics
         strategies_with_aptos = sum(1 for s in strategies if s.get('includesAptos', False))
-        avg_aptos_boost = sum(s.get('aptosBoost', 0) for s in strategies) / len(strategies) if strategies else 0
-
-        log_performance_metrics({
-            "total_strategies": len(strategies),
-            "strategies_with_aptos": strategies_with_aptos,
-            "avg_aptos_boost": avg_aptos_boost,
-            "total_duration": total_duration,
-            "avg_strategy_duration": total_duration / len(strategies) if strategies else 0,
-            "enhanced_features": ["ai_reasoning", "execution_steps", "market_conditions", "backtest_data", "aptos_integration"]
-        })
-
-        log_ai_end("Enhanced Strategy Analysis with Aptos", {
-            "strategies_count": len(strategies),
-            "strategies_with_aptos": strategies_with_aptos,
-            "avg_aptos_boost": avg_aptos_boost,
-            "features_included": ["ai_reasoning", "execution_steps", "market_conditions", "backtest_data", "aptos_integration"]
-        }, total_duration)
+        aptos_boost_total = sum(s.get('aptosBoost', 0) for s in strategies)
+        log_strategy_run(len(strategies), strategies_with_aptos, aptos_boost_total, total_duration)
         return result
 
     except Exception as e:
@@ -824,62 +1219,33 @@ async def preview_strategy(request: dict):
         if not opportunities:
             raise HTTPException(status_code=404, detail="No opportunities found")
 
-        # Generate allocation plan
-        allocations = []
-        amount_wei = int(amount * 1_000_000)  # Convert to USDC wei
-
-        if strategy == "conservative":
-            allocations.append({
-                "protocol": opportunities[0].protocol,
-                "chain": opportunities[0].chain,
-                "amount": amount,
-                "percentage": 100,
-                "apy": opportunities[0].apy,
-                "riskScore": opportunities[0].riskScore
-            })
-        elif strategy == "balanced" and len(opportunities) >= 2:
-            allocations.extend([
-                {
-                    "protocol": opportunities[0].protocol,
-                    "chain": opportunities[0].chain,
-                    "amount": amount * 0.6,
-                    "percentage": 60,
-                    "apy": opportunities[0].apy,
-                    "riskScore": opportunities[0].riskScore
-                },
-                {
-                    "protocol": opportunities[1].protocol,
-                    "chain": opportunities[1].chain,
-                    "amount": amount * 0.4,
-                    "percentage": 40,
-                    "apy": opportunities[1].apy,
-                    "riskScore": opportunities[1].riskScore
-                }
-            ])
-        elif strategy == "aggressive":
-            percentages = [50, 30, 20]
-            for i, opp in enumerate(opportunities[:3]):
-                pct = percentages[i]
-                allocations.append({
-                    "protocol": opp.protocol,
-                    "chain": opp.chain,
-                    "amount": amount * pct / 100,
-                    "percentage": pct,
-                    "apy": opp.apy,
-                    "riskScore": opp.riskScore
-                })
-        else:
-            allocations.append({
-                "protocol": opportunities[0].protocol,
-                "chain": opportunities[0].chain,
-                "amount": amount,
-                "percentage": 100,
-                "apy": opportunities[0].apy,
-                "riskScore": opportunities[0].riskScore
-            })
+        # Generate allocation plan. With fewer opportunities than the strategy
+        # splits over, keep its leading weights and renormalize them to the full amount
+        weights = STRATEGY_WEIGHTS.get(strategy, STRATEGY_WEIGHTS["conservative"])
+        if len(opportunities) < len(weights):
+            weights = weights[:len(opportunities)]
+            weights = weights / weights.sum()
+        selected = opportunities[:len(weights)]
+
+        # Amounts, percentages and the combined APY in one pass over the weights
+        amounts = np.round(amount * weights, 2).tolist()
+        percentages = np.rint(weights * 100).astype(int).tolist()
+        percentages[-1] = 100 - sum(percentages[:-1])  # Rounded shares still total 100
+        combined_apy = weighted_apy(weights, selected)
+
+        allocations = [
+            {
+                "protocol": opp.protocol,
+                "chain": opp.chain,
+                "amount": alloc_amount,
+                "percentage": percentage,
+                "apy": opp.apy,
+                "riskScore": opp.riskScore
+            }
+            for opp, alloc_amount, percentage in zip(selected, amounts, percentages)
+        ]
 
         # Calculate combined metrics
-        combined_apy = sum(alloc["apy"] * alloc["percentage"] / 100 for alloc in allocations)
         daily_yield = (amount * combined_apy / 100) / 365
         monthly_yield = daily_yield * 30
 
@@ -891,18 +1257,89 @@ async def preview_strategy(request: dict):
             "monthlyYield": round(monthly_yield, 0),
             "allocations": allocations,
             "protocolCount": len(allocations),
-            "chainCount": len(set(alloc["chain"] for alloc in allocations))
+            "chainCount": len(set(map(_get_chain, selected)))
         }
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Testnet chain id per opportunity chain name ("aptos" for Aptos); Ethereum Sepolia otherwise
+EXECUTION_CHAIN_IDS = MappingProxyType({
+    **{chain: config["chainId"] for chain, config in CHAIN_CONFIGS.items()},
+    "ethereum": CHAIN_CONFIGS["ethereum_sepolia"]["chainId"],
+    "base": CHAIN_CONFIGS["base_sepolia"]["chainId"],
+    "arbitrum": CHAIN_CONFIGS["arbitrum_sepolia"]["chainId"],
+    "aptos": "aptos"
+})
+
+def execution_chain_id(chain: str) -> Any:
+    """Testnet chain id for an opportunity's chain"""
+    chain_id = EXECUTION_CHAIN_IDS.get(chain)
+    if chain_id is None:
+        chain_id = EXECUTION_CHAIN_IDS.get(chain.lower(), 11155111)
+    return chain_id
+
+def execution_allocation(opp: Any, share: float, amount_usdc: float) -> Dict[str, Any]:
+    """Allocation entry placing share of amount_usdc into opp"""
+    is_aptos = opp.chain == "aptos"
+    return {
+        "protocol": opp.protocol,
+        "chain": opp.chain,
+        "amount": amount_usdc * share,
+        "percentage": round(share * 100),
+        "apy": opp.apy,
+        "chainId": execution_chain_id(opp.chain),
+        "type": "aptos" if is_aptos else "evm"
+    }
+
+# Static parts of the /api/strategy-execute response, shared by every request (never mutated)
+EXECUTION_STEPS = (
+    {
+        "id": "approve",
+        "name": "Approve USDC Spending",
+        "status": "pending",
+        "description": "Approve smart wallet to spend your USDC"
+    },
+    {
+        "id": "deposit",
+        "name": "Deposit to Smart Wallet",
+        "status": "pending",
+        "description": "Transfer USDC to your CrossYield smart wallet"
+    },
+    {
+        "id": "cctp_transfers",
+        "name": "Cross-Chain Transfers",
+        "status": "pending",
+        "description": "Transfer funds across chains using Circle CCTP"
+    },
+    {
+        "id": "protocol_deposits",
+        "name": "Deploy to Protocols",
+        "status": "pending",
+        "description": "Deposit funds into yield-generating protocols"
+    },
+    {
+        "id": "completion",
+        "name": "Strategy Active",
+        "status": "pending",
+        "description": "Your yield strategy is now earning rewards"
+    }
+)
+
+EXECUTION_NEXT_ACTION = {
+    "type": "wallet_interaction",
+    "description": "Please approve USDC spending in your wallet",
+    "requiresSignature": True
+}
+
 @app.post("/api/strategy-execute")
 async def execute_strategy(request: dict):
     """Execute a strategy with real CCTP integration"""
     start_time = time.time()
     log_ai_start("Strategy Execution", {"endpoint": "/api/strategy-execute"})
-    
+    # Bound up front so the error log below works whichever step failed
+    user_address = strategy_id = amount_usdc = None
+
     try:
         user_address = request.get("userAddress")
         strategy_id = request.get("strategyId")
@@ -914,7 +1351,7 @@ async def execute_strategy(request: dict):
 
         # Convert amount from wei to human readable
         amount_usdc = amount / 1_000_000
-        execution_id = f"exec_{int(datetime.now().timestamp())}"
+        execution_id = f"exec_{int(start_time)}"
 
         log_ai_start("Strategy Execution Details", {
             "user_address": user_address,
@@ -947,77 +1384,20 @@ async def execute_strategy(request: dict):
             })
             raise HTTPException(status_code=404, detail="No yield opportunities available")
 
-        # Create realistic allocations (including Aptos)
-        allocations = []
+        # Create realistic allocations (including Aptos): pick opportunities and their shares
         evm_opps = [opp for opp in opportunities if hasattr(opp, 'chain') and opp.chain != 'aptos']
         aptos_opps = [opp for opp in opportunities if hasattr(opp, 'chain') and opp.chain == 'aptos']
-        
-        if len(evm_opps) >= 1 and len(aptos_opps) >= 1:
-            # Cross-chain allocation: EVM + Aptos
-            allocations = [
-                {
-                    "protocol": evm_opps[0].protocol,
-                    "chain": evm_opps[0].chain,
-                    "amount": amount_usdc * 0.6,
-                    "percentage": 60,
-                    "apy": evm_opps[0].apy,
-                    "chainId": 84532 if "base" in evm_opps[0].chain.lower() else 11155111,
-                    "type": "evm"
-                },
-                {
-                    "protocol": aptos_opps[0].protocol,
-                    "chain": "aptos",
-                    "amount": amount_usdc * 0.4,
-                    "percentage": 40,
-                    "apy": aptos_opps[0].apy,
-                    "chainId": "aptos",
-                    "type": "aptos"
-                }
-            ]
+
+        if evm_opps and aptos_opps:
+            picks = ((evm_opps[0], 0.6), (aptos_opps[0], 0.4))    # Cross-chain allocation: EVM + Aptos
         elif len(evm_opps) >= 2:
-            # EVM-only allocation
-            allocations = [
-                {
-                    "protocol": evm_opps[0].protocol,
-                    "chain": evm_opps[0].chain,
-                    "amount": amount_usdc * 0.6,
-                    "percentage": 60,
-                    "apy": evm_opps[0].apy,
-                    "chainId": 84532 if "base" in evm_opps[0].chain.lower() else 11155111,
-                    "type": "evm"
-                },
-                {
-                    "protocol": evm_opps[1].protocol,
-                    "chain": evm_opps[1].chain,
-                    "amount": amount_usdc * 0.4,
-                    "percentage": 40,
-                    "apy": evm_opps[1].apy,
-                    "chainId": 421614 if "arbitrum" in evm_opps[1].chain.lower() else 11155111,
-                    "type": "evm"
-                }
-            ]
-        elif len(aptos_opps) >= 1:
-            # Aptos-only allocation
-            allocations = [{
-                "protocol": aptos_opps[0].protocol,
-                "chain": "aptos",
-                "amount": amount_usdc,
-                "percentage": 100,
-                "apy": aptos_opps[0].apy,
-                "chainId": "aptos",
-                "type": "aptos"
-            }]
+            picks = ((evm_opps[0], 0.6), (evm_opps[1], 0.4))      # EVM-only allocation
+        elif aptos_opps:
+            picks = ((aptos_opps[0], 1.0),)                       # Aptos-only allocation
         else:
-            # Fallback to first opportunity
-            allocations = [{
-                "protocol": opportunities[0].protocol,
-                "chain": opportunities[0].chain,
-                "amount": amount_usdc,
-                "percentage": 100,
-                "apy": opportunities[0].apy,
-                "chainId": 84532,
-                "type": "evm"
-            }]
+            picks = ((opportunities[0], 1.0),)                    # Fallback to first opportunity
+
+        allocations = [execution_allocation(opp, share, amount_usdc) for opp, share in picks]
 
         # Generate CCTP transfers for cross-chain allocations (including Aptos)
         cctp_transfers = []
@@ -1052,7 +1432,11 @@ async def execute_strategy(request: dict):
                     "type": "evm_bridge"
                 })
 
-        expected_apy = sum(alloc["apy"] * alloc["percentage"] / 100 for alloc in allocations)
+        # Percentage-weighted APY, computed like the strategy listings
+        n_allocations = len(allocations)
+        apys = np.fromiter((alloc["apy"] for alloc in allocations), dtype=np.float64, count=n_allocations)
+        shares = np.fromiter((alloc["percentage"] for alloc in allocations), dtype=np.float64, count=n_allocations) / 100
+        expected_apy = float(np.dot(shares, apys))
 
         log_performance_metrics({
             "expected_apy": expected_apy,
@@ -1073,43 +1457,8 @@ async def execute_strategy(request: dict):
             "expectedAPY": round(expected_apy, 2),
             "cctpTransfers": cctp_transfers,
             "allocations": allocations,
-            "steps": [
-                {
-                    "id": "approve",
-                    "name": "Approve USDC Spending",
-                    "status": "pending",
-                    "description": "Approve smart wallet to spend your USDC"
-                },
-                {
-                    "id": "deposit",
-                    "name": "Deposit to Smart Wallet",
-                    "status": "pending",
-                    "description": "Transfer USDC to your CrossYield smart wallet"
-                },
-                {
-                    "id": "cctp_transfers",
-                    "name": "Cross-Chain Transfers",
-                    "status": "pending",
-                    "description": "Transfer funds across chains using Circle CCTP"
-                },
-                {
-                    "id": "protocol_deposits",
-                    "name": "Deploy to Protocols",
-                    "status": "pending",
-                    "description": "Deposit funds into yield-generating protocols"
-                },
-                {
-                    "id": "completion",
-                    "name": "Strategy Active",
-                    "status": "pending",
-                    "description": "Your yield strategy is now earning rewards"
-                }
-            ],
-            "nextAction": {
-                "type": "wallet_interaction",
-                "description": "Please approve USDC spending in your wallet",
-                "requiresSignature": True
-            }
+            "steps": EXECUTION_STEPS,
+            "nextAction": EXECUTION_NEXT_ACTION
         }
 
         total_duration = time.time() - start_time
@@ -1274,8 +1623,8 @@ async def smart_wallet_cctp_execute(request: dict):
         from src.apis.cctp_integration import CCTPIntegration
         import os
 
-        # Initialize CCTP with your private key from environment
-        cctp = CCTPIntegration()
+        # Initialize CCTP on the app's HTTP session, with your private key from environment
+        cctp = CCTPIntegration(session=app.state.http)
         private_key = os.getenv('DEMO_PRIVATE_KEY') or os.getenv('PRIVATE_KEY')
 
         if not private_key:
@@ -1310,8 +1659,10 @@ async def smart_wallet_cctp_execute(request: dict):
                 "note": "Cross-chain transfer executed via smart wallet coordinator"
             }
 
-            # Start monitoring the transfer
-            asyncio.create_task(monitor_smart_wallet_transfer(cctp, transfer, private_key))
+            # Start monitoring the transfer; keep a reference until it finishes
+            task = asyncio.create_task(monitor_smart_wallet_transfer(cctp, transfer, private_key))
+            monitor_tasks.add(task)
+            task.add_done_callback(monitor_tasks.discard)
 
             return response
         else:
@@ -1321,13 +1672,22 @@ async def smart_wallet_cctp_execute(request: dict):
         print(f"❌ Smart wallet CCTP failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# In-flight transfer monitors, held so they aren't collected mid-run
+monitor_tasks: Set[asyncio.Task] = set()
+
+# Backoff between indexing checks for a burn transaction (seconds)
+MONITOR_BACKOFF = (5, 10, 20, 40)
+
 async def monitor_smart_wallet_transfer(cctp, transfer, private_key):
     """Monitor and complete the smart wallet CCTP transfer"""
     try:
         print(f"Monitoring smart wallet CCTP transfer: {transfer.burn_tx_hash}")
 
-        # Wait a bit for the transaction to be indexed
-        await asyncio.sleep(30)
+        # Wait for the transaction to be indexed, backing off between checks
+        for delay in MONITOR_BACKOFF:
+            await asyncio.sleep(delay)
+            if await cctp.is_indexed(transfer):
+                break
 
         # Complete the transfer on destination chain
         completed_transfer = await cctp.complete_cross_chain_transfer(transfer, private_key)
@@ -1338,7 +1698,18 @@ async def monitor_smart_wallet_transfer(cctp, transfer, private_key):
 
     except Exception as e:
         print(f"⚠️ Smart wallet CCTP monitoring failed: {e}")
+    finally:
+        await cctp.close()
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # WEB_CONCURRENCY > 1 runs worker processes (no reload); uvicorn picks
+    # uvloop and httptools automatically when installed (uvicorn[standard])
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+        reload=workers == 1
+    )
\ No newline at end of file
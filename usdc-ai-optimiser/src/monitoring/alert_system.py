@@ -3,11 +3,16 @@
 
 import asyncio
 import aiohttp
-import json
+import itertools
+import orjson
 import os
-from typing import Dict, List, Optional
+import random
+import time
+from collections import Counter, OrderedDict
+from types import MappingProxyType
+from typing import Dict, List, Optional, Set
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 class AlertSeverity(Enum):
@@ -17,6 +22,66 @@ class AlertSeverity(Enum):
     HIGH = "high"
     CRITICAL = "critical"
 
+SEVERITY_EMOJI = MappingProxyType({
+    AlertSeverity.LOW: "ℹ️",
+    AlertSeverity.MEDIUM: "⚠️",
+    AlertSeverity.HIGH: "🚨",
+    AlertSeverity.CRITICAL: "🔥"
+})
+
+# Discord embed colors
+SEVERITY_COLORS = MappingProxyType({
+    AlertSeverity.LOW: 0x00ff00,      # Green
+    AlertSeverity.MEDIUM: 0xffff00,    # Yellow
+    AlertSeverity.HIGH: 0xff8800,      # Orange
+    AlertSeverity.CRITICAL: 0xff0000   # Red
+})
+
+JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+def dump_json(obj) -> bytes:
+    """Serialize a webhook payload to JSON bytes"""
+    return orjson.dumps(obj)
+
+def format_metadata(metadata: Dict) -> str:
+    """Alert metadata as indented JSON for message bodies"""
+    return orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+# Webhook delivery attempts per message; critical alerts retry longer.
+# Waits grow exponentially from RETRY_INITIAL_DELAY, capped at RETRY_MAX_DELAY
+WEBHOOK_MAX_ATTEMPTS = MappingProxyType({
+    AlertSeverity.LOW: 3,
+    AlertSeverity.MEDIUM: 5,
+    AlertSeverity.HIGH: 5,
+    AlertSeverity.CRITICAL: 8
+})
+RETRY_INITIAL_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
+
+# Alerts kept in AlertSystem.alerts_db
+MAX_ALERT_HISTORY = 1000
+
+# Health statuses that raise an alert: (severity, title prefix)
+STATUS_ALERTS = MappingProxyType({
+    "unhealthy": (AlertSeverity.HIGH, "Component Unhealthy"),
+    "degraded": (AlertSeverity.MEDIUM, "Component Degraded")
+})
+
+# Inline fields leading every Discord embed, filled from the alert's rendered strings
+DISCORD_INLINE_FIELDS = ("Severity", "Component", "Time")
+
+# Webhook alerts arriving within BATCH_INTERVAL seconds go out together
+BATCH_INTERVAL = 0.5
+DISCORD_MAX_EMBEDS = 10          # Discord's per-message embed limit
+TELEGRAM_ALERTS_PER_MESSAGE = 5  # Keeps messages under Telegram's 4096 characters
+
+# Cap on alert sends running at once from the check_* methods
+MAX_CONCURRENT_SENDS = 16
+
+# An alert identical to one sent within DEDUP_WINDOW seconds (same severity,
+# title, component and message) is recorded but not sent again
+DEDUP_WINDOW = 60.0
+
 @dataclass
 class Alert:
     """Alert data structure"""
@@ -28,12 +93,30 @@ class Alert:
     component: str
     resolved: bool = False
     metadata: Optional[Dict] = None
+    # Rendered once here and shared by every channel
+    severity_label: str = field(init=False, repr=False)
+    time_text: str = field(init=False, repr=False)
+    time_iso: str = field(init=False, repr=False)
+    metadata_text: Optional[str] = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self.severity_label = self.severity.value.upper()
+        self.time_text = self.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
+        self.time_iso = self.timestamp.isoformat()
+        self.metadata_text = format_metadata(self.metadata) if self.metadata else None
 
 class AlertSystem:
     """Comprehensive alert system"""
     
     def __init__(self):
-        self.alerts_db = []
+        # Alerts by id, oldest first, with the active ones indexed by
+        # severity and counted by component so lookups and summaries
+        # don't scan the history
+        self.alerts_db: "OrderedDict[str, Alert]" = OrderedDict()
+        self._active_alerts: Dict[str, Alert] = {}
+        self._active_by_severity: Dict[AlertSeverity, Dict[str, Alert]] = {severity: {} for severity in AlertSeverity}
+        self._active_by_component: "Counter[str]" = Counter()
+        self._id_counter = itertools.count()
         self.alert_channels = {
             "console": True,
             "discord": False,
@@ -67,6 +150,53 @@ class AlertSystem:
             self.alert_channels["telegram"] = True
         if self.email_smtp_server and self.email_username:
             self.alert_channels["email"] = True
+        
+        # Webhook session, opened on first send and reused so alerts share
+        # pooled keep-alive connections
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        
+        # Discord/Telegram alerts wait here to be sent in batches by the
+        # flush task, started on first send. _batching is set while the
+        # task holds a batch, and _closing ends its window early
+        self.batch_interval = BATCH_INTERVAL
+        self._outbox: "asyncio.Queue[Alert]" = asyncio.Queue()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._batching = False
+        self._closing = asyncio.Event()
+        
+        # Sends spawned by the check_* methods: held until done, and at
+        # most MAX_CONCURRENT_SENDS at a time
+        self._inflight: Set[asyncio.Task] = set()
+        self._send_sem = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+        
+        # Last send time (monotonic) per alert identity, for deduplication
+        self.dedup_window = DEDUP_WINDOW
+        self._last_sent: Dict[tuple, float] = {}
+    
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Get shared aiohttp session, creating it on first use"""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._http_session
+    
+    async def close(self):
+        """Finish in-flight sends and batched alerts, then close the shared webhook session"""
+        await asyncio.gather(*self._inflight, return_exceptions=True)
+        if self._flush_task is not None:
+            if self._batching:
+                # Let the flush task send the batch it holds, then stop
+                self._closing.set()
+            else:
+                self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+            self._closing.clear()
+        await self._flush_outbox()
+        if self._http_session and not self._http_session.closed:
+            await self._http_session.close()
     
     def create_alert(
         self,
@@ -78,7 +208,8 @@ class AlertSystem:
     ) -> Alert:
         """Create a new alert"""
         
-        alert_id = f"{component}_{int(datetime.now().timestamp())}"
+        # Sequence-numbered ids are unique even for alerts in the same second
+        alert_id = f"{component}_{next(self._id_counter)}"
         
         alert = Alert(
             id=alert_id,
@@ -90,52 +221,127 @@ class AlertSystem:
             metadata=metadata
         )
         
-        self.alerts_db.append(alert)
+        self.alerts_db[alert_id] = alert
+        self._active_alerts[alert_id] = alert
+        self._active_by_severity[severity][alert_id] = alert
+        self._active_by_component[component] += 1
         
-        # Keep only last 1000 alerts
-        if len(self.alerts_db) > 1000:
-            self.alerts_db = self.alerts_db[-1000:]
+        # Keep only the last MAX_ALERT_HISTORY alerts, evicting the oldest in O(1)
+        if len(self.alerts_db) > MAX_ALERT_HISTORY:
+            _, oldest = self.alerts_db.popitem(last=False)
+            self._deactivate(oldest)
         
         return alert
     
+    def _deactivate(self, alert: Alert):
+        """Drop an alert from the active indexes, if it is still there"""
+        
+        if self._active_alerts.pop(alert.id, None) is None:
+            return
+        del self._active_by_severity[alert.severity][alert.id]
+        self._active_by_component[alert.component] -= 1
+        if not self._active_by_component[alert.component]:
+            del self._active_by_component[alert.component]
+    
     async def send_alert(self, alert: Alert):
         """Send alert through all configured channels"""
         
-        print(f"🚨 ALERT [{alert.severity.value.upper()}] {alert.title}")
+        if self._should_suppress(alert):
+            return
+        
+        print(f"🚨 ALERT [{alert.severity_label}] {alert.title}")
         print(f"   Component: {alert.component}")
         print(f"   Message: {alert.message}")
         print(f"   Time: {alert.timestamp}")
         
-        # Send to console (always enabled)
+        # Send to console (always enabled) before any network channel
         if self.alert_channels["console"]:
             await self._send_to_console(alert)
         
-        # Send to Discord
-        if self.alert_channels["discord"] and self.discord_webhook:
-            await self._send_to_discord(alert)
-        
-        # Send to Telegram
-        if self.alert_channels["telegram"] and self.telegram_token:
-            await self._send_to_telegram(alert)
+        # Discord and Telegram go out in batches from the flush task
+        if self._webhooks_enabled():
+            self._outbox.put_nowait(alert)
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._flush_loop())
         
         # Send to Email
         if self.alert_channels["email"] and self.email_smtp_server:
             await self._send_to_email(alert)
     
+    def _should_suppress(self, alert: Alert) -> bool:
+        """Whether an identical alert was sent within the dedup window; records this send otherwise"""
+        
+        key = (alert.severity, alert.title, alert.component, alert.message)
+        now = time.monotonic()
+        last = self._last_sent.get(key)
+        if last is not None and now - last < self.dedup_window:
+            return True
+        
+        self._last_sent[key] = now
+        if len(self._last_sent) > 1024:
+            # Forget identities whose window has passed
+            self._last_sent = {k: t for k, t in self._last_sent.items() if now - t < self.dedup_window}
+        return False
+    
+    def _dispatch(self, alert: Alert):
+        """Send alert in the background, keeping a reference until it is sent"""
+        task = asyncio.create_task(self._guarded_send(alert))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+    
+    async def _guarded_send(self, alert: Alert):
+        """send_alert, bounded by the concurrent send limit"""
+        async with self._send_sem:
+            await self.send_alert(alert)
+    
+    def _webhooks_enabled(self) -> bool:
+        """Whether Discord or Telegram alerts are configured"""
+        return bool(
+            (self.alert_channels["discord"] and self.discord_webhook) or
+            (self.alert_channels["telegram"] and self.telegram_token)
+        )
+    
+    async def _flush_loop(self):
+        """Send queued webhook alerts, coalescing those within batch_interval"""
+        
+        while not self._closing.is_set():
+            first = await self._outbox.get()
+            self._batching = True
+            try:
+                try:
+                    await asyncio.wait_for(self._closing.wait(), self.batch_interval)
+                except asyncio.TimeoutError:
+                    pass
+                await self._flush_outbox([first])
+            finally:
+                self._batching = False
+    
+    async def _flush_outbox(self, batch: Optional[List[Alert]] = None):
+        """Drain the outbox and send the batch to Discord and Telegram concurrently"""
+        
+        batch = batch or []
+        while not self._outbox.empty():
+            batch.append(self._outbox.get_nowait())
+        if not batch:
+            return
+        
+        sends = []
+        if self.alert_channels["discord"] and self.discord_webhook:
+            sends.append(self._send_to_discord(batch))
+        if self.alert_channels["telegram"] and self.telegram_token:
+            sends.append(self._send_to_telegram(batch))
+        
+        for result in await asyncio.gather(*sends, return_exceptions=True):
+            if isinstance(result, Exception):
+                print(f"Failed to send {len(batch)} batched alerts: {result}")
+    
     async def _send_to_console(self, alert: Alert):
         """Send alert to console"""
         
-        severity_emoji = {
-            AlertSeverity.LOW: "ℹ️",
-            AlertSeverity.MEDIUM: "⚠️",
-            AlertSeverity.HIGH: "🚨",
-            AlertSeverity.CRITICAL: "🔥"
-        }
-        
-        emoji = severity_emoji.get(alert.severity, "📢")
+        emoji = SEVERITY_EMOJI.get(alert.severity, "📢")
         
         print(f"\n{emoji} ALERT: {alert.title}")
-        print(f"   Severity: {alert.severity.value.upper()}")
+        print(f"   Severity: {alert.severity_label}")
         print(f"   Component: {alert.component}")
         print(f"   Message: {alert.message}")
         print(f"   Time: {alert.timestamp}")
@@ -143,102 +349,119 @@ class AlertSystem:
             print(f"   Metadata: {alert.metadata}")
         print("-" * 50)
     
-    async def _send_to_discord(self, alert: Alert):
-        """Send alert to Discord webhook"""
+    def _discord_embed(self, alert: Alert) -> Dict:
+        """Build the Discord embed for an alert"""
+        
+        embed = {
+            "title": f"🚨 {alert.title}",
+            "description": alert.message,
+            "color": SEVERITY_COLORS.get(alert.severity, 0x0099ff),
+            "fields": [
+                {"name": name, "value": value, "inline": True}
+                for name, value in zip(DISCORD_INLINE_FIELDS, (alert.severity_label, alert.component, alert.time_text))
+            ],
+            "timestamp": alert.time_iso
+        }
+        
+        if alert.metadata:
+            embed["fields"].append({
+                "name": "Details",
+                "value": alert.metadata_text,
+                "inline": False
+            })
+        
+        return embed
+    
+    async def _send_to_discord(self, alerts: List[Alert]):
+        """Send alerts to Discord webhook, up to 10 embeds per message"""
         
         try:
-            severity_colors = {
-                AlertSeverity.LOW: 0x00ff00,      # Green
-                AlertSeverity.MEDIUM: 0xffff00,    # Yellow
-                AlertSeverity.HIGH: 0xff8800,      # Orange
-                AlertSeverity.CRITICAL: 0xff0000   # Red
-            }
-            
-            embed = {
-                "title": f"🚨 {alert.title}",
-                "description": alert.message,
-                "color": severity_colors.get(alert.severity, 0x0099ff),
-                "fields": [
-                    {
-                        "name": "Severity",
-                        "value": alert.severity.value.upper(),
-                        "inline": True
-                    },
-                    {
-                        "name": "Component",
-                        "value": alert.component,
-                        "inline": True
-                    },
-                    {
-                        "name": "Time",
-                        "value": alert.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC"),
-                        "inline": True
-                    }
-                ],
-                "timestamp": alert.timestamp.isoformat()
-            }
-            
-            if alert.metadata:
-                embed["fields"].append({
-                    "name": "Details",
-                    "value": json.dumps(alert.metadata, indent=2),
-                    "inline": False
-                })
-            
-            payload = {
-                "embeds": [embed]
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.discord_webhook,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status != 204:
-                        print(f"Discord webhook failed: {response.status}")
+            for i in range(0, len(alerts), DISCORD_MAX_EMBEDS):
+                payload = {
+                    "embeds": [self._discord_embed(alert) for alert in alerts[i:i + DISCORD_MAX_EMBEDS]]
+                }
+                
+                status = await self._post_with_retry(
+                    self.discord_webhook, payload, self._max_attempts(alerts[i:i + DISCORD_MAX_EMBEDS])
+                )
+                if status != 204:
+                    print(f"Discord webhook failed: {status}")
                         
         except Exception as e:
             print(f"Failed to send Discord alert: {e}")
     
-    async def _send_to_telegram(self, alert: Alert):
-        """Send alert to Telegram"""
+    def _max_attempts(self, alerts: List[Alert]) -> int:
+        """Delivery attempts for a message, set by its most severe alert"""
+        return max(WEBHOOK_MAX_ATTEMPTS[alert.severity] for alert in alerts)
+    
+    async def _post_with_retry(self, url: str, payload: Dict, max_attempts: int) -> int:
+        """POST payload as JSON, retrying connection errors, 429s and 5xx
+        
+        Waits between attempts back off exponentially with full jitter,
+        or follow the server's Retry-After on a 429. Returns the final
+        response status; raises the last connection error if every
+        attempt failed to connect.
+        """
+        
+        body = dump_json(payload)
+        delay = RETRY_INITIAL_DELAY
+        for attempt in range(1, max_attempts + 1):
+            retry_after = None
+            try:
+                async with self._get_http_session().post(url, data=body, headers=JSON_HEADERS) as response:
+                    if response.status != 429 and response.status < 500:
+                        return response.status
+                    if attempt == max_attempts:
+                        return response.status
+                    if response.status == 429:
+                        retry_after = response.headers.get("Retry-After")
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == max_attempts:
+                    raise
+            
+            try:
+                wait = min(float(retry_after), RETRY_MAX_DELAY)
+            except (TypeError, ValueError):
+                wait = random.uniform(0, delay)
+            await asyncio.sleep(wait)
+            delay = min(delay * 2, RETRY_MAX_DELAY)
+    
+    def _telegram_message(self, alert: Alert) -> str:
+        """Build the Telegram message for an alert"""
+        
+        emoji = SEVERITY_EMOJI.get(alert.severity, "📢")
+        
+        message = f"{emoji} *{alert.title}*\n\n"
+        message += f"*Severity:* {alert.severity_label}\n"
+        message += f"*Component:* {alert.component}\n"
+        message += f"*Message:* {alert.message}\n"
+        message += f"*Time:* {alert.time_text}\n"
+        
+        if alert.metadata:
+            message += f"*Details:*\n```json\n{alert.metadata_text}\n```"
+        
+        return message
+    
+    async def _send_to_telegram(self, alerts: List[Alert]):
+        """Send alerts to Telegram, several per message"""
         
         try:
-            severity_emoji = {
-                AlertSeverity.LOW: "ℹ️",
-                AlertSeverity.MEDIUM: "⚠️",
-                AlertSeverity.HIGH: "🚨",
-                AlertSeverity.CRITICAL: "🔥"
-            }
-            
-            emoji = severity_emoji.get(alert.severity, "📢")
-            
-            message = f"{emoji} *{alert.title}*\n\n"
-            message += f"*Severity:* {alert.severity.value.upper()}\n"
-            message += f"*Component:* {alert.component}\n"
-            message += f"*Message:* {alert.message}\n"
-            message += f"*Time:* {alert.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
-            
-            if alert.metadata:
-                message += f"*Details:*\n```json\n{json.dumps(alert.metadata, indent=2)}\n```"
-            
             url = f"https://api.telegram.org/bot{self.telegram_token}/sendMessage"
             
-            payload = {
-                "chat_id": self.telegram_chat_id,
-                "text": message,
-                "parse_mode": "Markdown"
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status != 200:
-                        print(f"Telegram API failed: {response.status}")
+            for i in range(0, len(alerts), TELEGRAM_ALERTS_PER_MESSAGE):
+                payload = {
+                    "chat_id": self.telegram_chat_id,
+                    "text": "\n---\n".join(
+                        self._telegram_message(alert) for alert in alerts[i:i + TELEGRAM_ALERTS_PER_MESSAGE]
+                    ),
+                    "parse_mode": "Markdown"
+                }
+                
+                status = await self._post_with_retry(
+                    url, payload, self._max_attempts(alerts[i:i + TELEGRAM_ALERTS_PER_MESSAGE])
+                )
+                if status != 200:
+                    print(f"Telegram API failed: {status}")
                         
         except Exception as e:
             print(f"Failed to send Telegram alert: {e}")
@@ -254,27 +477,31 @@ class AlertSystem:
             msg = MIMEMultipart()
             msg['From'] = self.email_username
             msg['To'] = self.email_to
-            msg['Subject'] = f"[{alert.severity.value.upper()}] {alert.title}"
+            msg['Subject'] = f"[{alert.severity_label}] {alert.title}"
             
             body = f"""
 Alert Details:
-- Severity: {alert.severity.value.upper()}
+- Severity: {alert.severity_label}
 - Component: {alert.component}
 - Message: {alert.message}
 - Time: {alert.timestamp}
 
 Metadata:
-{json.dumps(alert.metadata, indent=2) if alert.metadata else 'None'}
+{alert.metadata_text or 'None'}
             """
             
             msg.attach(MIMEText(body, 'plain'))
             
-            server = smtplib.SMTP(self.email_smtp_server, 587)
-            server.starttls()
-            server.login(self.email_username, self.email_password)
-            text = msg.as_string()
-            server.sendmail(self.email_username, self.email_to, text)
-            server.quit()
+            def blocking_send():
+                server = smtplib.SMTP(self.email_smtp_server, 587)
+                server.starttls()
+                server.login(self.email_username, self.email_password)
+                text = msg.as_string()
+                server.sendmail(self.email_username, self.email_to, text)
+                server.quit()
+            
+            # smtplib blocks for the whole SMTP exchange; keep it off the event loop
+            await asyncio.to_thread(blocking_send)
             
         except Exception as e:
             print(f"Failed to send email alert: {e}")
@@ -282,32 +509,27 @@ Metadata:
     def check_health_alerts(self, health_components: Dict):
         """Check for health-related alerts"""
         
+        response_time_threshold = self.thresholds['response_time']
+        
         for component_name, component_data in health_components.items():
-            # Check for unhealthy components
-            if component_data.get('status') == 'unhealthy':
-                alert = self.create_alert(
-                    severity=AlertSeverity.HIGH,
-                    title=f"Component Unhealthy: {component_name}",
-                    message=f"Component {component_name} is reporting unhealthy status",
-                    component=component_name,
-                    metadata=component_data
-                )
-                asyncio.create_task(self.send_alert(alert))
+            status = component_data.get('status')
+            response_time = component_data.get('response_time', 0)
             
-            # Check for degraded components
-            elif component_data.get('status') == 'degraded':
+            # Check for unhealthy or degraded components
+            status_alert = STATUS_ALERTS.get(status)
+            if status_alert:
+                severity, title = status_alert
                 alert = self.create_alert(
-                    severity=AlertSeverity.MEDIUM,
-                    title=f"Component Degraded: {component_name}",
-                    message=f"Component {component_name} is reporting degraded status",
+                    severity=severity,
+                    title=f"{title}: {component_name}",
+                    message=f"Component {component_name} is reporting {status} status",
                     component=component_name,
                     metadata=component_data
                 )
-                asyncio.create_task(self.send_alert(alert))
+                self._dispatch(alert)
             
             # Check response times
-            response_time = component_data.get('response_time', 0)
-            if response_time > self.thresholds['response_time']:
+            if response_time > response_time_threshold:
                 alert = self.create_alert(
                     severity=AlertSeverity.MEDIUM,
                     title=f"High Response Time: {component_name}",
@@ -315,7 +537,7 @@ Metadata:
                     component=component_name,
                     metadata=component_data
                 )
-                asyncio.create_task(self.send_alert(alert))
+                self._dispatch(alert)
     
     def check_yield_alerts(self, current_yield: float, previous_yield: float):
         """Check for yield-related alerts"""
@@ -337,7 +559,7 @@ Metadata:
                         "yield_change": yield_change
                     }
                 )
-                asyncio.create_task(self.send_alert(alert))
+                self._dispatch(alert)
     
     def check_gas_cost_alerts(self, current_cost: float, average_cost: float):
         """Check for gas cost alerts"""
@@ -357,7 +579,7 @@ Metadata:
                         "cost_ratio": cost_ratio
                     }
                 )
-                asyncio.create_task(self.send_alert(alert))
+                self._dispatch(alert)
     
     def check_rebalance_alerts(self, success_rate: float, failure_count: int):
         """Check for rebalancing alerts"""
@@ -373,49 +595,42 @@ Metadata:
                     "failure_count": failure_count
                 }
             )
-            asyncio.create_task(self.send_alert(alert))
+            self._dispatch(alert)
     
     def get_active_alerts(self, severity: Optional[AlertSeverity] = None) -> List[Alert]:
         """Get active alerts, optionally filtered by severity"""
         
-        alerts = [alert for alert in self.alerts_db if not alert.resolved]
-        
         if severity:
-            alerts = [alert for alert in alerts if alert.severity == severity]
+            return list(self._active_by_severity[severity].values())
         
-        return alerts
+        return list(self._active_alerts.values())
     
     def resolve_alert(self, alert_id: str):
         """Mark an alert as resolved"""
         
-        for alert in self.alerts_db:
-            if alert.id == alert_id:
-                alert.resolved = True
-                break
+        alert = self.alerts_db.get(alert_id)
+        if alert is not None:
+            alert.resolved = True
+            self._deactivate(alert)
     
     def get_alert_summary(self) -> Dict:
         """Get alert summary statistics"""
         
-        active_alerts = [alert for alert in self.alerts_db if not alert.resolved]
+        active_count = len(self._active_alerts)
         
         summary = {
             "total_alerts": len(self.alerts_db),
-            "active_alerts": len(active_alerts),
-            "resolved_alerts": len(self.alerts_db) - len(active_alerts),
+            "active_alerts": active_count,
+            "resolved_alerts": len(self.alerts_db) - active_count,
             "by_severity": {
-                "critical": len([a for a in active_alerts if a.severity == AlertSeverity.CRITICAL]),
-                "high": len([a for a in active_alerts if a.severity == AlertSeverity.HIGH]),
-                "medium": len([a for a in active_alerts if a.severity == AlertSeverity.MEDIUM]),
-                "low": len([a for a in active_alerts if a.severity == AlertSeverity.LOW])
+                "critical": len(self._active_by_severity[AlertSeverity.CRITICAL]),
+                "high": len(self._active_by_severity[AlertSeverity.HIGH]),
+                "medium": len(self._active_by_severity[AlertSeverity.MEDIUM]),
+                "low": len(self._active_by_severity[AlertSeverity.LOW])
             },
-            "by_component": {}
+            "by_component": dict(self._active_by_component)
         }
         
-        # Count by component
-        for alert in active_alerts:
-            component = alert.component
-            summary["by_component"][component] = summary["by_component"].get(component, 0) + 1
-        
         return summary
 
 # Test alert system
@@ -454,6 +669,7 @@ async def test_alert_system():
     print(f"   Active Alerts: {summary['active_alerts']}")
     print(f"   By Severity: {summary['by_severity']}")
     
+    await alert_system.close()
     print("\n✅ Alert system test complete!")
 
 if __name__ == "__main__":
@@ -2,15 +2,29 @@
 """24/7 Continuous Monitoring System"""
 
 import asyncio
+import heapq
 import json
 import os
+import time
 from typing import Dict, List
 from datetime import datetime, timedelta
 from dataclasses import asdict
+from types import MappingProxyType
 
 from .health_monitor import SystemHealthMonitor
 from .performance_tracker import PerformanceTracker
 from .alert_system import AlertSystem, AlertSeverity
+from ..utils.logger import get_queued_logger
+
+# Console output goes through the shared log queue, so the monitoring
+# loops never block on stdout
+logger = get_queued_logger(__name__)
+
+HEALTH_STATUS_EMOJI = MappingProxyType({
+    'healthy': '✅',
+    'degraded': '⚠️',
+    'unhealthy': '🚨'
+})
 
 class ContinuousMonitor:
     """Main continuous monitoring system"""
@@ -21,8 +35,11 @@ class ContinuousMonitor:
         self.alert_system = AlertSystem()
         
         self.monitoring_active = True
+        # Set on stop so the monitoring loop wakes from its wait immediately
+        self._stop_event = asyncio.Event()
         self.check_interval = 60  # Check every 60 seconds
         self.performance_interval = 300  # Performance check every 5 minutes
+        self.alert_interval = 300  # Check alerts every 5 minutes
         
         # State tracking
         self.last_health_check = None
@@ -30,134 +47,150 @@ class ContinuousMonitor:
         self.previous_yield = None
         self.previous_gas_cost = None
         
-        print("🚀 USDC AI Optimizer - 24/7 Monitoring System")
-        print("=" * 60)
-        print(f"Health Check Interval: {self.check_interval}s")
-        print(f"Performance Check Interval: {self.performance_interval}s")
-        print(f"Alert Channels: {[k for k, v in self.alert_system.alert_channels.items() if v]}")
-        print("=" * 60)
+        logger.info(
+            "🚀 USDC AI Optimizer - 24/7 Monitoring System\n"
+            f"   Health Check Interval: {self.check_interval}s\n"
+            f"   Performance Check Interval: {self.performance_interval}s\n"
+            f"   Alert Channels: {[k for k, v in self.alert_system.alert_channels.items() if v]}"
+        )
     
     async def start_monitoring(self):
         """Start the continuous monitoring loop"""
         
-        print("🔄 Starting continuous monitoring...")
-        
-        # Start background tasks
-        health_task = asyncio.create_task(self._health_monitoring_loop())
-        performance_task = asyncio.create_task(self._performance_monitoring_loop())
-        alert_task = asyncio.create_task(self._alert_monitoring_loop())
+        logger.info("🔄 Starting continuous monitoring...")
         
         try:
-            # Run all tasks concurrently
-            await asyncio.gather(health_task, performance_task, alert_task)
-        except KeyboardInterrupt:
-            print("\n🛑 Monitoring stopped by user")
+            await self._unified_loop()
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            logger.info("🛑 Monitoring stopped by user")
             self.monitoring_active = False
+            self._stop_event.set()
         except Exception as e:
-            print(f"\n❌ Monitoring error: {e}")
+            logger.error(f"❌ Monitoring error: {e}")
             self.monitoring_active = False
+            self._stop_event.set()
     
-    async def _health_monitoring_loop(self):
-        """Health monitoring loop"""
+    async def _interruptible_sleep(self, seconds: float):
+        """Sleep for seconds, returning early once monitoring is stopped"""
         
-        while self.monitoring_active:
-            try:
-                print(f"\n🔍 Health Check - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                
-                # Perform health check
-                components = await self.health_monitor.check_all_components()
-                
-                # Generate health report
-                health_report = self.health_monitor.generate_health_report(components)
-                
-                # Check for alerts
-                self.alert_system.check_health_alerts(health_report['components'])
-                
-                # Print status
-                overall_health = health_report['overall_health']
-                status_emoji = {
-                    'healthy': '✅',
-                    'degraded': '⚠️',
-                    'unhealthy': '🚨'
-                }
-                
-                print(f"{status_emoji.get(overall_health, '❓')} Overall Health: {overall_health.upper()}")
-                print(f"   Components: {health_report['summary']['healthy']} healthy, "
-                      f"{health_report['summary']['degraded']} degraded, "
-                      f"{health_report['summary']['unhealthy']} unhealthy")
-                
-                # Store health check time
-                self.last_health_check = datetime.now()
-                
-                # Record health metrics
-                self.performance_tracker.record_metric(
-                    "health_score",
-                    health_report['summary']['healthy'] / health_report['summary']['total_components'],
-                    {"overall_health": overall_health}
-                )
-                
-                # Wait for next check
-                await asyncio.sleep(self.check_interval)
-                
-            except Exception as e:
-                print(f"❌ Health monitoring error: {e}")
-                await asyncio.sleep(30)  # Wait 30 seconds before retry
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
     
-    async def _performance_monitoring_loop(self):
-        """Performance monitoring loop"""
+    async def _unified_loop(self):
+        """Run the health, performance and alert checks from one schedule
+        
+        A heap of (due time, order, check) wakes only for the earliest
+        due check; each check returns the delay until its next run.
+        """
+        
+        checks = (self._do_health, self._do_performance, self._do_alerts)
+        schedule = [(time.monotonic(), order, check) for order, check in enumerate(checks)]
+        heapq.heapify(schedule)
         
         while self.monitoring_active:
-            try:
-                print(f"\n📊 Performance Check - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                
-                # Generate performance report
-                performance_report = self.performance_tracker.generate_performance_report("24h")
-                
-                # Check for performance alerts
-                await self._check_performance_alerts(performance_report)
-                
-                # Print key metrics
-                self._print_performance_summary(performance_report)
-                
-                # Store performance check time
-                self.last_performance_check = datetime.now()
-                
-                # Wait for next check
-                await asyncio.sleep(self.performance_interval)
-                
-            except Exception as e:
-                print(f"❌ Performance monitoring error: {e}")
-                await asyncio.sleep(60)  # Wait 1 minute before retry
+            due, order, check = schedule[0]
+            wait = due - time.monotonic()
+            if wait > 0:
+                await self._interruptible_sleep(wait)
+                continue
+            
+            heapq.heappop(schedule)
+            interval = await check(datetime.now())
+            heapq.heappush(schedule, (time.monotonic() + interval, order, check))
     
-    async def _alert_monitoring_loop(self):
-        """Alert monitoring loop"""
+    async def _do_health(self, now: datetime) -> float:
+        """Health check; returns seconds until the next one"""
         
-        while self.monitoring_active:
-            try:
-                # Check for unresolved critical alerts
-                critical_alerts = self.alert_system.get_active_alerts(AlertSeverity.CRITICAL)
-                
-                if critical_alerts:
-                    print(f"\n🚨 CRITICAL ALERTS ACTIVE: {len(critical_alerts)}")
-                    for alert in critical_alerts:
-                        print(f"   - {alert.title} ({alert.component})")
-                
-                # Check alert summary
-                alert_summary = self.alert_system.get_alert_summary()
-                
-                if alert_summary['active_alerts'] > 0:
-                    print(f"\n📢 Active Alerts: {alert_summary['active_alerts']}")
-                    print(f"   Critical: {alert_summary['by_severity']['critical']}")
-                    print(f"   High: {alert_summary['by_severity']['high']}")
-                    print(f"   Medium: {alert_summary['by_severity']['medium']}")
-                    print(f"   Low: {alert_summary['by_severity']['low']}")
-                
-                # Wait for next check
-                await asyncio.sleep(300)  # Check alerts every 5 minutes
-                
-            except Exception as e:
-                print(f"❌ Alert monitoring error: {e}")
-                await asyncio.sleep(60)  # Wait 1 minute before retry
+        try:
+            # Perform health check
+            components = await self.health_monitor.check_all_components()
+            
+            # Generate health report
+            health_report = self.health_monitor.generate_health_report(components)
+            
+            # Check for alerts
+            self.alert_system.check_health_alerts(health_report['components'])
+            
+            # Print status
+            overall_health = health_report['overall_health']
+            
+            logger.info(
+                f"🔍 Health Check - {HEALTH_STATUS_EMOJI.get(overall_health, '❓')} Overall Health: {overall_health.upper()}\n"
+                f"   Components: {health_report['summary']['healthy']} healthy, "
+                f"{health_report['summary']['degraded']} degraded, "
+                f"{health_report['summary']['unhealthy']} unhealthy"
+            )
+            
+            # Store health check time
+            self.last_health_check = now
+            
+            # Record health metrics
+            self.performance_tracker.record_metric(
+                "health_score",
+                health_report['summary']['healthy'] / health_report['summary']['total_components'],
+                {"overall_health": overall_health}
+            )
+            
+            return self.check_interval
+            
+        except Exception as e:
+            logger.error(f"❌ Health monitoring error: {e}")
+            return 30  # Wait 30 seconds before retry
+    
+    async def _do_performance(self, now: datetime) -> float:
+        """Performance check; returns seconds until the next one"""
+        
+        try:
+            # Generate performance report
+            performance_report = self.performance_tracker.generate_performance_report("24h")
+            
+            # Check for performance alerts
+            await self._check_performance_alerts(performance_report)
+            
+            # Print key metrics
+            self._print_performance_summary(performance_report)
+            
+            # Store performance check time
+            self.last_performance_check = now
+            
+            return self.performance_interval
+            
+        except Exception as e:
+            logger.error(f"❌ Performance monitoring error: {e}")
+            return 60  # Wait 1 minute before retry
+    
+    async def _do_alerts(self, now: datetime) -> float:
+        """Active alert report; returns seconds until the next one"""
+        
+        try:
+            # Check for unresolved critical alerts
+            critical_alerts = self.alert_system.get_active_alerts(AlertSeverity.CRITICAL)
+            
+            if critical_alerts:
+                logger.warning(
+                    f"🚨 CRITICAL ALERTS ACTIVE: {len(critical_alerts)}\n" +
+                    "\n".join(f"   - {alert.title} ({alert.component})" for alert in critical_alerts)
+                )
+            
+            # Check alert summary
+            alert_summary = self.alert_system.get_alert_summary()
+            
+            if alert_summary['active_alerts'] > 0:
+                logger.info(
+                    f"📢 Active Alerts: {alert_summary['active_alerts']}\n"
+                    f"   Critical: {alert_summary['by_severity']['critical']}\n"
+                    f"   High: {alert_summary['by_severity']['high']}\n"
+                    f"   Medium: {alert_summary['by_severity']['medium']}\n"
+                    f"   Low: {alert_summary['by_severity']['low']}"
+                )
+            
+            return self.alert_interval
+            
+        except Exception as e:
+            logger.error(f"❌ Alert monitoring error: {e}")
+            return 60  # Wait 1 minute before retry
     
     async def _check_performance_alerts(self, performance_report: Dict):
         """Check for performance-related alerts"""
@@ -193,35 +226,38 @@ class ContinuousMonitor:
                 self.alert_system.check_rebalance_alerts(success_rate, int(failure_count))
                 
         except Exception as e:
-            print(f"⚠️ Performance alert check error: {e}")
+            logger.warning(f"⚠️ Performance alert check error: {e}")
     
     def _print_performance_summary(self, performance_report: Dict):
         """Print performance summary"""
         
-        print("📈 Performance Summary:")
+        lines = ["📊 Performance Check:"]
         
         # Yield performance
         yield_data = performance_report.get('yield_performance', {})
         if 'error' not in yield_data:
-            print(f"   Yield: {yield_data.get('average_yield', 0):.2f}% "
-                  f"(Latest: {yield_data.get('latest_yield', 0):.2f}%)")
+            lines.append(f"   Yield: {yield_data.get('average_yield', 0):.2f}% "
+                         f"(Latest: {yield_data.get('latest_yield', 0):.2f}%)")
         
         # Gas cost analysis
         gas_data = performance_report.get('gas_cost_analysis', {})
         if 'error' not in gas_data:
-            print(f"   Gas Costs: ${gas_data.get('average_cost', 0):.2f} "
-                  f"(Total: ${gas_data.get('total_cost', 0):.2f})")
+            lines.append(f"   Gas Costs: ${gas_data.get('average_cost', 0):.2f} "
+                         f"(Total: ${gas_data.get('total_cost', 0):.2f})")
         
         # Rebalancing performance
         rebalance_data = performance_report.get('rebalance_performance', {})
         if 'error' not in rebalance_data:
-            print(f"   Rebalances: {rebalance_data.get('total_rebalances', 0)} "
-                  f"(Success: {rebalance_data.get('average_success_rate', 0):.1%})")
+            lines.append(f"   Rebalances: {rebalance_data.get('total_rebalances', 0)} "
+                         f"(Success: {rebalance_data.get('average_success_rate', 0):.1%})")
         
         # Execution performance
         execution_data = performance_report.get('execution_performance', {})
         if 'error' not in execution_data:
-            print(f"   Execution Time: {execution_data.get('average_execution_time', 0):.2f}s")
+            lines.append(f"   Execution Time: {execution_data.get('average_execution_time', 0):.2f}s")
+        
+        # One record for the whole summary
+        logger.info("\n".join(lines))
     
     async def get_system_status(self) -> Dict:
         """Get comprehensive system status"""
@@ -239,14 +275,17 @@ class ContinuousMonitor:
     async def stop_monitoring(self):
         """Stop the monitoring system"""
         
-        print("\n🛑 Stopping monitoring system...")
+        logger.info("🛑 Stopping monitoring system...")
         self.monitoring_active = False
+        self._stop_event.set()
         
         # Export final performance data
         export_result = self.performance_tracker.export_performance_data()
-        print(f"📊 Performance data exported: {export_result}")
+        logger.info(f"📊 Performance data exported: {export_result}")
         
-        print("✅ Monitoring system stopped")
+        await self.alert_system.close()
+        await self.health_monitor.close()
+        logger.info("✅ Monitoring system stopped")
 
 # Main monitoring function
 async def start_24_7_monitoring():
@@ -275,6 +314,7 @@ async def quick_status_check():
     # Health check
     print("Checking system health...")
     components = await health_monitor.check_all_components()
+    await health_monitor.close()
     health_report = health_monitor.generate_health_report(components)
     
     print(f"Overall Health: {health_report['overall_health'].upper()}")
@@ -40,6 +40,25 @@ class SystemHealthMonitor:
         self.cctp = CCTPIntegration()
         self.rebalancer = USDAIRebalancer()
         
+        # API check session, opened on first check and kept across cycles so
+        # checks reuse keep-alive connections and cached DNS
+        self._http_session: Optional[aiohttp.ClientSession] = None
+    
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Get shared aiohttp session, creating it on first use"""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, limit_per_host=8, keepalive_timeout=120, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._http_session
+    
+    async def close(self):
+        """Close the shared API check session and the CCTP client"""
+        if self._http_session and not self._http_session.closed:
+            await self._http_session.close()
+        await self.cctp.close()
+        
     async def check_all_components(self) -> Dict[str, HealthStatus]:
         """Check health of all system components"""
         
@@ -80,21 +99,38 @@ class SystemHealthMonitor:
         """Check health of external API services"""
         
         print("📡 Checking External APIs...")
-        components = {}
-        
-        # Check DeFiLlama API
-        components["defillama"] = await self.check_defillama_api()
         
-        # Check Circle CCTP API
-        components["cctp_api"] = await self.check_cctp_api()
-        
-        # Check 1inch API
-        components["oneinch"] = await self.check_oneinch_api()
-        
-        # Check Pyth Oracle
-        components["pyth"] = await self.check_pyth_api()
+        # DeFiLlama, Circle CCTP, 1inch and Pyth are independent, so probe them concurrently
+        names = ["defillama", "cctp_api", "oneinch", "pyth"]
+        results = await asyncio.gather(
+            self.check_defillama_api(),
+            self.check_cctp_api(),
+            self.check_oneinch_api(),
+            self.check_pyth_api(),
+            return_exceptions=True
+        )
+        
+        return {
+            name: self._as_health_status(name, result)
+            for name, result in zip(names, results)
+        }
+    
+    @staticmethod
+    def _as_health_status(component: str, result) -> HealthStatus:
+        """Pass a gathered HealthStatus through, reporting a raised exception as unhealthy"""
         
-        return components
+        if isinstance(result, Exception):
+            return HealthStatus(
+                component=component,
+                status="unhealthy",
+                response_time=0.0,
+                last_check=datetime.now(),
+                error_message=str(result) or type(result).__name__
+            )
+        if isinstance(result, BaseException):
+            # Cancellation (and interpreter exits) must propagate, not read as a failed probe
+            raise result
+        return result
     
     async def check_defillama_api(self) -> HealthStatus:
         """Check DeFiLlama API health"""
@@ -102,31 +138,27 @@ class SystemHealthMonitor:
         start_time = time.time()
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    "https://api.llama.fi/protocols",
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    response_time = time.time() - start_time
+            async with self._get_http_session().get("https://api.llama.fi/protocols") as response:
+                response_time = time.time() - start_time
+                
+                if response.status == 200:
+                    data = await response.json()
+                    return HealthStatus(
+                        component="defillama",
+                        status="healthy",
+                        response_time=response_time,
+                        last_check=datetime.now(),
+                        metrics={"protocols_count": len(data)}
+                    )
+                else:
+                    return HealthStatus(
+                        component="defillama",
+                        status="unhealthy",
+                        response_time=response_time,
+                        last_check=datetime.now(),
+                        error_message=f"HTTP {response.status}"
+                    )
                     
-                    if response.status == 200:
-                        data = await response.json()
-                        return HealthStatus(
-                            component="defillama",
-                            status="healthy",
-                            response_time=response_time,
-                            last_check=datetime.now(),
-                            metrics={"protocols_count": len(data)}
-                        )
-                    else:
-                        return HealthStatus(
-                            component="defillama",
-                            status="unhealthy",
-                            response_time=response_time,
-                            last_check=datetime.now(),
-                            error_message=f"HTTP {response.status}"
-                        )
-                        
         except Exception as e:
             response_time = time.time() - start_time
             return HealthStatus(
@@ -147,29 +179,25 @@ class SystemHealthMonitor:
             test_tx = "d16204d78d7ee8d71e160f4e19f52b28932df4bbcb1391be2625810eb46ac2e3"
             url = f"https://iris-api-sandbox.circle.com/v2/messages/6?transactionHash=0x{test_tx}"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    response_time = time.time() - start_time
+            async with self._get_http_session().get(url) as response:
+                response_time = time.time() - start_time
+                
+                if response.status in [200, 404]:  # 404 is OK for test tx
+                    return HealthStatus(
+                        component="cctp_api",
+                        status="healthy",
+                        response_time=response_time,
+                        last_check=datetime.now()
+                    )
+                else:
+                    return HealthStatus(
+                        component="cctp_api",
+                        status="unhealthy",
+                        response_time=response_time,
+                        last_check=datetime.now(),
+                        error_message=f"HTTP {response.status}"
+                    )
                     
-                    if response.status in [200, 404]:  # 404 is OK for test tx
-                        return HealthStatus(
-                            component="cctp_api",
-                            status="healthy",
-                            response_time=response_time,
-                            last_check=datetime.now()
-                        )
-                    else:
-                        return HealthStatus(
-                            component="cctp_api",
-                            status="unhealthy",
-                            response_time=response_time,
-                            last_check=datetime.now(),
-                            error_message=f"HTTP {response.status}"
-                        )
-                        
         except Exception as e:
             response_time = time.time() - start_time
             return HealthStatus(
@@ -194,30 +222,25 @@ class SystemHealthMonitor:
                 "amount": "1000000"  # 1 USDC
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    response_time = time.time() - start_time
+            async with self._get_http_session().get(url, params=params) as response:
+                response_time = time.time() - start_time
+                
+                if response.status == 200:
+                    return HealthStatus(
+                        component="oneinch",
+                        status="healthy",
+                        response_time=response_time,
+                        last_check=datetime.now()
+                    )
+                else:
+                    return HealthStatus(
+                        component="oneinch",
+                        status="unhealthy",
+                        response_time=response_time,
+                        last_check=datetime.now(),
+                        error_message=f"HTTP {response.status}"
+                    )
                     
-                    if response.status == 200:
-                        return HealthStatus(
-                            component="oneinch",
-                            status="healthy",
-                            response_time=response_time,
-                            last_check=datetime.now()
-                        )
-                    else:
-                        return HealthStatus(
-                            component="oneinch",
-                            status="unhealthy",
-                            response_time=response_time,
-                            last_check=datetime.now(),
-                            error_message=f"HTTP {response.status}"
-                        )
-                        
         except Exception as e:
             response_time = time.time() - start_time
             return HealthStatus(
@@ -238,30 +261,25 @@ class SystemHealthMonitor:
             url = "https://hermes.pyth.network/v2/updates/price/latest"
             params = {"ids[]": "0xff61491a931112ddf1bd8147cd1b641375f79f5825126d665480874634fd0ace"}
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    response_time = time.time() - start_time
+            async with self._get_http_session().get(url, params=params) as response:
+                response_time = time.time() - start_time
+                
+                if response.status == 200:
+                    return HealthStatus(
+                        component="pyth",
+                        status="healthy",
+                        response_time=response_time,
+                        last_check=datetime.now()
+                    )
+                else:
+                    return HealthStatus(
+                        component="pyth",
+                        status="unhealthy",
+                        response_time=response_time,
+                        last_check=datetime.now(),
+                        error_message=f"HTTP {response.status}"
+                    )
                     
-                    if response.status == 200:
-                        return HealthStatus(
-                            component="pyth",
-                            status="healthy",
-                            response_time=response_time,
-                            last_check=datetime.now()
-                        )
-                    else:
-                        return HealthStatus(
-                            component="pyth",
-                            status="unhealthy",
-                            response_time=response_time,
-                            last_check=datetime.now(),
-                            error_message=f"HTTP {response.status}"
-                        )
-                        
         except Exception as e:
             response_time = time.time() - start_time
             return HealthStatus(
@@ -276,14 +294,17 @@ class SystemHealthMonitor:
         """Check blockchain RPC connectivity"""
         
         print("⛓️ Checking Blockchain Connectivity...")
-        components = {}
         
         chains = ["ethereum_sepolia", "base_sepolia", "arbitrum_sepolia"]
-        
-        for chain in chains:
-            components[chain] = await self.check_chain_connectivity(chain)
-        
-        return components
+        results = await asyncio.gather(
+            *(self.check_chain_connectivity(chain) for chain in chains),
+            return_exceptions=True
+        )
+        
+        return {
+            chain: self._as_health_status(f"blockchain_{chain}", result)
+            for chain, result in zip(chains, results)
+        }
     
     async def check_chain_connectivity(self, chain: str) -> HealthStatus:
         """Check connectivity to a specific blockchain"""
@@ -292,11 +313,9 @@ class SystemHealthMonitor:
         
         try:
             config = self.cctp.chain_configs[chain]
-            w3 = Web3(Web3.HTTPProvider(config.rpc_url))
             
-            # Test basic connectivity
-            latest_block = w3.eth.block_number
-            block_info = w3.eth.get_block(latest_block)
+            # Web3 RPC calls block, so run them off the event loop to let chains be probed in parallel
+            metrics = await asyncio.to_thread(self._probe_chain, config.rpc_url)
             
             response_time = time.time() - start_time
             
@@ -305,11 +324,7 @@ class SystemHealthMonitor:
                 status="healthy",
                 response_time=response_time,
                 last_check=datetime.now(),
-                metrics={
-                    "latest_block": latest_block,
-                    "block_timestamp": block_info.timestamp,
-                    "gas_price": w3.eth.gas_price
-                }
+                metrics=metrics
             )
             
         except Exception as e:
@@ -322,6 +337,22 @@ class SystemHealthMonitor:
                 error_message=str(e)
             )
     
+    @staticmethod
+    def _probe_chain(rpc_url: str) -> Dict:
+        """Blocking RPC probe: latest block, its timestamp and the current gas price"""
+        
+        w3 = Web3(Web3.HTTPProvider(rpc_url))
+        
+        # Test basic connectivity
+        latest_block = w3.eth.block_number
+        block_info = w3.eth.get_block(latest_block)
+        
+        return {
+            "latest_block": latest_block,
+            "block_timestamp": block_info.timestamp,
+            "gas_price": w3.eth.gas_price
+        }
+    
     async def check_internal_systems(self) -> Dict[str, HealthStatus]:
         """Check internal system components"""
         
@@ -491,33 +522,36 @@ async def continuous_monitoring():
     print("🚀 Starting 24/7 Health Monitoring")
     print("=" * 50)
     
-    while True:
-        try:
-            # Perform health check
-            components = await monitor.check_all_components()
-            
-            # Generate report
-            report = monitor.generate_health_report(components)
-            
-            # Print status
-            print(f"\n📊 HEALTH REPORT - {report['timestamp']}")
-            print(f"Overall Status: {report['overall_health'].upper()}")
-            print(f"Components: {report['summary']['healthy']} healthy, "
-                  f"{report['summary']['degraded']} degraded, "
-                  f"{report['summary']['unhealthy']} unhealthy")
-            
-            # Check for alerts
-            if report['overall_health'] == 'unhealthy':
-                print("🚨 CRITICAL: System unhealthy - immediate attention required!")
-            elif report['overall_health'] == 'degraded':
-                print("⚠️ WARNING: System degraded - monitoring closely")
-            
-            # Wait for next check
-            await asyncio.sleep(monitor.check_interval)
-            
-        except Exception as e:
-            print(f"❌ Monitoring error: {e}")
-            await asyncio.sleep(30)  # Wait 30 seconds before retry
+    try:
+        while True:
+            try:
+                # Perform health check
+                components = await monitor.check_all_components()
+                
+                # Generate report
+                report = monitor.generate_health_report(components)
+                
+                # Print status
+                print(f"\n📊 HEALTH REPORT - {report['timestamp']}")
+                print(f"Overall Status: {report['overall_health'].upper()}")
+                print(f"Components: {report['summary']['healthy']} healthy, "
+                      f"{report['summary']['degraded']} degraded, "
+                      f"{report['summary']['unhealthy']} unhealthy")
+                
+                # Check for alerts
+                if report['overall_health'] == 'unhealthy':
+                    print("🚨 CRITICAL: System unhealthy - immediate attention required!")
+                elif report['overall_health'] == 'degraded':
+                    print("⚠️ WARNING: System degraded - monitoring closely")
+                
+                # Wait for next check
+                await asyncio.sleep(monitor.check_interval)
+                
+            except Exception as e:
+                print(f"❌ Monitoring error: {e}")
+                await asyncio.sleep(30)  # Wait 30 seconds before retry
+    finally:
+        await monitor.close()
 
 if __name__ == "__main__":
     asyncio.run(continuous_monitoring())
\ No newline at end of file
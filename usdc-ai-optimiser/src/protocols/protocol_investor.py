@@ -139,6 +139,10 @@ class ProtocolInvestor:
             }
         ]
 
+    async def close(self):
+        """Close the CCTP client's attestation session"""
+        await self.cctp.close()
+
     async def invest_in_protocol(
         self,
         protocol: str,
@@ -467,6 +471,7 @@ async def test_protocol_investor():
             print(f"   Transaction: {investment.investment_tx}")
         
         print("\n✅ Protocol investment system working!")
+        await investor.close()
         
     except Exception as e:
         print(f"❌ Test failed: {e}")
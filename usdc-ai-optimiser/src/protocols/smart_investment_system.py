@@ -66,6 +66,10 @@ class SmartInvestmentSystem:
             )
         }
 
+    async def close(self):
+        """Close the CCTP client's attestation session"""
+        await self.cctp.close()
+
     async def find_optimal_investments(self, strategy_name: str, amount: float) -> List[Dict]:
         """Find optimal investment opportunities using aggregators"""
         
@@ -406,6 +410,7 @@ async def test_smart_investment_system():
         print("\n✅ Smart investment system working!")
         print("🚀 Ready to use existing SDKs and aggregators")
         print("💡 No need to manually implement 34+ protocols!")
+        await system.close()
         
     except Exception as e:
         print(f"❌ Test failed: {e}")
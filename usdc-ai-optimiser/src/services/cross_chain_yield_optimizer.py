@@ -69,6 +69,10 @@ class CrossChainYieldOptimizer:
             "avalanche": 0.3
         }
     
+    async def close(self):
+        """Close the CCTP client's attestation session"""
+        await self.cctp.close()
+    
     async def find_cross_chain_opportunities(
         self,
         amount: float,
@@ -438,6 +442,8 @@ async def test_cross_chain_optimizer():
     print(f"   Strategy includes {len(strategy.opportunities)} opportunities")
     print(f"   Expected return: {strategy.expected_annual_return:.2f}%")
     print(f"   Net return: {strategy.net_annual_return:.2f}%")
+    
+    await optimizer.close()
 
 if __name__ == "__main__":
     asyncio.run(test_cross_chain_optimizer())
\ No newline at end of file
@@ -1,44 +1,64 @@
 # src/utils/logger.py
 """Centralized logging configuration for AI system"""
 
+import atexit
+import itertools
 import logging
+import os
+import queue
 import sys
+from collections import defaultdict, deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, DefaultDict, Deque, Dict, List, Optional
 import json
 
+# Shared queue drained by a background listener thread, so callers on the
+# event loop only enqueue records and never block on stdout
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_queue_listener: Optional[QueueListener] = None
+
+# Hot-path info logs (process start/end, data fetches, metrics) keep 1 in
+# AI_LOG_SAMPLE_N calls; 1 logs everything. Errors are never sampled.
+_LOG_SAMPLE_N = max(1, int(os.getenv("AI_LOG_SAMPLE_N", "1")))
+# One counter per log kind, so one helper's call rate never shifts another's sample
+_log_counters: DefaultDict[str, "itertools.count[int]"] = defaultdict(itertools.count)
+# Sampling decisions of started AI processes, oldest first per process name,
+# consumed by the matching log_ai_end so a process logs both lines or neither
+_pending_ai_samples: DefaultDict[str, Deque[bool]] = defaultdict(lambda: deque(maxlen=64))
+
+def _sampled_out(kind: str) -> bool:
+    """Whether this hot-path log call of the given kind is skipped by sampling"""
+    return _LOG_SAMPLE_N > 1 and next(_log_counters[kind]) % _LOG_SAMPLE_N != 0
+
 class AILogger:
     """Centralized logger for AI system with structured logging"""
     
     def __init__(self, name: str = "CrossYieldAI", level: str = "INFO"):
-        self.logger = logging.getLogger(name)
+        # Records go through the shared queue, so request handlers never
+        # block on stdout; the listener thread writes them out
+        self.logger = get_queued_logger(name, level)
         self.logger.setLevel(getattr(logging, level.upper()))
-        
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s | %(name)s | %(levelname)s | %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(formatter)
-        
-        # Remove existing handlers to avoid duplicates
-        self.logger.handlers.clear()
-        self.logger.addHandler(console_handler)
-        
-        # Prevent propagation to root logger
-        self.logger.propagate = False
     
     def log_ai_start(self, process_name: str, context: Dict[str, Any] = None):
         """Log the start of an AI process"""
+        if _LOG_SAMPLE_N > 1:
+            skip = _sampled_out("ai_process")
+            _pending_ai_samples[process_name].append(skip)
+            if skip:
+                return
         self.logger.info(f"🚀 AI PROCESS STARTED: {process_name}")
         if context:
             self.logger.info(f"   Context: {json.dumps(context, indent=2, default=str)}")
     
     def log_ai_end(self, process_name: str, result: Dict[str, Any] = None, duration: float = None):
         """Log the end of an AI process"""
+        if _LOG_SAMPLE_N > 1:
+            pending = _pending_ai_samples.get(process_name)
+            # Follow the start's decision; an end without a recorded start samples on its own
+            skip = pending.popleft() if pending else _sampled_out("ai_end")
+            if skip:
+                return
         self.logger.info(f"🏆 AI PROCESS COMPLETED: {process_name}")
         if duration:
             self.logger.info(f"   Duration: {duration:.2f}s")
@@ -75,6 +95,8 @@ class AILogger:
     
     def log_data_fetch(self, source: str, count: int, duration: float = None):
         """Log data fetching operations"""
+        if _sampled_out("data_fetch"):
+            return
         self.logger.info(f"📊 DATA FETCH: {source}")
         self.logger.info(f"   Records: {count}")
         if duration:
@@ -104,6 +126,8 @@ class AILogger:
     
     def log_performance_metrics(self, metrics: Dict[str, Any]):
         """Log performance metrics"""
+        if _sampled_out("performance_metrics"):
+            return
         self.logger.info(f"📈 PERFORMANCE METRICS:")
         for key, value in metrics.items():
             if isinstance(value, float):
@@ -117,6 +141,27 @@ class AILogger:
         if details:
             self.logger.info(f"   Details: {json.dumps(details, indent=2, default=str)}")
 
+def get_queued_logger(name: str, level: str = "INFO") -> logging.Logger:
+    """Get a logger whose records are written to stdout by a background thread"""
+    global _queue_listener
+
+    if _queue_listener is None:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(logging.Formatter(
+            '%(asctime)s | %(name)s | %(levelname)s | %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        ))
+        _queue_listener = QueueListener(_log_queue, console_handler)
+        _queue_listener.start()
+        atexit.register(_queue_listener.stop)
+
+    logger = logging.getLogger(name)
+    if not any(isinstance(h, QueueHandler) for h in logger.handlers):
+        logger.addHandler(QueueHandler(_log_queue))
+        logger.setLevel(getattr(logging, level.upper()))
+        logger.propagate = False
+    return logger
+
 # Global logger instance
 ai_logger = AILogger()
 
@@ -0,0 +1,12 @@
+"""Shared pytest setup for the USDC AI Optimizer unit tests"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# The rebalancer refuses to start without a signer; tests never send transactions
+os.environ.setdefault("PRIVATE_KEY", "0x" + "11" * 32)
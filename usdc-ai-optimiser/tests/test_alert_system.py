@@ -0,0 +1,66 @@
+"""Tests for AlertSystem webhook batching (no network access)"""
+
+import asyncio
+
+import pytest
+
+from src.monitoring.alert_system import AlertSeverity, AlertSystem
+
+
+@pytest.fixture
+def alerts(monkeypatch):
+    system = AlertSystem()
+    system.discord_webhook = "https://discord.invalid/webhook"
+    system.alert_channels["discord"] = True
+    system.batch_interval = 0.2
+    system.sent = []
+
+    async def send_to_discord(batch):
+        system.sent.append([alert.title for alert in batch])
+
+    monkeypatch.setattr(system, "_send_to_discord", send_to_discord)
+    return system
+
+
+def send(system, title):
+    alert = system.create_alert(AlertSeverity.HIGH, title, "check failed", "rebalancer")
+    return system.send_alert(alert)
+
+
+def test_alerts_within_the_window_go_out_together(alerts):
+    async def run():
+        await send(alerts, "first")
+        await asyncio.sleep(0.05)
+        await send(alerts, "second")
+        await asyncio.sleep(0.3)
+        await alerts.close()
+
+    asyncio.run(run())
+
+    assert alerts.sent == [["first", "second"]]
+
+
+def test_close_during_the_window_sends_the_pending_batch(alerts):
+    async def run():
+        await send(alerts, "first")
+        await asyncio.sleep(0.05)
+        await send(alerts, "second")
+        await alerts.close()
+
+    asyncio.run(run())
+
+    assert alerts.sent == [["first", "second"]]
+
+
+def test_close_while_idle_stops_the_flush_task(alerts):
+    async def run():
+        await send(alerts, "first")
+        await asyncio.sleep(0.3)
+        task = alerts._flush_task
+        await alerts.close()
+        return task
+
+    task = asyncio.run(run())
+
+    assert task.cancelled()
+    assert alerts.sent == [["first"]]
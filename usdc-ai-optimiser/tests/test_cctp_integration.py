@@ -0,0 +1,115 @@
+"""Tests for CCTPIntegration transaction sending (no RPC access)"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import aiohttp
+
+from src.apis.cctp_integration import CCTPIntegration
+
+
+class FakeEth:
+    """Chain whose pending nonce never advances, like a lagging RPC node"""
+
+    def __init__(self, pending_nonce: int):
+        self.pending_nonce = pending_nonce
+        self.sent = []
+
+    def get_transaction_count(self, address, block_identifier):
+        time.sleep(0.01)
+        return self.pending_nonce
+
+    def send_raw_transaction(self, raw_transaction):
+        time.sleep(0.01)
+        self.sent.append(raw_transaction["nonce"])
+        return f"0x{len(self.sent):064x}"
+
+    def wait_for_transaction_receipt(self, tx_hash):
+        return SimpleNamespace(status=1, gasUsed=21000)
+
+
+class FakeCall:
+    def build_transaction(self, params):
+        return dict(params)
+
+
+ACCOUNT = SimpleNamespace(
+    address="0x0000000000000000000000000000000000000001",
+    sign_transaction=lambda tx: SimpleNamespace(raw_transaction=tx)
+)
+
+
+def integration_with(chains):
+    cctp = CCTPIntegration()
+    for chain, eth in chains.items():
+        cctp.web3_instances[chain] = SimpleNamespace(eth=eth)
+    return cctp
+
+
+async def transact_many(cctp, chains):
+    return await asyncio.gather(
+        *(cctp._transact(chain, ACCOUNT, FakeCall(), 100_000, 1) for chain in chains)
+    )
+
+
+def test_concurrent_sends_on_one_chain_get_distinct_nonces():
+    eth = FakeEth(pending_nonce=5)
+    cctp = integration_with({"base_sepolia": eth})
+
+    asyncio.run(transact_many(cctp, ["base_sepolia"] * 4))
+
+    assert sorted(eth.sent) == [5, 6, 7, 8]
+
+
+def test_chains_assign_nonces_independently():
+    base = FakeEth(pending_nonce=5)
+    arbitrum = FakeEth(pending_nonce=2)
+    cctp = integration_with({"base_sepolia": base, "arbitrum_sepolia": arbitrum})
+
+    asyncio.run(transact_many(cctp, ["base_sepolia", "arbitrum_sepolia"] * 2))
+
+    assert sorted(base.sent) == [5, 6]
+    assert sorted(arbitrum.sent) == [2, 3]
+
+
+def test_chain_nonce_ahead_of_local_counter_wins():
+    eth = FakeEth(pending_nonce=5)
+    cctp = integration_with({"base_sepolia": eth})
+    asyncio.run(transact_many(cctp, ["base_sepolia"]))
+
+    # Another process sent transactions from the same account meanwhile
+    eth.pending_nonce = 9
+    asyncio.run(transact_many(cctp, ["base_sepolia"]))
+
+    assert eth.sent == [5, 9]
+
+
+def test_close_leaves_a_shared_session_open():
+    async def run():
+        async with aiohttp.ClientSession() as shared:
+            cctp = CCTPIntegration(session=shared)
+            assert cctp._get_http_session() is shared
+            await cctp.close()
+            return shared.closed
+
+    assert asyncio.run(run()) is False
+
+
+def test_transfer_monitor_closes_its_session(monkeypatch):
+    import src.main as api
+
+    monkeypatch.setattr(api, "MONITOR_BACKOFF", ())
+
+    async def run():
+        cctp = CCTPIntegration()
+        session = cctp._get_http_session()
+
+        async def complete(transfer, private_key):
+            raise aiohttp.ClientConnectionError("attestation service down")
+
+        monkeypatch.setattr(cctp, "complete_cross_chain_transfer", complete)
+        await api.monitor_smart_wallet_transfer(cctp, SimpleNamespace(burn_tx_hash="0xabc"), "0x")
+        return session.closed
+
+    assert asyncio.run(run()) is True
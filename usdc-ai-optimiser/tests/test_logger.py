@@ -0,0 +1,91 @@
+"""Tests for hot-path log sampling in the AI logger"""
+
+import itertools
+import logging
+from collections import defaultdict, deque
+
+import pytest
+
+from src.utils import logger as ai_logging
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def sampled_logger(monkeypatch):
+    """AILogger sampling 1 in 2 calls, writing to an in-memory handler"""
+    monkeypatch.setattr(ai_logging, "_LOG_SAMPLE_N", 2)
+    monkeypatch.setattr(ai_logging, "_log_counters", defaultdict(itertools.count))
+    monkeypatch.setattr(ai_logging, "_pending_ai_samples", defaultdict(deque))
+
+    handler = ListHandler()
+    test_logger = logging.getLogger("test_ai_sampling")
+    test_logger.handlers = [handler]
+    test_logger.propagate = False
+    test_logger.setLevel(logging.INFO)
+
+    instance = ai_logging.AILogger("test_ai_sampling_base")
+    instance.logger = test_logger
+    return instance, handler.messages
+
+
+def starts(messages):
+    return [m for m in messages if m.startswith("🚀 AI PROCESS STARTED")]
+
+
+def ends(messages):
+    return [m for m in messages if m.startswith("🏆 AI PROCESS COMPLETED")]
+
+
+def test_sequential_pairs_keep_both_start_and_end(sampled_logger):
+    instance, messages = sampled_logger
+
+    for i in range(4):
+        instance.log_ai_start(f"process {i}")
+        instance.log_ai_end(f"process {i}", duration=0.5)
+
+    assert starts(messages) == ["🚀 AI PROCESS STARTED: process 0", "🚀 AI PROCESS STARTED: process 2"]
+    assert ends(messages) == ["🏆 AI PROCESS COMPLETED: process 0", "🏆 AI PROCESS COMPLETED: process 2"]
+
+
+def test_end_follows_its_own_start_when_interleaved(sampled_logger):
+    instance, messages = sampled_logger
+
+    for name in ("a", "b", "c", "d"):
+        instance.log_ai_start(name)
+    for name in ("d", "c", "b", "a"):
+        instance.log_ai_end(name)
+
+    kept = {m.rsplit(": ", 1)[1] for m in starts(messages)}
+    assert kept == {"a", "c"}
+    assert {m.rsplit(": ", 1)[1] for m in ends(messages)} == kept
+
+
+def test_other_helpers_do_not_shift_process_sampling(sampled_logger):
+    instance, messages = sampled_logger
+
+    for i in range(4):
+        instance.log_ai_start("fetch")
+        instance.log_data_fetch("source", i)
+        instance.log_performance_metrics({"i": i})
+        instance.log_ai_end("fetch")
+
+    assert len(starts(messages)) == len(ends(messages)) == 2
+    assert sum(m.startswith("📊 DATA FETCH") for m in messages) == 2
+    assert sum(m.startswith("📈 PERFORMANCE METRICS") for m in messages) == 2
+
+
+def test_errors_are_never_sampled(sampled_logger):
+    instance, messages = sampled_logger
+
+    for _ in range(3):
+        instance.log_ai_error("process", RuntimeError("boom"))
+
+    assert sum(m.startswith("❌ AI PROCESS ERROR") for m in messages) == 3
@@ -0,0 +1,129 @@
+"""Tests for the rebalance planning kernels"""
+
+import numpy as np
+import pytest
+
+from src.execution.planning import plan_transfers_batch_nb, plan_transfers_nb
+
+# Run every kernel compiled and as plain Python
+KERNELS = [plan_transfers_nb, plan_transfers_nb.py_func]
+
+
+def legacy_plan(current, target, min_amount):
+    """Greedy plan used by calculate_rebalance_actions before the kernel
+
+    Each short chain (in index order) takes min(shortfall, donor balance -
+    min_amount) from the first other chain holding more than min_amount.
+    """
+    remaining = list(current)
+    transfers = []
+    for dst, target_amount in enumerate(target):
+        difference = target_amount - remaining[dst]
+        if difference <= min_amount:
+            continue
+        for src in range(len(remaining)):
+            if src != dst and remaining[src] > min_amount:
+                amount = min(difference, remaining[src] - min_amount)
+                transfers.append((src, dst, float(amount)))
+                remaining[src] -= amount
+                remaining[dst] += amount
+                break
+    return transfers
+
+
+def as_plan(src_idx, dst_idx, amount):
+    return list(zip(src_idx.tolist(), dst_idx.tolist(), amount.tolist()))
+
+
+def random_surplus(rng, n_chains):
+    """Zero-sum per-chain surplus, as produced by current - target"""
+    current = rng.uniform(0, 1_000, n_chains)
+    weights = rng.dirichlet(np.ones(n_chains))
+    return current - weights * current.sum()
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+def test_single_donor_matches_legacy_plan(kernel):
+    # All funds on chain 0, 40/35/25 target split of 100 USDC
+    current = np.array([100.0, 0.0, 0.0])
+    target = np.array([40.0, 35.0, 25.0])
+
+    plan = as_plan(*kernel(current - target, 10.0))
+
+    assert plan == [(0, 1, 35.0), (0, 2, 25.0)]
+    assert plan == legacy_plan(current, target, 10.0)
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+def test_pins_largest_donor_to_largest_receiver_sweep(kernel):
+    surplus = np.array([30.0, 20.0, -35.0, -15.0])
+
+    assert as_plan(*kernel(surplus, 1.0)) == [(0, 2, 30.0), (1, 2, 5.0), (1, 3, 15.0)]
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+def test_transfers_below_min_amount_are_dropped(kernel):
+    surplus = np.array([12.0, 5.0, -17.0])
+
+    assert as_plan(*kernel(surplus, 10.0)) == [(0, 2, 12.0)]
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+def test_settled_portfolio_plans_nothing(kernel):
+    src_idx, dst_idx, amount = kernel(np.zeros(3), 10.0)
+
+    assert src_idx.size == dst_idx.size == amount.size == 0
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+@pytest.mark.parametrize("seed", range(20))
+def test_plan_conserves_totals(kernel, seed):
+    rng = np.random.default_rng(seed)
+    surplus = random_surplus(rng, int(rng.integers(2, 8)))
+
+    src_idx, dst_idx, amount = kernel(surplus, 0.0)
+
+    # Applying the plan moves every chain exactly onto its target
+    net_out = np.zeros_like(surplus)
+    np.add.at(net_out, src_idx, amount)
+    np.subtract.at(net_out, dst_idx, amount)
+    np.testing.assert_allclose(net_out, surplus, atol=1e-9)
+
+    # Funds only leave donors and only reach receivers, at most n - 1 transfers
+    assert np.all(surplus[src_idx] > 0)
+    assert np.all(surplus[dst_idx] < 0)
+    assert amount.size <= surplus.size - 1
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+@pytest.mark.parametrize("seed", range(20))
+def test_min_amount_cutoff_only_drops_small_transfers(kernel, seed):
+    rng = np.random.default_rng(seed)
+    surplus = random_surplus(rng, 6)
+    min_amount = 50.0
+
+    full = as_plan(*kernel(surplus, 0.0))
+    cut = as_plan(*kernel(surplus, min_amount))
+
+    assert cut == [t for t in full if t[2] >= min_amount]
+    # Totals never exceed what the donors hold or the receivers need
+    moved = sum(t[2] for t in cut)
+    assert moved <= surplus[surplus > 0].sum() + 1e-9
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_batch_rows_match_single_portfolio_plans(seed):
+    rng = np.random.default_rng(seed)
+    n_users, n_chains = 50, 4
+    surplus = np.stack([random_surplus(rng, n_chains) for _ in range(n_users)])
+
+    src_idx, dst_idx, amount = plan_transfers_batch_nb(surplus, 25.0)
+
+    assert src_idx.shape == dst_idx.shape == amount.shape == (n_users, n_chains)
+    for u in range(n_users):
+        expected = as_plan(*plan_transfers_nb(surplus[u], 25.0))
+        used = src_idx[u] >= 0
+        assert as_plan(src_idx[u][used], dst_idx[u][used], amount[u][used]) == expected
+        # Padding follows the planned transfers
+        assert np.all(src_idx[u][len(expected):] == -1)
+        assert np.all(amount[u][len(expected):] == 0.0)
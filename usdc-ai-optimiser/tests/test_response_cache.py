@@ -0,0 +1,109 @@
+"""Tests for the API response cache (no Redis server needed)"""
+
+import asyncio
+
+import aiohttp
+import pytest
+
+import src.main as api
+
+
+class UnreachableRedis:
+    async def get(self, key):
+        raise ConnectionRefusedError("redis down")
+
+    async def setex(self, key, ttl, body):
+        raise ConnectionRefusedError("redis down")
+
+
+class DictRedis:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, body):
+        self.store[key] = body
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch):
+    monkeypatch.setattr(api, "_response_cache", {})
+    monkeypatch.setattr(api.app.state, "redis", None, raising=False)
+
+
+def counting_producer(payload):
+    calls = []
+
+    async def produce():
+        calls.append(1)
+        return payload
+
+    return produce, calls
+
+
+def test_hit_is_served_until_ttl_expires(monkeypatch):
+    produce, calls = counting_producer({"value": 1})
+    clock = [100.0]
+    monkeypatch.setattr(api.time, "monotonic", lambda: clock[0])
+
+    first = asyncio.run(api.cached_response("strategies", 30, produce))
+    clock[0] += 29
+    second = asyncio.run(api.cached_response("strategies", 30, produce))
+    clock[0] += 2
+    asyncio.run(api.cached_response("strategies", 30, produce))
+
+    assert first == second == api.dump_json({"value": 1})
+    assert len(calls) == 2
+
+
+def test_expired_entries_are_pruned_on_write(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(api.time, "monotonic", lambda: clock[0])
+
+    asyncio.run(api.cached_response("ai-validation", 60, counting_producer({})[0]))
+    clock[0] += 61
+    asyncio.run(api.cached_response("strategies", 30, counting_producer({})[0]))
+
+    assert list(api._response_cache) == ["strategies"]
+
+
+def test_unreachable_redis_falls_back_to_process_cache(monkeypatch):
+    if not api.REDIS_AVAILABLE:
+        # Only bound when the redis package is installed
+        monkeypatch.setattr(api, "RedisError", type("RedisError", (Exception,), {}), raising=False)
+    monkeypatch.setattr(api.app.state, "redis", UnreachableRedis())
+    produce, calls = counting_producer({"value": 2})
+
+    asyncio.run(api.cached_response("strategies", 30, produce))
+    asyncio.run(api.cached_response("strategies", 30, produce))
+
+    assert len(calls) == 1
+    assert "strategies" in api._response_cache
+
+
+def test_redis_stores_serialized_body(monkeypatch):
+    redis = DictRedis()
+    monkeypatch.setattr(api.app.state, "redis", redis)
+    produce, calls = counting_producer({"value": 3})
+
+    asyncio.run(api.cached_response("strategies", 30, produce))
+    body = asyncio.run(api.cached_response("strategies", 30, produce))
+
+    assert body == redis.store["strategies"] == api.dump_json({"value": 3})
+    assert len(calls) == 1
+
+
+def test_producer_connection_error_is_not_retried(monkeypatch):
+    monkeypatch.setattr(api.app.state, "redis", DictRedis())
+    calls = []
+
+    async def failing_producer():
+        calls.append(1)
+        raise aiohttp.ClientOSError("upstream down")
+
+    with pytest.raises(aiohttp.ClientOSError):
+        asyncio.run(api.cached_response("strategies", 30, failing_producer))
+
+    assert len(calls) == 1